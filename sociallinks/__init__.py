@@ -1,4 +1,6 @@
 from .core import SocialLinks
+from .detector import Detector
+from .results import ExtractedLink, HtmlLink, ParseResult
 from .exceptions import (
     SocialLinksError,
     PlatformError,
@@ -13,6 +15,10 @@ from .exceptions import (
 
 __all__ = [
     "SocialLinks",
+    "Detector",
+    "ParseResult",
+    "ExtractedLink",
+    "HtmlLink",
     "SocialLinksError",
     "PlatformError",
     "PlatformNotFoundError",
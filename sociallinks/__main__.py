@@ -0,0 +1,5 @@
+import sys
+
+from sociallinks.cli import main
+
+sys.exit(main())
@@ -0,0 +1,322 @@
+"""asyncio facade over `SocialLinks` batch methods.
+
+Matching a single URL takes a few microseconds and is fine to do inline in a
+coroutine, but a batch of thousands blocks the event loop for milliseconds.
+`AsyncSocialLinks` offloads batches to an executor in chunks while keeping
+small inputs inline, where an executor round-trip would cost more than the
+work itself.
+"""
+import asyncio
+import functools
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Deque,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from sociallinks.core import SocialLinks
+from sociallinks.parallel import CHUNK_SIZE, init_worker, run_chunk
+from sociallinks.results import ParseResult
+
+INLINE_THRESHOLD = 256
+"""Batches of at most this many URLs are processed inline, in the event loop
+thread. Processing them takes less time than an executor round-trip."""
+
+AnyIterable = Union[Iterable[Any], AsyncIterable[Any]]
+
+
+async def _achunks(urls: AnyIterable, size: int) -> AsyncIterator[List[Any]]:
+    """Split a sync or async iterable into lists of at most `size` items."""
+    chunk: List[Any] = []
+    if isinstance(urls, AsyncIterable):
+        async for url in urls:
+            chunk.append(url)
+            if len(chunk) >= size:
+                yield chunk
+                chunk = []
+    else:
+        for url in urls:
+            chunk.append(url)
+            if len(chunk) >= size:
+                yield chunk
+                chunk = []
+    if chunk:
+        yield chunk
+
+
+class AsyncSocialLinks:
+    """Async counterpart of the `SocialLinks` batch API.
+
+    Batches larger than `inline_threshold` are split into chunks of
+    `chunk_size` URLs, processed in an executor. By default that is the event
+    loop's default thread pool, which keeps the loop responsive; with
+    ``processes=N`` chunks run in a dedicated process pool instead, which
+    also spreads the work over several cores. Process workers receive a
+    registry snapshot once, when the pool starts, and the pool is
+    restarted if the registry has changed since.
+
+    Attributes:
+        sl: The wrapped `SocialLinks` instance.
+        chunk_size: Number of URLs sent to the executor at once.
+        inline_threshold: Largest batch or chunk processed inline.
+        concurrency: Maximum number of chunks in flight at once.
+
+    Examples:
+        >>> async def main():
+        ...     async with AsyncSocialLinks() as asl:
+        ...         return await asl.adetect_many(["https://github.com/username"])
+        >>> asyncio.run(main())
+        ['github']
+    """
+
+    def __init__(
+        self,
+        sl: Optional[SocialLinks] = None,
+        *,
+        executor: Optional[Executor] = None,
+        processes: Optional[int] = None,
+        chunk_size: int = CHUNK_SIZE,
+        inline_threshold: int = INLINE_THRESHOLD,
+        concurrency: Optional[int] = None,
+    ):
+        """Initialize the facade.
+
+        Args:
+            sl: Instance to wrap. Defaults to a new `SocialLinks()`.
+            executor: Thread pool executor to offload chunks to. Defaults to
+                the event loop's default executor. Cannot be combined with
+                `processes`.
+            processes: If given, run chunks in a process pool of this size,
+                owned by the facade and shut down by `close()`.
+            chunk_size: Number of URLs sent to the executor at once.
+            inline_threshold: Batches and chunks of at most this many URLs
+                are processed inline. Use 0 to always offload.
+            concurrency: Maximum number of chunks in flight at once. Defaults
+                to twice the number of processes, or 2 with threads.
+
+        Raises:
+            ValueError: If both `executor` and `processes` are given, or if a
+                size is out of range.
+        """
+        if executor is not None and processes is not None:
+            raise ValueError("executor and processes cannot be combined")
+        if processes is not None and processes <= 0:
+            raise ValueError("processes must be positive")
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be positive")
+        if concurrency is not None and concurrency <= 0:
+            raise ValueError("concurrency must be positive")
+        self.sl = sl if sl is not None else SocialLinks()
+        self.chunk_size = chunk_size
+        self.inline_threshold = inline_threshold
+        self.concurrency = concurrency or 2 * (processes or 1)
+        self._executor = executor
+        self._processes = processes
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._pool_generation = -1
+
+    # ------------------------------------------------------------------
+    # Executor
+    # ------------------------------------------------------------------
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        """Return the process pool, (re)starting it if the registry changed."""
+        generation = self.sl._generation
+        if self._pool is None or self._pool_generation != generation:
+            if self._pool is not None:
+                self._pool.shutdown(wait=False)
+            self._pool = ProcessPoolExecutor(
+                self._processes,
+                initializer=init_worker,
+                initargs=(self.sl.snapshot(),),
+            )
+            self._pool_generation = generation
+        return self._pool
+
+    def _submit(self, method: str, urls: List[Any], args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> "asyncio.Future[Any]":
+        """Run a batch method on `urls`, inline or in the executor."""
+        loop = asyncio.get_running_loop()
+        if len(urls) <= self.inline_threshold:
+            future = loop.create_future()
+            try:
+                future.set_result(getattr(self.sl, method)(*args, urls, **kwargs))
+            except Exception as e:
+                future.set_exception(e)
+            return future
+        if self._processes is not None:
+            return asyncio.wrap_future(self._get_pool().submit(run_chunk, method, urls, args, kwargs))
+        return loop.run_in_executor(self._executor, functools.partial(getattr(self.sl, method), *args, urls, **kwargs))
+
+    async def _amap(self, method: str, urls: AnyIterable, args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> AsyncIterator[List[Any]]:
+        """Yield the results of a batch method, chunk by chunk, in order.
+
+        At most `concurrency` chunks are in flight: the source is not read
+        further until the oldest chunk is done, so a slow consumer or a slow
+        executor applies backpressure to the producer.
+        """
+        pending: Deque[Awaitable[List[Any]]] = deque()
+        try:
+            async for chunk in _achunks(urls, self.chunk_size):
+                pending.append(self._submit(method, chunk, args, kwargs))
+                if len(pending) >= self.concurrency:
+                    yield await pending.popleft()
+            while pending:
+                yield await pending.popleft()
+        finally:
+            for future in pending:
+                future.cancel()  # type: ignore[attr-defined]
+
+    async def _run(self, method: str, urls: AnyIterable, args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> List[Any]:
+        """Run a batch method over a whole input and return the results."""
+        if isinstance(urls, (list, tuple)) and len(urls) <= self.inline_threshold:
+            return getattr(self.sl, method)(*args, urls, **kwargs)
+        results: List[Any] = []
+        async for chunk in self._amap(method, urls, args, kwargs):
+            results.extend(chunk)
+        return results
+
+    def close(self) -> None:
+        """Shut down the process pool, if any. The facade stays usable."""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    async def __aenter__(self) -> "AsyncSocialLinks":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        mode = f"processes={self._processes}" if self._processes is not None else "threads"
+        return f"AsyncSocialLinks({mode}, chunk_size={self.chunk_size}, concurrency={self.concurrency})"
+
+    # ------------------------------------------------------------------
+    # Batch API
+    # ------------------------------------------------------------------
+
+    def _url_only(self, url_only: Optional[bool]) -> bool:
+        """Resolve `url_only` here: process workers have their own default."""
+        return self.sl._url_only(url_only)
+
+    async def adetect_many(self, urls: AnyIterable, *, url_only: Optional[bool] = None) -> List[Optional[str]]:
+        """Detect the platform of many URLs without blocking the event loop.
+
+        Async counterpart of `SocialLinks.detect_many()`.
+
+        Args:
+            urls: Iterable or async iterable of URLs or usernames.
+            url_only: If True, skip bare-username patterns.
+
+        Returns:
+            The detected platform name (or None) for each URL, in input order.
+
+        Raises:
+            TypeError: If any URL is not a string.
+        """
+        return await self._run("detect_many", urls, (), {"url_only": self._url_only(url_only)})
+
+    async def asanitize_many(
+        self, platform_name: str, urls: AnyIterable
+    ) -> List[Tuple[Optional[str], Optional[str]]]:
+        """Sanitize many URLs for a platform without blocking the event loop.
+
+        Async counterpart of `SocialLinks.sanitize_many()`.
+
+        Args:
+            platform_name: The name of the platform (e.g., "linkedin").
+            urls: Iterable or async iterable of URLs.
+
+        Returns:
+            A ``(sanitized_url, error)`` pair for each URL, in input order.
+
+        Raises:
+            TypeError: If platform_name is not a string.
+            PlatformNotFoundError: If the platform doesn't exist.
+        """
+        self.sl._check_platform(platform_name)
+        return await self._run("sanitize_many", urls, (platform_name,), {})
+
+    async def aparse_many(
+        self, urls: AnyIterable, platform_name: Optional[str] = None, *, url_only: Optional[bool] = None
+    ) -> List[ParseResult]:
+        """Parse many URLs without blocking the event loop.
+
+        Async counterpart of `SocialLinks.parse_many()`.
+
+        Args:
+            urls: Iterable or async iterable of URLs or usernames.
+            platform_name: Optional platform to match every URL against.
+            url_only: If True, skip bare-username patterns during detection.
+
+        Returns:
+            A `ParseResult` for each URL, in input order.
+
+        Raises:
+            TypeError: If platform_name is given and is not a string.
+            PlatformNotFoundError: If platform_name is given and doesn't exist.
+        """
+        if platform_name is not None:
+            self.sl._check_platform(platform_name)
+        kwargs = {"platform_name": platform_name, "url_only": self._url_only(url_only)}
+        return await self._run("parse_many", urls, (), kwargs)
+
+    async def aiter_detect(self, urls: AnyIterable, *, url_only: Optional[bool] = None) -> AsyncIterator[Optional[str]]:
+        """Stream platform detection over a sync or async iterable of URLs.
+
+        Results are yielded in input order as chunks complete, with bounded
+        concurrency: the source is consumed at most `concurrency` chunks
+        ahead of the consumer.
+
+        Args:
+            urls: Iterable or async iterable of URLs or usernames.
+            url_only: If True, skip bare-username patterns.
+
+        Yields:
+            The detected platform name (or None) for each URL.
+
+        Examples:
+            >>> async def main(urls):
+            ...     return [p async for p in AsyncSocialLinks().aiter_detect(urls)]
+            >>> asyncio.run(main(["https://x.com/username", "https://example.com"]))
+            ['x', None]
+        """
+        async for chunk in self._amap("detect_many", urls, (), {"url_only": self._url_only(url_only)}):
+            for platform in chunk:
+                yield platform
+
+    async def aiter_parse(
+        self, urls: AnyIterable, platform_name: Optional[str] = None, *, url_only: Optional[bool] = None
+    ) -> AsyncIterator[ParseResult]:
+        """Stream parsing over a sync or async iterable of URLs.
+
+        Like `aiter_detect()`, with `ParseResult` items as `aparse_many()`.
+
+        Args:
+            urls: Iterable or async iterable of URLs or usernames.
+            platform_name: Optional platform to match every URL against.
+            url_only: If True, skip bare-username patterns during detection.
+
+        Yields:
+            A `ParseResult` for each URL, in input order.
+
+        Raises:
+            TypeError: If platform_name is given and is not a string.
+            PlatformNotFoundError: If platform_name is given and doesn't exist.
+        """
+        if platform_name is not None:
+            self.sl._check_platform(platform_name)
+        kwargs = {"platform_name": platform_name, "url_only": self._url_only(url_only)}
+        async for chunk in self._amap("parse_many", urls, (), kwargs):
+            for result in chunk:
+                yield result
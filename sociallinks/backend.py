@@ -0,0 +1,234 @@
+"""Matcher backends.
+
+A backend decides how `SocialLinks` runs the compiled patterns of its
+registry. It provides two structures:
+
+- an index over all platforms, built by `MatcherBackend.build_index` from
+  ``(name, compiled platform)`` pairs in registry order, used by detection,
+  `parse()` and link extraction;
+- a matcher for a single platform, built by
+  `MatcherBackend.platform_matcher`, used by `is_valid()`, `sanitize()` and
+  batches with a fixed platform.
+
+Both must return the first pattern that matches, in registry order, with
+the identifier it captures (see `sociallinks.matcher.extract_id`). Two
+backends are provided:
+
+- `INDEXED`, the default: the host index of `sociallinks.index` for
+  detection, shared between identical registries, and the combined regexes
+  of `sociallinks.matcher` for single platforms.
+- `REFERENCE`: every pattern is tried with ``pattern.search`` in registry
+  order, as `SocialLinks` originally did. Much slower; it defines the
+  expected results of every other backend and is used to test them.
+"""
+import re
+from functools import lru_cache, partial
+from typing import TYPE_CHECKING, Callable, Iterable, List, Optional, Protocol, Sequence, Tuple
+from weakref import WeakKeyDictionary
+
+from sociallinks.index import BARE, AdaptiveIndex, HostIndex, IndexEntry, PatternKind
+from sociallinks.matcher import PlatformMatcher, extract_id
+
+if TYPE_CHECKING:
+    from sociallinks.instrument import Instrumentation
+    from sociallinks.registry import CompiledPlatform
+
+Platforms = Tuple[Tuple[str, "CompiledPlatform"], ...]
+"""``(name, compiled platform)`` pairs in registry order."""
+
+IndexInput = Iterable[Tuple[str, Sequence[Tuple["re.Pattern[str]", PatternKind]]]]
+"""``(name, [(pattern, kind), ...])`` pairs in registry order."""
+
+
+def index_input(platforms: Platforms) -> List[Tuple[str, List[Tuple["re.Pattern[str]", PatternKind]]]]:
+    """Return the patterns of each platform with their classification."""
+    return [(name, list(zip(compiled.patterns(), compiled.kinds))) for name, compiled in platforms]
+
+
+@lru_cache(maxsize=64)
+def shared_index(platforms: Platforms) -> HostIndex:
+    """Build the host index for a registry, sharing it between identical registries.
+
+    Args:
+        platforms: ``(name, compiled platform)`` pairs in registry order.
+
+    Returns:
+        The `HostIndex` for these platforms.
+    """
+    return HostIndex(index_input(platforms))
+
+
+class Index(Protocol):
+    """Detection structure returned by `MatcherBackend.build_index`."""
+
+    @property
+    def prefilter(self) -> Optional["re.Pattern[str]"]:
+        """Regex that candidate URLs of link extraction must match, or None."""
+
+    def detect(self, url: str, url_only: bool = False) -> Optional[str]:
+        """Return the platform of the first pattern matching `url`, or None."""
+
+    def match(self, url: str, url_only: bool = False) -> Optional[Tuple[str, int, "re.Match[str]"]]:
+        """Return ``(platform, position, match)`` of the first pattern matching `url`."""
+
+
+class PlatformMatch(Protocol):
+    """Single-platform structure returned by `MatcherBackend.platform_matcher`."""
+
+    def match(self, url: str) -> Optional[Tuple[int, Optional[str]]]:
+        """Return ``(position, identifier)`` of the first pattern matching `url`."""
+
+    def is_valid(self, url: str) -> bool:
+        """Return True if any pattern matches `url`."""
+
+
+class MatcherBackend(Protocol):
+    """Interface of matcher backends."""
+
+    name: str
+
+    def build_index(
+        self, platforms: Platforms, *, adaptive: bool = False, instrumentation: Optional["Instrumentation"] = None
+    ) -> Index:
+        """Build the detection index of a registry.
+
+        Args:
+            platforms: ``(name, compiled platform)`` pairs in registry order
+                (see `index_input`). With `url_only`, patterns of kind
+                ``BARE`` must be skipped.
+            adaptive: Whether the registry asked for adaptive ordering.
+                Backends without it ignore it.
+            instrumentation: If set, the index must be built by
+                `Instrumentation.build_index`, so that its patterns update
+                the counters.
+        """
+
+    def platform_matcher(self, platform: "CompiledPlatform") -> PlatformMatch:
+        """Build the matcher of a single compiled platform."""
+
+
+class LinearIndex:
+    """Index that tries every pattern in registry order.
+
+    Args:
+        platforms: ``(name, [(pattern, kind), ...])`` pairs in registry order.
+    """
+
+    __slots__ = ("_all", "_urls")
+
+    prefilter = None
+
+    def __init__(self, platforms: IndexInput):
+        self._all: List[IndexEntry] = []
+        self._urls: List[IndexEntry] = []
+        order = 0
+        for name, patterns in platforms:
+            for pos, (pattern, (kind, _)) in enumerate(patterns):
+                entry = (order, name, pos, pattern)
+                order += 1
+                self._all.append(entry)
+                if kind != BARE:
+                    self._urls.append(entry)
+
+    def detect(self, url: str, url_only: bool = False) -> Optional[str]:
+        for _, name, _, pattern in self._urls if url_only else self._all:
+            if pattern.search(url):
+                return name
+        return None
+
+    def match(self, url: str, url_only: bool = False) -> Optional[Tuple[str, int, "re.Match[str]"]]:
+        for _, name, pos, pattern in self._urls if url_only else self._all:
+            m = pattern.search(url)
+            if m:
+                return name, pos, m
+        return None
+
+
+class LinearMatcher:
+    """Single-platform matcher that tries every pattern in order.
+
+    Args:
+        patterns: Compiled patterns of the platform, in order.
+    """
+
+    __slots__ = ("_patterns",)
+
+    def __init__(self, patterns: Sequence["re.Pattern[str]"]):
+        self._patterns = tuple(patterns)
+
+    def match(self, url: str) -> Optional[Tuple[int, Optional[str]]]:
+        for pos, pattern in enumerate(self._patterns):
+            m = pattern.search(url)
+            if m:
+                return pos, extract_id(m)
+        return None
+
+    def is_valid(self, url: str) -> bool:
+        return any(pattern.search(url) for pattern in self._patterns)
+
+
+class ReferenceBackend:
+    """Backend trying every pattern with ``pattern.search``, in registry order.
+
+    Adaptive ordering is ignored. Platform matchers are cached per compiled
+    platform.
+    """
+
+    name = "reference"
+
+    def __init__(self) -> None:
+        self._matchers: "WeakKeyDictionary[CompiledPlatform, LinearMatcher]" = WeakKeyDictionary()
+
+    def build_index(
+        self, platforms: Platforms, *, adaptive: bool = False, instrumentation: Optional["Instrumentation"] = None
+    ) -> LinearIndex:
+        if instrumentation is not None:
+            return instrumentation.build_index(platforms, LinearIndex)
+        return LinearIndex(index_input(platforms))
+
+    def platform_matcher(self, platform: "CompiledPlatform") -> LinearMatcher:
+        matcher = self._matchers.get(platform)
+        if matcher is None:
+            matcher = self._matchers.setdefault(platform, LinearMatcher(list(platform.patterns())))
+        return matcher
+
+    def __repr__(self) -> str:
+        return "REFERENCE"
+
+
+class IndexedBackend:
+    """Backend using the host index and combined per-platform regexes.
+
+    Identical registries share their index (see `shared_index`). With
+    adaptive ordering, each registry gets its own
+    `sociallinks.index.AdaptiveIndex`, since hit counts are per registry.
+    """
+
+    name = "indexed"
+
+    def build_index(
+        self, platforms: Platforms, *, adaptive: bool = False, instrumentation: Optional["Instrumentation"] = None
+    ) -> HostIndex:
+        index_class: Callable[..., HostIndex] = HostIndex
+        if adaptive:
+            # Patterns of different configuration entries must keep their order
+            entries = {name: [entry for _, _, entry in compiled.entries] for name, compiled in platforms}
+            index_class = partial(AdaptiveIndex, entries=entries)
+        if instrumentation is not None:
+            return instrumentation.build_index(platforms, index_class)
+        if adaptive:
+            return index_class(index_input(platforms))
+        return shared_index(platforms)
+
+    def platform_matcher(self, platform: "CompiledPlatform") -> PlatformMatcher:
+        return platform.matcher
+
+    def __repr__(self) -> str:
+        return "INDEXED"
+
+
+REFERENCE = ReferenceBackend()
+"""The reference backend."""
+
+INDEXED = IndexedBackend()
+"""The default backend."""
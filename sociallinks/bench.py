@@ -0,0 +1,598 @@
+"""Benchmarks for the sociallinks library.
+
+Run with ``python -m sociallinks.bench``. Only the standard library is used.
+
+The suite generates a deterministic corpus from the predefined platforms
+(positive URLs for every platform, bare usernames, misses and long
+adversarial strings) and times `detect_platform`, `is_valid`, `sanitize`,
+instance construction and package import. Each benchmark reports throughput
+in operations per second and p50/p99 latencies, as text or JSON.
+
+Results can be saved and used as a baseline for later runs, so that a
+pattern edit that slows matching down shows up before release::
+
+    python -m sociallinks.bench --save baseline.json
+    # ... edit patterns ...
+    python -m sociallinks.bench --compare baseline.json
+
+``--memory`` additionally measures the memory retained by many instances,
+with and without the process-wide compiled registry. ``--concurrency``
+measures detection throughput of several reader threads while another
+thread keeps replacing a platform, with lock-free registry snapshots and
+with a reference implementation that guards reads with a lock.
+"""
+import argparse
+import gc
+import json
+import platform
+import random
+import re
+import subprocess
+import sys
+import threading
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+from sociallinks import registry
+from sociallinks.core import SocialLinks
+from sociallinks.exceptions import PlatformIDExtractionError, URLMismatchError
+
+SCHEMA_VERSION = 1
+"""Version of the JSON result format, stored in saved baselines."""
+
+DEFAULT_THRESHOLD = 0.10
+"""Relative p50 slowdown above which `compare` reports a regression."""
+
+# Identifier shapes tried when generating positive URLs. Patterns differ in
+# what they accept (usernames, numeric IDs, phone numbers, channel IDs), so
+# every shape is tried and only those the platform validates are kept.
+_ID_SHAPES = (
+    "johndoe",
+    "john_doe42",
+    "jane.doe",
+    "jane-doe",
+    "@johndoe",
+    "1234567890",
+    "+14155552671",
+    "UC1234567890abcdefABCDEF",
+)
+_MISS_HOSTS = ("example.com", "example.org", "unknown.social", "localhost:8080", "192.168.0.1")
+_NAME_CHARS = "abcdefghijklmnopqrstuvwxyz0123456789_"
+
+
+class Corpus(NamedTuple):
+    """Deterministic benchmark inputs.
+
+    Attributes:
+        positives: ``(platform, url)`` pairs of URLs valid for the platform.
+        usernames: Bare usernames, which match the handle patterns.
+        misses: URLs no platform matches.
+        adversarial: Long strings designed to make patterns backtrack or
+            scan far.
+    """
+
+    positives: List[Tuple[str, str]]
+    usernames: List[str]
+    misses: List[str]
+    adversarial: List[str]
+
+
+class Stats(NamedTuple):
+    """Timing summary of a benchmark.
+
+    Attributes:
+        n: Number of timed operations.
+        ops_per_sec: Throughput.
+        p50_us: Median latency in microseconds.
+        p99_us: 99th percentile latency in microseconds.
+    """
+
+    n: int
+    ops_per_sec: float
+    p50_us: float
+    p99_us: float
+
+
+def _name(rng: random.Random, low: int = 5, high: int = 12) -> str:
+    """Return a random lowercase username."""
+    return "".join(rng.choice(_NAME_CHARS) for _ in range(rng.randint(low, high)))
+
+
+def build_corpus(seed: int = 0, size: int = 200, adversarial_length: int = 2000) -> Corpus:
+    """Generate the benchmark corpus.
+
+    The same seed and arguments always produce the same corpus.
+
+    Args:
+        seed: Random seed.
+        size: Number of usernames, misses and generated positive variants.
+        adversarial_length: Length of the adversarial strings.
+
+    Returns:
+        The generated `Corpus`.
+    """
+    from sociallinks.platforms import PREDEFINED_PLATFORMS
+
+    rng = random.Random(seed)
+    sl = SocialLinks()
+
+    # One URL per platform, configuration entry and accepted ID shape
+    canonical: List[Tuple[str, str]] = []
+    for name, entries in PREDEFINED_PLATFORMS.items():
+        for entry in entries:
+            for shape in _ID_SHAPES:
+                url = entry["sanitized"].format(id=shape)
+                if sl.is_valid(name, url):
+                    canonical.append((name, url))
+                    break
+
+    # Variants a user would paste: other schemes, www, trailing slashes
+    positives = list(canonical)
+    while len(positives) < len(canonical) + size:
+        name, url = rng.choice(canonical)
+        variant = url
+        if rng.random() < 0.5:
+            variant = variant.replace("https://", "http://", 1)
+        if rng.random() < 0.3 and "://www." not in variant:
+            variant = variant.replace("://", "://www.", 1)
+        if rng.random() < 0.5:
+            variant += "/"
+        if rng.random() < 0.2:
+            variant = f"  {variant} "
+        positives.append((name, variant if sl.is_valid(name, variant) else url))
+
+    usernames = [_name(rng) for _ in range(size)]
+    misses = [
+        f"https://{rng.choice(_MISS_HOSTS)}/{_name(rng)}/{_name(rng, 1, 6)}?ref={_name(rng, 3, 6)}"
+        for _ in range(size)
+    ]
+
+    n = adversarial_length
+    adversarial = [
+        "a" * n,
+        "a" * n + "!",
+        "https://" + "a." * (n // 2),
+        "https://linkedin.com/in/" + "a" * n + "!",
+        "https://github.com/" + "a-" * (n // 2) + "/",
+        "http://" * (n // 7),
+        "/" * n,
+        "@" + "a" * n + " ",
+        "https://www.youtube.com/" + "/c" * (n // 2),
+        "x" * (n // 2) + "https://x.com/" + "y" * (n // 2),
+    ]
+    return Corpus(positives, usernames, misses, adversarial)
+
+
+def _percentile(samples: Sequence[float], fraction: float) -> float:
+    """Nearest-rank percentile of sorted samples."""
+    index = min(len(samples) - 1, max(0, int(round(fraction * len(samples))) - 1))
+    return samples[index]
+
+
+def _summarize(samples: List[float]) -> Stats:
+    """Build `Stats` from per-operation durations in seconds."""
+    samples.sort()
+    total = sum(samples)
+    return Stats(
+        n=len(samples),
+        ops_per_sec=len(samples) / total if total else float("inf"),
+        p50_us=_percentile(samples, 0.50) * 1e6,
+        p99_us=_percentile(samples, 0.99) * 1e6,
+    )
+
+
+def _time_calls(func: Callable[..., Any], args: Sequence[Tuple[Any, ...]], rounds: int) -> Stats:
+    """Time `func(*a)` for every `a` in `args`, `rounds` times over.
+
+    Exceptions raised by `func` are part of the measured work and ignored.
+    """
+    timer = time.perf_counter
+    samples: List[float] = []
+    append = samples.append
+    for _ in range(rounds):
+        for a in args:
+            start = timer()
+            try:
+                func(*a)
+            except (URLMismatchError, PlatformIDExtractionError):
+                pass
+            append(timer() - start)
+    return _summarize(samples)
+
+
+def _time_repeated(func: Callable[[], Any], repeat: int) -> Stats:
+    """Time `repeat` calls of a function taking no arguments."""
+    return _time_calls(func, [()] * repeat, 1)
+
+
+def _cold_construction(lazy: bool = False) -> SocialLinks:
+    """Construct an instance with nothing compiled yet."""
+    registry.clear_cache()
+    re.purge()
+    return SocialLinks(lazy=lazy)
+
+
+def bench_import(repeat: int = 5) -> Stats:
+    """Time ``import sociallinks`` in fresh interpreters.
+
+    Args:
+        repeat: Number of interpreters to start.
+
+    Returns:
+        The import time statistics.
+    """
+    code = "import time; t = time.perf_counter(); import sociallinks; print(time.perf_counter() - t)"
+    samples = []
+    for _ in range(repeat):
+        out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+        samples.append(float(out.stdout))
+    return _summarize(samples)
+
+
+BENCHMARKS = (
+    "detect.positive",
+    "detect.username",
+    "detect.miss",
+    "detect.adversarial",
+    "is_valid.positive",
+    "is_valid.miss",
+    "is_valid.adversarial",
+    "sanitize.positive",
+    "sanitize.adversarial",
+    "construct.warm",
+    "construct.cold",
+    "construct.cold_lazy",
+    "import",
+)
+"""Names of the benchmarks run by `run`, in order."""
+
+
+def run(
+    corpus: Corpus,
+    rounds: int = 5,
+    only: Optional[Iterable[str]] = None,
+    progress: Optional[Callable[[str], None]] = None,
+) -> Dict[str, Stats]:
+    """Run the benchmark suite.
+
+    Args:
+        corpus: Inputs, as returned by `build_corpus`.
+        rounds: How many times each corpus is processed.
+        only: Benchmark names or prefixes to run (e.g. ``"detect"``). All
+            benchmarks are run if None.
+        progress: Optional callback invoked with each benchmark name before
+            it runs.
+
+    Returns:
+        A mapping from benchmark name to `Stats`, in `BENCHMARKS` order.
+    """
+    selected = list(only) if only else None
+
+    def wanted(name: str) -> bool:
+        return selected is None or any(name == s or name.startswith(s + ".") for s in selected)
+
+    sl = SocialLinks()
+    platforms = sl.list_platforms()
+    positives = corpus.positives
+    misses = [(platforms[i % len(platforms)], url) for i, url in enumerate(corpus.misses)]
+    adversarial_pairs = [(name, url) for name in ("linkedin", "github", "youtube", "x") for url in corpus.adversarial]
+
+    suites: Dict[str, Callable[[], Stats]] = {
+        "detect.positive": lambda: _time_calls(sl.detect_platform, [(u,) for _, u in positives], rounds),
+        "detect.username": lambda: _time_calls(sl.detect_platform, [(u,) for u in corpus.usernames], rounds),
+        "detect.miss": lambda: _time_calls(sl.detect_platform, [(u,) for u in corpus.misses], rounds),
+        "detect.adversarial": lambda: _time_calls(sl.detect_platform, [(u,) for u in corpus.adversarial], rounds),
+        "is_valid.positive": lambda: _time_calls(sl.is_valid, positives, rounds),
+        "is_valid.miss": lambda: _time_calls(sl.is_valid, misses, rounds),
+        "is_valid.adversarial": lambda: _time_calls(sl.is_valid, adversarial_pairs, rounds),
+        "sanitize.positive": lambda: _time_calls(sl.sanitize, positives, rounds),
+        "sanitize.adversarial": lambda: _time_calls(sl.sanitize, adversarial_pairs, rounds),
+        "construct.warm": lambda: _time_repeated(SocialLinks, 20 * rounds),
+        "construct.cold": lambda: _time_repeated(_cold_construction, 4 * rounds),
+        "construct.cold_lazy": lambda: _time_repeated(lambda: _cold_construction(lazy=True), 4 * rounds),
+        "import": lambda: bench_import(rounds),
+    }
+
+    results: Dict[str, Stats] = {}
+    for name in BENCHMARKS:
+        if not wanted(name):
+            continue
+        if progress is not None:
+            progress(name)
+        gc.collect()
+        results[name] = suites[name]()
+    return results
+
+
+def bench_construction(instances: int = 1000, shared: bool = True) -> Dict[str, float]:
+    """Measure construction time and retained memory for many instances.
+
+    Args:
+        instances: Number of `SocialLinks` instances to build and keep alive.
+        shared: If False, the compiled registry and the `re` module cache are
+            cleared before every construction, so each instance compiles its
+            own patterns.
+
+    Returns:
+        A dictionary with the mean construction time in microseconds
+        (``us_per_instance``) and the memory retained per instance in KiB
+        (``kib_per_instance``).
+    """
+    def build(kept: List[SocialLinks]) -> float:
+        elapsed = 0.0
+        for _ in range(instances):
+            if not shared:
+                registry.clear_cache()
+                re.purge()
+            start = time.perf_counter()
+            kept.append(SocialLinks())
+            elapsed += time.perf_counter() - start
+        return elapsed
+
+    registry.clear_cache()
+    re.purge()
+    SocialLinks()  # warm up imports and, when shared, the registry
+
+    elapsed = build([])
+
+    # Memory is measured in a second pass: tracing slows compilation down.
+    gc.collect()
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    kept: List[SocialLinks] = []
+    build(kept)
+    gc.collect()
+    retained = tracemalloc.get_traced_memory()[0] - baseline
+    tracemalloc.stop()
+
+    return {
+        "us_per_instance": elapsed / instances * 1e6,
+        "kib_per_instance": retained / instances / 1024,
+    }
+
+
+def to_json(results: Dict[str, Stats], corpus: Corpus, seed: int) -> Dict[str, Any]:
+    """Build the JSON document for a benchmark run.
+
+    Args:
+        results: Benchmark results, as returned by `run`.
+        corpus: Corpus the results were measured on.
+        seed: Seed the corpus was generated with.
+
+    Returns:
+        A JSON-serializable dictionary, suitable for `compare`.
+    """
+    from sociallinks.platforms import PREDEFINED_PLATFORMS
+
+    return {
+        "schema": SCHEMA_VERSION,
+        "meta": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "machine": platform.machine(),
+            "seed": seed,
+            "platforms": len(PREDEFINED_PLATFORMS),
+            "corpus": {field: len(getattr(corpus, field)) for field in corpus._fields},
+        },
+        "results": {name: stats._asdict() for name, stats in results.items()},
+    }
+
+
+def compare(
+    current: Dict[str, Any], baseline: Dict[str, Any], threshold: float = DEFAULT_THRESHOLD
+) -> List[Dict[str, Any]]:
+    """Compare a run against a saved baseline.
+
+    Args:
+        current: JSON document of the current run (see `to_json`).
+        baseline: JSON document of the baseline run.
+        threshold: Relative p50 slowdown above which a benchmark counts as a
+            regression, e.g. 0.10 for 10%.
+
+    Returns:
+        One row per benchmark present in both runs, with the baseline and
+        current p50 latencies, the relative change and a ``regression`` flag.
+
+    Raises:
+        ValueError: If the baseline was saved with another result format.
+    """
+    if baseline.get("schema") != SCHEMA_VERSION:
+        raise ValueError(f"Unsupported baseline format: {baseline.get('schema')!r}")
+    rows = []
+    for name, stats in current["results"].items():
+        before = baseline["results"].get(name)
+        if before is None:
+            continue
+        old, new = before["p50_us"], stats["p50_us"]
+        change = (new - old) / old if old else 0.0
+        rows.append({
+            "name": name,
+            "baseline_p50_us": old,
+            "p50_us": new,
+            "change": change,
+            "regression": change > threshold,
+        })
+    return rows
+
+
+def format_results(results: Dict[str, Stats]) -> str:
+    """Render benchmark results as a text table."""
+    lines = [f"{'benchmark':<24}{'n':>8}{'ops/sec':>14}{'p50 (us)':>12}{'p99 (us)':>12}"]
+    for name, s in results.items():
+        lines.append(f"{name:<24}{s.n:>8}{s.ops_per_sec:>14,.0f}{s.p50_us:>12.2f}{s.p99_us:>12.2f}")
+    return "\n".join(lines)
+
+
+def format_comparison(rows: List[Dict[str, Any]]) -> str:
+    """Render the output of `compare` as a text table."""
+    lines = [f"{'benchmark':<24}{'baseline p50':>14}{'p50':>12}{'change':>10}"]
+    for row in rows:
+        flag = "  REGRESSION" if row["regression"] else ""
+        lines.append(
+            f"{row['name']:<24}{row['baseline_p50_us']:>14.2f}{row['p50_us']:>12.2f}"
+            f"{row['change']:>+10.1%}{flag}"
+        )
+    return "\n".join(lines)
+
+
+class _LockedSocialLinks(SocialLinks):
+    """Reference implementation for `bench_concurrency`: readers take the
+    lock writers hold while they replace the registry."""
+
+    def detect_platform(self, url: str, **kwargs: Any) -> Optional[str]:
+        with self._write_lock:
+            return super().detect_platform(url, **kwargs)
+
+
+def bench_concurrency(urls: Sequence[str], threads: int = 8, duration: float = 1.0) -> Dict[str, Dict[str, float]]:
+    """Measure detection throughput under concurrent registry changes.
+
+    `threads` reader threads call `detect_platform` over `urls` while one
+    writer thread replaces a custom platform in a loop, for `duration`
+    seconds, first with the default lock-free snapshots, then with reads
+    guarded by the writers' lock.
+
+    Returns:
+        For ``"snapshot"`` and ``"locked"``, the total detections per second
+        (``reads_per_sec``) and registry changes per second
+        (``writes_per_sec``).
+    """
+    custom = [{"patterns": [r"https?://bench\.invalid/(?P<id>\w+)"], "sanitized": "https://bench.invalid/{id}"}]
+    results = {}
+    for label, cls in (("snapshot", SocialLinks), ("locked", _LockedSocialLinks)):
+        sl = cls()
+        stop = threading.Event()
+        reads = [0] * threads
+        writes = [0]
+
+        def reader(slot: int) -> None:
+            detect = sl.detect_platform
+            count = 0
+            while not stop.is_set():
+                for url in urls:
+                    detect(url)
+                count += len(urls)
+            reads[slot] = count
+
+        def writer() -> None:
+            count = 0
+            while not stop.is_set():
+                sl.set_platform("bench", custom, override=True)
+                count += 1
+                time.sleep(0.001)
+            writes[0] = count
+
+        workers = [threading.Thread(target=reader, args=(i,)) for i in range(threads)]
+        workers.append(threading.Thread(target=writer))
+        start = time.perf_counter()
+        for t in workers:
+            t.start()
+        time.sleep(duration)
+        stop.set()
+        for t in workers:
+            t.join()
+        elapsed = time.perf_counter() - start
+        results[label] = {"reads_per_sec": sum(reads) / elapsed, "writes_per_sec": writes[0] / elapsed}
+    return results
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command-line entry point for ``python -m sociallinks.bench``.
+
+    Returns:
+        The process exit code: 1 if `--compare` found a regression, else 0.
+    """
+    parser = argparse.ArgumentParser(prog="python -m sociallinks.bench", description=__doc__.splitlines()[0])
+    parser.add_argument("--format", choices=("text", "json"), default="text", help="output format (default: text)")
+    parser.add_argument("--rounds", type=int, default=5, help="passes over the corpus (default: 5)")
+    parser.add_argument("--seed", type=int, default=0, help="corpus seed (default: 0)")
+    parser.add_argument("--size", type=int, default=200, help="generated inputs per category (default: 200)")
+    parser.add_argument(
+        "--only",
+        action="append",
+        metavar="NAME",
+        help="run only this benchmark or group (e.g. detect, sanitize.positive); repeatable",
+    )
+    parser.add_argument("--save", metavar="PATH", help="save the results as a JSON baseline")
+    parser.add_argument("--compare", metavar="PATH", help="compare against a saved JSON baseline")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help=f"p50 slowdown reported as a regression (default: {DEFAULT_THRESHOLD})",
+    )
+    parser.add_argument("--memory", action="store_true", help="also measure memory retained by many instances")
+    parser.add_argument("--instances", type=int, default=1000, help="instances for --memory (default: 1000)")
+    parser.add_argument(
+        "--unshared-instances",
+        type=int,
+        default=20,
+        help="instances for --memory without the shared registry (default: 20)",
+    )
+    parser.add_argument(
+        "--concurrency",
+        action="store_true",
+        help="also measure multi-threaded detection while the registry changes",
+    )
+    parser.add_argument("--threads", type=int, default=8, help="reader threads for --concurrency (default: 8)")
+    args = parser.parse_args(argv)
+
+    if args.only:
+        unknown = [n for n in args.only if not any(b == n or b.startswith(n + ".") for b in BENCHMARKS)]
+        if unknown:
+            parser.error(f"unknown benchmark: {', '.join(unknown)}")
+
+    text = args.format == "text"
+    corpus = build_corpus(seed=args.seed, size=args.size)
+    progress = (lambda name: print(f"running {name}...", file=sys.stderr)) if text else None
+    results = run(corpus, rounds=args.rounds, only=args.only, progress=progress)
+    document = to_json(results, corpus, args.seed)
+
+    rows = None
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            rows = compare(document, json.load(f), args.threshold)
+        document["comparison"] = rows
+
+    if args.memory:
+        document["memory"] = {
+            "shared": bench_construction(args.instances, shared=True),
+            "unshared": bench_construction(args.unshared_instances, shared=False),
+        }
+
+    if args.concurrency:
+        document["concurrency"] = bench_concurrency([url for _, url in corpus.positives[:50]], threads=args.threads)
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump(document, f, indent=2)
+
+    if text:
+        print(format_results(results))
+        if rows is not None:
+            print()
+            print(format_comparison(rows))
+        if args.memory:
+            print()
+            for label, instances in (("shared", args.instances), ("unshared", args.unshared_instances)):
+                m = document["memory"][label]
+                print(
+                    f"construction x{instances} ({label} registry): "
+                    f"{m['us_per_instance']:.1f} us/instance, {m['kib_per_instance']:.1f} KiB/instance retained"
+                )
+        if args.concurrency:
+            print()
+            for label, c in document["concurrency"].items():
+                print(
+                    f"concurrency x{args.threads} threads ({label}): "
+                    f"{c['reads_per_sec']:,.0f} detections/s, {c['writes_per_sec']:,.0f} registry changes/s"
+                )
+    else:
+        print(json.dumps(document, indent=2))
+
+    return 1 if rows and any(row["regression"] for row in rows) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
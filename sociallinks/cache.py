@@ -0,0 +1,143 @@
+"""Result cache used by `SocialLinks`.
+
+This module provides a small, thread-safe LRU cache that `SocialLinks` can use
+to memoize `detect_platform`, `is_valid` and `sanitize` results for repeated
+inputs. Entries are tied to a registry generation: as soon as the platform
+registry changes, every cached result is dropped.
+"""
+import threading
+from collections import OrderedDict
+from typing import Any, Hashable, NamedTuple, Type
+
+
+class CacheInfo(NamedTuple):
+    """Cache statistics, in the style of `functools.lru_cache`.
+
+    Attributes:
+        hits: Number of lookups answered from the cache, including cached
+            non-matches.
+        misses: Number of lookups that had to run the regex patterns.
+        maxsize: Maximum number of cached results.
+        currsize: Current number of cached results.
+    """
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class CachedError:
+    """A cached failure, re-raised as a fresh exception on every hit.
+
+    Args:
+        exc_type: Exception class to raise.
+        message: Exception message.
+    """
+
+    __slots__ = ("exc_type", "message")
+
+    def __init__(self, exc_type: Type[Exception], message: str):
+        self.exc_type = exc_type
+        self.message = message
+
+    def raise_(self) -> None:
+        """Raise the cached exception."""
+        raise self.exc_type(self.message)
+
+
+MISSING = object()
+"""Sentinel returned by `LRUCache.get` when a key is not cached."""
+
+
+class LRUCache:
+    """Bounded least-recently-used cache bound to a registry generation.
+
+    Args:
+        maxsize: Maximum number of entries. Must be positive.
+    """
+
+    __slots__ = ("maxsize", "hits", "misses", "generation", "_data", "_lock")
+
+    def __init__(self, maxsize: int):
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.generation = 0
+        self._data: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, generation: int) -> Any:
+        """Look up a cached value.
+
+        Lookups do not take the lock: reading an entry and marking it as
+        recently used are single, atomic dictionary operations, so readers
+        never wait for each other. Hit and miss counts may therefore be
+        slightly off under concurrent use.
+
+        Args:
+            key: Cache key.
+            generation: Registry generation of the caller. If it is newer
+                than the generation the cache was filled for, the cache is
+                cleared. Lookups from callers still working on an older
+                registry snapshot always miss and leave the cache alone.
+
+        Returns:
+            The cached value, or `MISSING`.
+        """
+        if generation != self.generation:
+            if generation < self.generation:
+                self.misses += 1
+                return MISSING
+            with self._lock:
+                if generation > self.generation:
+                    self._data.clear()
+                    self.generation = generation
+        data = self._data
+        value = data.get(key, MISSING)
+        if value is MISSING:
+            self.misses += 1
+            return MISSING
+        try:
+            data.move_to_end(key)
+        except KeyError:
+            # Evicted by a concurrent `put`; the value is still valid
+            pass
+        self.hits += 1
+        return value
+
+    def put(self, key: Hashable, value: Any, generation: int) -> None:
+        """Store a value, evicting the least recently used entry if full.
+
+        Values computed against an outdated registry generation are ignored.
+
+        Args:
+            key: Cache key.
+            value: Value to cache.
+            generation: Registry generation the value was computed for.
+        """
+        with self._lock:
+            if generation != self.generation:
+                return
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all entries and reset the statistics."""
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def info(self) -> CacheInfo:
+        """Return the cache statistics.
+
+        Returns:
+            A `CacheInfo` tuple.
+        """
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.maxsize, len(self._data))
@@ -0,0 +1,305 @@
+"""Command-line interface, installed as the ``sociallinks`` console script.
+
+Two commands read one URL per input record and write one output record per
+input, in the same order::
+
+    sociallinks detect urls.txt > results.jsonl
+    sociallinks sanitize --platform linkedin --input-format csv --column profile crm.csv -f csv
+
+Inputs are standard input (the default, or ``-``) or files, read as plain
+lines, a CSV column or a JSONL field. Outputs are JSONL or CSV records with
+the input, platform, identifier, canonical URL and error code. Records are
+processed in batches through the batch API, optionally in several worker
+processes (``--workers``), and written with one call per batch.
+
+A third command generates a specialized matcher module, to be loaded with
+`SocialLinks.from_compiled()` (see `sociallinks.codegen`)::
+
+    sociallinks compile --definitions custom.json --out matcher.py
+"""
+import argparse
+import csv
+import io
+import json
+import os
+import sys
+import time
+from collections import Counter
+from typing import IO, Any, Iterator, List, Optional, Sequence, TextIO
+
+from sociallinks.core import SocialLinks
+from sociallinks.exceptions import SocialLinksError
+from sociallinks.parallel import Row, chunked, imap_rows
+
+FIELDS = ("input", "platform", "id", "url", "error")
+"""Fields of every output record."""
+
+BATCH_SIZE = 4096
+"""Default number of records processed, and sent to a worker, at once."""
+
+_IO_BUFFER = 1 << 20
+_JSONL_RECORD = '{"input":%s,"platform":%s,"id":%s,"url":%s,"error":%s}\n'
+_quote = json.encoder.encode_basestring  # type: ignore[attr-defined]
+
+
+def _json(value: Any) -> str:
+    """Encode one JSONL field; strings go through the C-accelerated quoter."""
+    if value is None:
+        return "null"
+    if isinstance(value, str):
+        return _quote(value)
+    return json.dumps(value, ensure_ascii=False)
+
+
+def _read_lines(stream: TextIO) -> Iterator[str]:
+    for line in stream:
+        yield line.rstrip("\r\n")
+
+
+def _read_csv(stream: TextIO, column: str, header: bool) -> Iterator[Optional[str]]:
+    reader = csv.reader(stream)
+    if column.isdigit():
+        index = int(column)
+        if header:
+            next(reader, None)
+    else:
+        if not header:
+            raise ValueError("--column must be an index when the CSV has no header")
+        names = next(reader, [])
+        if column not in names:
+            raise ValueError(f"column not found in CSV header: {column}")
+        index = names.index(column)
+    for row in reader:
+        yield row[index] if index < len(row) else None
+
+
+def _read_jsonl(stream: TextIO, field: str) -> Iterator[Any]:
+    loads = json.loads
+    for line in stream:
+        if not line.strip():
+            continue
+        try:
+            record = loads(line)
+        except ValueError:
+            yield None
+            continue
+        yield record.get(field) if isinstance(record, dict) else None
+
+
+def _open_input(path: str, encoding: str) -> TextIO:
+    if path == "-":
+        buffer = getattr(sys.stdin, "buffer", None)
+        if buffer is None:
+            return sys.stdin
+        return io.TextIOWrapper(buffer, encoding=encoding, newline="")
+    return open(path, encoding=encoding, newline="", buffering=_IO_BUFFER)
+
+
+def _read(args: argparse.Namespace) -> Iterator[Any]:
+    """Yield the input value of every record of every input file."""
+    for path in args.files or ["-"]:
+        stream = _open_input(path, args.encoding)
+        try:
+            if args.input_format == "csv":
+                yield from _read_csv(stream, args.column, not args.no_header)
+            elif args.input_format == "jsonl":
+                yield from _read_jsonl(stream, args.field)
+            else:
+                yield from _read_lines(stream)
+        finally:
+            if stream is not sys.stdin:
+                if path == "-":
+                    stream.detach()
+                else:
+                    stream.close()
+
+
+class _Writer:
+    """Writes output records, one `write` call per batch."""
+
+    def __init__(self, stream: IO[str], output_format: str):
+        self.stream = stream
+        self.csv = output_format == "csv"
+        if self.csv:
+            self._buffer = io.StringIO()
+            self._writer = csv.writer(self._buffer, lineterminator="\n")
+            self._writer.writerow(FIELDS)
+
+    def write(self, inputs: Sequence[Any], rows: List[Row]) -> None:
+        if self.csv:
+            self._writer.writerows([(value,) + row for value, row in zip(inputs, rows)])
+            self.stream.write(self._buffer.getvalue())
+            self._buffer.seek(0)
+            self._buffer.truncate()
+        else:
+            self.stream.write("".join(
+                _JSONL_RECORD % (_json(value), _json(p), _json(i), _json(u), _json(e))
+                for value, (p, i, u, e) in zip(inputs, rows)
+            ))
+
+
+def _format_stats(records: int, platforms: Counter, errors: Counter, elapsed: float) -> str:
+    matched = sum(platforms.values())
+    rate = records / elapsed if elapsed > 0 else 0.0
+    share = f" ({matched / records:.1%})" if records else ""
+    lines = [
+        f"records: {records}",
+        f"matched: {matched}{share}",
+        f"elapsed: {elapsed:.3f}s ({rate:,.0f} records/s)",
+    ]
+    if errors:
+        lines.append("errors: " + ", ".join(f"{code}={n}" for code, n in errors.most_common()))
+    if platforms:
+        lines.append("platforms: " + ", ".join(f"{name}={n}" for name, n in platforms.most_common()))
+    return "\n".join(lines)
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="sociallinks", description="Detect and sanitize social media profile URLs in bulk.")
+    commands = parser.add_subparsers(dest="command", metavar="COMMAND")
+    commands.required = True
+
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("files", nargs="*", metavar="FILE", help="input files; standard input if omitted or '-'")
+    common.add_argument(
+        "-i",
+        "--input-format",
+        choices=("lines", "csv", "jsonl"),
+        default="lines",
+        help="input format (default: lines)",
+    )
+    common.add_argument("--column", default="0", help="CSV column name or 0-based index (default: 0)")
+    common.add_argument("--no-header", action="store_true", help="the CSV input has no header row")
+    common.add_argument("--field", default="url", help="JSONL field holding the URL (default: url)")
+    common.add_argument("-o", "--output", metavar="PATH", help="output file; standard output if omitted")
+    common.add_argument("-f", "--format", choices=("jsonl", "csv"), default="jsonl", help="output format (default: jsonl)")
+    common.add_argument("--encoding", default="utf-8", help="input and output encoding (default: utf-8)")
+    common.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        default=1,
+        help="worker processes; 0 for one per CPU (default: 1, no pool)",
+    )
+    common.add_argument(
+        "--batch-size",
+        type=int,
+        default=BATCH_SIZE,
+        help=f"records per batch sent to a worker (default: {BATCH_SIZE})",
+    )
+    common.add_argument("--stats", action="store_true", help="print a summary to standard error")
+    common.add_argument(
+        "--normalize",
+        action="store_true",
+        help="drop mobile subdomains, tracking parameters and fragments before matching",
+    )
+
+    detect = commands.add_parser("detect", parents=[common], help="detect the platform of each URL and sanitize it")
+    detect.add_argument("--url-only", action="store_true", help="never detect bare usernames")
+    detect.add_argument(
+        "--candidates",
+        metavar="NAMES",
+        help="comma-separated platforms to restrict detection to, in priority order",
+    )
+
+    sanitize = commands.add_parser("sanitize", parents=[common], help="sanitize each URL for a given platform")
+    sanitize.add_argument("-p", "--platform", required=True, help="platform to match every URL against")
+
+    compile_ = commands.add_parser("compile", help="generate a specialized matcher module")
+    compile_.add_argument("-o", "--out", metavar="PATH", help="output module; standard output if omitted")
+    compile_.add_argument(
+        "--definitions",
+        action="append",
+        default=[],
+        metavar="FILE",
+        help="JSON file of platform definitions by name, added or replacing predefined ones; repeatable",
+    )
+    compile_.add_argument("--no-predefined", action="store_true", help="leave out the predefined platforms")
+    compile_.add_argument("--url-only", action="store_true", help="never detect bare usernames by default")
+    compile_.add_argument("--normalize", action="store_true", help="normalize inputs before matching by default")
+    return parser
+
+
+def _compile(args: argparse.Namespace) -> int:
+    """Run the ``compile`` command."""
+    try:
+        sl = SocialLinks(use_predefined_platforms=not args.no_predefined, url_only=args.url_only, normalize=args.normalize)
+        for path in args.definitions:
+            with open(path, encoding="utf-8") as f:
+                sl.set_platforms(json.load(f), override=True)
+        source = sl.compile_module()
+        if args.out:
+            with open(args.out, "w", encoding="utf-8") as f:
+                f.write(source)
+        else:
+            sys.stdout.write(source)
+    except (OSError, ValueError, SocialLinksError) as e:
+        print(f"sociallinks: error: {e}", file=sys.stderr)
+        return 1
+    return 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command-line entry point for the ``sociallinks`` console script.
+
+    Returns:
+        The process exit code.
+    """
+    parser = _build_parser()
+    args = parser.parse_args(argv)
+    if args.command == "compile":
+        return _compile(args)
+    if args.batch_size <= 0:
+        parser.error("--batch-size must be positive")
+    workers = args.workers if args.workers > 0 else (os.cpu_count() or 1)
+
+    sl = SocialLinks(normalize=args.normalize)
+    platform_name = getattr(args, "platform", None)
+    candidates = None
+    if getattr(args, "candidates", None):
+        candidates = tuple(name.strip() for name in args.candidates.split(",") if name.strip())
+    for name in ([platform_name] if platform_name else []) + list(candidates or ()):
+        if name not in sl.platforms:
+            parser.error(f"unknown platform: {name}")
+
+    if args.output:
+        stream: IO[str] = open(args.output, "w", encoding=args.encoding, newline="", buffering=_IO_BUFFER)
+    else:
+        stream = sys.stdout
+    writer = _Writer(stream, args.format)
+
+    records = 0
+    platforms: Counter = Counter()
+    errors: Counter = Counter()
+    started = time.perf_counter()
+    try:
+        chunks = chunked(_read(args), args.batch_size)
+        results = imap_rows(
+            sl,
+            chunks,
+            workers=workers,
+            platform_name=platform_name,
+            url_only=getattr(args, "url_only", False),
+            candidates=candidates,
+        )
+        for inputs, rows in results:
+            writer.write(inputs, rows)
+            if args.stats:
+                records += len(rows)
+                for platform, _, _, error in rows:
+                    if error is None:
+                        platforms[platform] += 1
+                    else:
+                        errors[error] += 1
+    except (OSError, ValueError) as e:
+        print(f"sociallinks: error: {e}", file=sys.stderr)
+        return 1
+    finally:
+        if stream is sys.stdout:
+            stream.flush()
+        else:
+            stream.close()
+
+    if args.stats:
+        print(_format_stats(records, platforms, errors, time.perf_counter() - started), file=sys.stderr)
+    return 0
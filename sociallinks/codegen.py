@@ -0,0 +1,254 @@
+"""Ahead-of-time generation of a specialized matcher module.
+
+``sociallinks compile --out matcher.py`` turns a registry into a Python module
+holding everything a `SocialLinks` instance otherwise derives at run time, as
+literals:
+
+- the platform definitions, regex flags and normalizer configuration;
+- the host index classification of every pattern;
+- one combined regex per host bucket and per handle list, with the table
+  mapping its groups back to patterns (see `sociallinks.matcher`), so that a
+  bucket with several patterns is searched in one regex call;
+- the combined regex of every platform, used by `is_valid()` and
+  `sanitize()`;
+- the sanitized URL templates, split into prefix and suffix.
+
+``SocialLinks.from_compiled(matcher)`` loads such a module. Nothing is
+analysed at load time and every regex is compiled on first use, so startup
+is one module import. Results are identical to those of the registry the
+module was generated from. The derived data is only trusted when the module
+was generated by the same sociallinks release and Python version; otherwise
+only the platform definitions are used.
+"""
+import pprint
+import re
+import sys
+from types import ModuleType
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from sociallinks.backend import INDEXED, MatcherBackend
+from sociallinks.index import HostIndex, IndexEntry, PatternKind
+from sociallinks.matcher import MatcherState, PlatformMatcher
+from sociallinks.registry import CompiledPlatform, LazyPattern, RegistrySnapshot, restore_platform
+
+FORMAT_VERSION = 2
+"""Version of the generated module format. Modules written with another
+version are rejected by `load_registry`."""
+
+
+def package_version() -> Optional[str]:
+    """Return the installed version of sociallinks, or None when running from a source tree."""
+    from importlib.metadata import PackageNotFoundError, version
+
+    try:
+        return version("social-links")
+    except PackageNotFoundError:
+        return None
+
+
+class _Bucket(list):
+    """A candidate list of a `CompiledIndex`, with its combined matcher."""
+
+    __slots__ = ("matcher",)
+
+
+def _lazy_compile(source: str, flags: int) -> LazyPattern:
+    return LazyPattern(source, flags, "<compiled>")
+
+
+class CompiledIndex(HostIndex):
+    """A `HostIndex` that searches each candidate list with one regex.
+
+    Every list of two or more patterns (host buckets, bare handles, prefixed
+    handles, unclassified patterns) gets a `PlatformMatcher` over its
+    patterns, which returns the first pattern in list order that matches,
+    exactly as the loop of `HostIndex.match`. Inputs whose candidates span
+    several lists still use that loop.
+
+    Args:
+        platforms: ``(name, [(pattern, kind), ...])`` pairs in registry order.
+        flags: Regex flags of the patterns.
+        states: Precomputed matcher states by list key (see `states()`).
+            Lists without a state get a matcher built from their patterns.
+        compile: Used to compile the combined regexes of `states`.
+    """
+
+    __slots__ = ()
+
+    def __init__(
+        self,
+        platforms: Any,
+        flags: int,
+        states: Optional[Dict[str, Optional[MatcherState]]] = None,
+        compile: Any = re.compile,
+    ):
+        super().__init__(platforms)
+
+        def bucket(key: str, entries: List[IndexEntry]) -> List[IndexEntry]:
+            if len(entries) < 2:
+                return entries
+            patterns = [pattern for _, _, _, pattern in entries]
+            result = _Bucket(entries)
+            if states is not None and key in states:
+                result.matcher = PlatformMatcher.from_state(patterns, flags, states[key], compile)
+            else:
+                result.matcher = PlatformMatcher(patterns, flags)
+            return result
+
+        self._hosts = {key: bucket("host:" + key, entries) for key, entries in self._hosts.items()}
+        self._others = bucket("others", self._others)
+        self._urls = bucket("urls", self._urls)
+        self._plain = bucket("plain", self._plain)
+        self._handles = bucket("handles", self._handles)
+
+    def _lists(self) -> Iterator[Tuple[str, List[IndexEntry]]]:
+        for key, entries in self._hosts.items():
+            yield "host:" + key, entries
+        yield "others", self._others
+        yield "urls", self._urls
+        yield "plain", self._plain
+        yield "handles", self._handles
+
+    def states(self) -> Dict[str, Optional[MatcherState]]:
+        """Return the state of every combined matcher, by list key."""
+        return {key: entries.matcher.state() for key, entries in self._lists() if isinstance(entries, _Bucket)}
+
+    def detect(self, url: str, url_only: bool = False) -> Optional[str]:
+        entries = self.candidates(url, url_only)
+        if type(entries) is _Bucket:
+            found = entries.matcher.match(url)  # type: ignore[attr-defined]
+            return entries[found[0]][1] if found is not None else None
+        for _, name, _, pattern in entries:
+            if pattern.search(url):
+                return name
+        return None
+
+    def match(self, url: str, url_only: bool = False) -> Optional[Tuple[str, int, "re.Match[str]"]]:
+        entries = self.candidates(url, url_only)
+        if type(entries) is _Bucket:
+            found = entries.matcher.locate(url)  # type: ignore[attr-defined]
+            if found is None:
+                return None
+            _, name, pos, _ = entries[found[0]]
+            return name, pos, found[1]
+        for _, name, pos, pattern in entries:
+            m = pattern.search(url)
+            if m:
+                return name, pos, m
+        return None
+
+
+def _index_input(compiled: Dict[str, CompiledPlatform]) -> List[Tuple[str, List[Tuple[Any, PatternKind]]]]:
+    return [(name, list(zip(platform.patterns(), platform.kinds))) for name, platform in compiled.items()]
+
+
+def generate(
+    registry: RegistrySnapshot, regex_flags: int, url_only: bool = False, normalize: Optional[Dict[str, Any]] = None
+) -> str:
+    """Generate the source of a matcher module for a registry.
+
+    Lazily compiled patterns are compiled first, so that a module only ever
+    holds valid patterns.
+
+    Args:
+        registry: Registry snapshot of a `SocialLinks` instance.
+        regex_flags: Regex flags of the instance.
+        url_only: Default of the `url_only` detection mode.
+        normalize: Configuration of the input normalizer, or None.
+
+    Returns:
+        Python source code.
+
+    Raises:
+        InvalidPlatformRegexError: If a lazily compiled pattern is invalid.
+    """
+    compiled = registry.compiled
+    for platform in compiled.values():
+        for pattern in platform.patterns():
+            if isinstance(pattern, LazyPattern):
+                pattern.compile()
+
+    def literal(value: Any) -> str:
+        return pprint.pformat(value, width=120, sort_dicts=False)
+
+    sections = [
+        ("FORMAT_VERSION", FORMAT_VERSION),
+        ("PYTHON", tuple(sys.version_info[:2])),
+        ("SOCIALLINKS", package_version()),
+        ("REGEX_FLAGS", int(regex_flags)),
+        ("URL_ONLY", url_only),
+        ("NORMALIZE", normalize),
+        ("PLATFORMS", registry.platforms),
+        ("KINDS", {name: platform.kinds for name, platform in compiled.items()}),
+        ("TEMPLATES", {name: platform.templates for name, platform in compiled.items()}),
+        ("MATCHERS", {name: platform.matcher.state() for name, platform in compiled.items()}),
+        ("INDEX", CompiledIndex(_index_input(compiled), regex_flags).states()),
+    ]
+    lines = [
+        '"""Matcher module generated by ``sociallinks compile``. Do not edit.',
+        "",
+        "Load it with ``SocialLinks.from_compiled(module)``.",
+        '"""',
+    ]
+    for name, value in sections:
+        lines.append("")
+        lines.append(f"{name} = {literal(value)}")
+    return "\n".join(lines) + "\n"
+
+
+def load_registry(
+    module: ModuleType, adaptive: bool = False, backend: MatcherBackend = INDEXED
+) -> Tuple[RegistrySnapshot, int, bool, Optional[Dict[str, Any]]]:
+    """Build a registry snapshot from a generated matcher module.
+
+    If the module was generated by another sociallinks release or Python
+    version, only the platform definitions are used: patterns are compiled
+    eagerly and analysed again, as by `SocialLinks.set_platforms()`.
+
+    The restored derived data is attached to private copies of the compiled
+    platforms, never to the shared ones of the process-wide cache (see
+    `sociallinks.registry`).
+
+    Args:
+        module: Imported generated module.
+        adaptive: Adaptive pattern ordering, as for `SocialLinks()`.
+        backend: Matcher backend, as for `SocialLinks()`. The generated
+            index is only used by `INDEXED` without adaptive ordering.
+
+    Returns:
+        The registry snapshot, the regex flags, the `url_only` default and
+        the normalizer configuration.
+
+    Raises:
+        ValueError: If the module is not a generated matcher module, or was
+            generated with another format version.
+    """
+    version = getattr(module, "FORMAT_VERSION", None)
+    if version is None or not hasattr(module, "PLATFORMS"):
+        raise ValueError(f"not a generated matcher module: {getattr(module, '__name__', module)!r}")
+    if version != FORMAT_VERSION:
+        raise ValueError(f"unsupported matcher module version {version} (expected {FORMAT_VERSION})")
+
+    flags = module.REGEX_FLAGS
+    trusted = (
+        tuple(module.PYTHON) == tuple(sys.version_info[:2])
+        and getattr(module, "SOCIALLINKS", None) == package_version()
+    )
+    compiled: Dict[str, CompiledPlatform] = {}
+    for name, data in module.PLATFORMS.items():
+        platform = restore_platform(name, data, flags, module.KINDS[name] if trusted else None)
+        if trusted:
+            platform = platform.copy()
+            if platform._templates is None:
+                platform._templates = module.TEMPLATES[name]
+            if platform._matcher is None:
+                patterns = list(platform.patterns())
+                platform._matcher = PlatformMatcher.from_state(patterns, flags, module.MATCHERS[name], _lazy_compile)
+        compiled[name] = platform
+
+    index = None
+    if backend is INDEXED and not adaptive:
+        states: Optional[Dict[str, Optional[MatcherState]]] = module.INDEX if trusted else None
+        index = CompiledIndex(_index_input(compiled), flags, states, _lazy_compile)
+    registry = RegistrySnapshot(module.PLATFORMS, compiled, adaptive=adaptive, backend=backend, index=index)
+    return registry, flags, module.URL_ONLY, module.NORMALIZE
@@ -1,16 +1,41 @@
+import os
 import re
-from typing import Dict, List, Optional, Any, Tuple
+import threading
+from types import MappingProxyType, ModuleType
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Any, Tuple, Union
 from sociallinks.constants import PlatformEntry, PlatformEntries
-from sociallinks.platforms import PREDEFINED_PLATFORMS
+from sociallinks.backend import INDEXED, MatcherBackend
+from sociallinks.cache import MISSING, CacheInfo, CachedError, LRUCache
+from sociallinks.detector import Detector
+from sociallinks.extract import iter_candidates
+from sociallinks.index import HostIndex
+from sociallinks.instrument import SAMPLE_EVERY, Instrumentation
+from sociallinks.matcher import PlatformMatcher, extract_id
+from sociallinks.parallel import CHUNK_SIZE, Row, chunked, imap_rows
+from sociallinks.registry import CompiledPlatform, RegistrySnapshot, compile_platform, restore_platform
+from sociallinks.results import (
+    ExtractedLink,
+    HtmlLink,
+    ParseResult,
+    INVALID_TYPE,
+    EMPTY_URL,
+    NO_MATCH,
+    URL_MISMATCH,
+    ID_EXTRACTION,
+)
 from sociallinks.exceptions import (
     PlatformNotFoundError,
     PlatformAlreadyExistsError,
+    PlatformIDExtractionError,
     InvalidPlatformError,
     InvalidPlatformRegexError,
-    PlatformIDExtractionError,
     URLMismatchError,
 )
 
+if TYPE_CHECKING:
+    from sociallinks.harvest import LinkHarvester, MatchedLink
+    from sociallinks.normalize import Normalizer
+
 
 class SocialLinks:
     """Social Media URL Sanitizer and Validator.
@@ -48,6 +73,12 @@ class SocialLinks:
         self,
         use_predefined_platforms: bool = True,
         regex_flags: int = re.IGNORECASE,
+        cache_size: int = 0,
+        lazy: bool = False,
+        url_only: bool = False,
+        adaptive: bool = False,
+        normalize: Union[bool, "Normalizer"] = False,
+        backend: MatcherBackend = INDEXED,
     ):
         """Initialize the SocialLinks instance.
 
@@ -58,6 +89,46 @@ class SocialLinks:
             regex_flags: Regex flags to use for pattern compilation. Defaults
                 to `re.IGNORECASE`. Can be combined with other flags like
                 `re.MULTILINE` using bitwise OR (|).
+            cache_size: Maximum number of `detect_platform()`, `is_valid()`
+                and `sanitize()` results to keep in a least-recently-used
+                cache, including non-matches. Useful when the same URLs are
+                processed repeatedly. Defaults to 0, which disables caching.
+                The cache is invalidated whenever the platform registry
+                changes.
+            lazy: If True, the patterns of the predefined platforms are
+                compiled on first use instead of up front: `is_valid()` and
+                `sanitize()` only compile the patterns of the requested
+                platform, and `detect_platform()` only those evaluated for
+                the input's host. Useful for short-lived processes such as
+                CLI tools. Platforms added with `set_platform()` are always
+                compiled immediately. Defaults to False.
+            url_only: If True, detection (`detect_platform()`, `parse()`,
+                `detect_many()` and `parse_many()` without a platform) skips
+                bare-username patterns such as ``^{PROFILE_ID}$``, so a plain
+                username is never attributed to whichever platform happens to
+                be registered first. Prefixed handles such as ``u/name`` are
+                still detected. Can be overridden per call. `is_valid()` and
+                `sanitize()` are not affected. Defaults to False.
+            adaptive: If True, detection tries the patterns that matched most
+                often first. Matches are counted per pattern and the host
+                index is reordered every `sociallinks.index.REORDER_INTERVAL`
+                matches, never in a way that changes which platform wins (see
+                `sociallinks.index.AdaptiveIndex`). Worthwhile when traffic
+                concentrates on a few platforms with several URL shapes.
+                Counts restart when the registry changes. Defaults to False.
+            normalize: If True, or a `sociallinks.normalize.Normalizer`,
+                every input is normalized once before matching: the host is
+                lowercased, mobile and ``www`` subdomains are dropped, and
+                tracking query parameters and anchor fragments are removed,
+                so that links such as ``https://m.facebook.com/name?ref=share``
+                match. Inputs without ``://`` are only stripped. Applies to detection, validation, sanitization and
+                link extraction. Defaults to False, which only strips
+                surrounding whitespace.
+            backend: Matcher backend running the compiled patterns (see
+                `sociallinks.backend`). Defaults to `INDEXED`, the host index
+                and combined regexes. `REFERENCE` tries every pattern in
+                order and is meant for testing other backends. Worker
+                processes of `map_parallel()` use the default backend.
 
         Examples:
             >>> # Use predefined platforms (default)
@@ -73,99 +144,239 @@ class SocialLinks:
             >>> # Use custom regex flags
             >>> import re
             >>> sl = SocialLinks(regex_flags=re.IGNORECASE | re.MULTILINE)
+
+            >>> # Cache up to 100,000 results
+            >>> sl = SocialLinks(cache_size=100_000)
+
+            >>> # Compile patterns on first use
+            >>> sl = SocialLinks(lazy=True)
+
+            >>> # Only detect URLs, never bare usernames
+            >>> sl = SocialLinks(url_only=True)
+
+            >>> # Try the most frequently matching patterns first
+            >>> sl = SocialLinks(adaptive=True)
+
+            >>> # Clean up messy real-world links before matching
+            >>> sl = SocialLinks(normalize=True)
+
+            >>> # Try every pattern in order, to check results
+            >>> from sociallinks.backend import REFERENCE
+            >>> sl = SocialLinks(backend=REFERENCE)
         """
-        self.platforms: PlatformEntries = {}
-        self._compiled: Dict[str, List[Tuple[re.Pattern, str]]] = {}
+        self._cache: Optional[LRUCache] = LRUCache(cache_size) if cache_size > 0 else None
+        self._write_lock = threading.Lock()
         self.regex_flags: int = regex_flags
+        self.url_only: bool = url_only
+        if normalize is True:
+            # Imported here so that importing the package does not load urllib.parse
+            from sociallinks.normalize import Normalizer
+
+            normalize = Normalizer()
+        self._normalizer: Optional["Normalizer"] = normalize or None
+        self._prepare: Callable[[str], str] = self._normalizer or str.strip
 
+        platforms: PlatformEntries = {}
         if use_predefined_platforms:
-            self.platforms.update(PREDEFINED_PLATFORMS)
+            # Imported here so that importing the package stays cheap
+            from sociallinks.platforms import PREDEFINED_PLATFORMS
+
+            platforms.update(PREDEFINED_PLATFORMS)
 
         # Compile all
-        for name, data in self.platforms.items():
-            self._compile_platform(name, data)
+        compiled = {name: self._compile_platform(name, data, lazy) for name, data in platforms.items()}
+        self._registry = RegistrySnapshot(platforms, compiled, adaptive=adaptive, backend=backend)
 
     # ------------------------------------------------------------------
     # Internal Helpers
     # ------------------------------------------------------------------
 
-    def _compile_platform(self, name: str, data: PlatformEntry) -> None:
+    def _compile_platform(self, name: str, data: PlatformEntry, lazy: bool = False) -> CompiledPlatform:
         """Compile regex patterns for a platform.
 
         Internal method that compiles all regex patterns for a platform
-        and stores them with their sanitized templates.
+        with their sanitized templates and the index of the configuration
+        entry they came from.
+
+        Compiled platforms are immutable and shared process-wide: instances
+        registering the same configuration with the same regex flags reuse
+        the same compiled patterns (see `sociallinks.registry`).
 
         Args:
             name: Platform name.
             data: Platform configuration.
+            lazy: If True, defer compiling each pattern until its first use.
+
+        Returns:
+            The compiled platform.
 
         Raises:
             InvalidPlatformError: If no valid patterns are found.
             InvalidPlatformRegexError: If any regex pattern is invalid.
         """
-        compiled_entries: List[Tuple[re.Pattern, str]] = []
+        return compile_platform(name, data, self.regex_flags, lazy)
 
-        for entry in data:
-            if not isinstance(entry, dict):
-                continue
+    @property
+    def platforms(self) -> Mapping[str, PlatformEntry]:
+        """Platform configurations by name, in registration order.
 
-            patterns = entry.get("patterns")
-            sanitized = entry.get("sanitized")
+        A read-only view of the current registry snapshot; use
+        `set_platform()` and `delete_platform()` to change single platforms.
+        Assigning a dictionary replaces the whole registry at once, with the
+        validation of `set_platforms()`.
+        """
+        return MappingProxyType(self._registry.platforms)
+
+    @platforms.setter
+    def platforms(self, platforms: PlatformEntries) -> None:
+        updates = self._compile_batch(platforms)
+        with self._write_lock:
+            registry = self._registry
+            self._registry = registry.replace(updates, deletes=tuple(registry.platforms))
+
+    @property
+    def backend(self) -> MatcherBackend:
+        """Matcher backend running the compiled patterns."""
+        return self._registry.backend
+
+    @property
+    def normalizer(self) -> Optional["Normalizer"]:
+        """Normalizer applied to every input, or None if inputs are only stripped."""
+        return self._normalizer
+
+    @property
+    def _compiled(self) -> Dict[str, CompiledPlatform]:
+        """Compiled platforms of the current registry snapshot."""
+        return self._registry.compiled
+
+    @property
+    def _generation(self) -> int:
+        """Generation of the current registry snapshot."""
+        return self._registry.generation
+
+    def _get_index(self) -> HostIndex:
+        """Return the host index of the current registry snapshot.
 
-            if not patterns or not sanitized:
-                continue
+        Returns:
+            The `HostIndex` over all compiled platforms in registry order.
+        """
+        return self._registry.index
 
-            for p in (patterns if isinstance(patterns, list) else [patterns]):
-                try:
-                    compiled_entries.append(
-                        (re.compile(p, flags=self.regex_flags), sanitized)
-                    )
-                except re.error as e:
-                    raise InvalidPlatformRegexError(
-                        f"Invalid regex pattern for platform '{name}': {p}"
-                    ) from e
+    def _normalize_config(self) -> Optional[Dict[str, Any]]:
+        """Return the normalizer configuration stored in snapshots and compiled modules."""
+        return self._normalizer.as_dict() if self._normalizer is not None else None
 
-        if not compiled_entries:
-            raise InvalidPlatformError(f"Platform '{name}' has no valid patterns or templates.")
+    def _url_only(self, url_only: Optional[bool]) -> bool:
+        """Resolve a per-call `url_only` argument against the instance default."""
+        return self.url_only if url_only is None else url_only
 
-        self._compiled[name] = compiled_entries
+    def _candidate_names(
+        self, candidates: Iterable[str], registry: Optional[RegistrySnapshot] = None
+    ) -> Tuple[str, ...]:
+        """Validate a `candidates` argument against a registry snapshot.
 
-    @staticmethod
-    def _extract_id(match: re.Match) -> Optional[str]:
-        """Extract platform identifier from a regex match.
+        Returns:
+            The platform names in the given order, without duplicates.
 
-        Attempts to extract the identifier using a named group "id",
-        or falls back to the first non-empty capturing group.
+        Raises:
+            TypeError: If candidates is a string or contains non-strings.
+            PlatformNotFoundError: If a platform doesn't exist.
+        """
+        if isinstance(candidates, str):
+            raise TypeError("candidates must be an iterable of platform names, not str")
+        compiled = (registry or self._registry).compiled
+        names = tuple(dict.fromkeys(candidates))
+        for name in names:
+            if not isinstance(name, str):
+                raise TypeError(f"platform name must be str, not {type(name).__name__}")
+            if name not in compiled:
+                raise PlatformNotFoundError(f"Unknown platform: {name}")
+        return names
+
+    def _get_candidates(
+        self, registry: RegistrySnapshot, candidates: Iterable[str]
+    ) -> Tuple[Tuple[str, ...], HostIndex]:
+        """Resolve a `candidates` argument to its names and host index.
+
+        Resolved subsets are remembered by the registry snapshot, so passing
+        the same candidates on every call only costs a lookup. Host indexes
+        are shared through `sociallinks.backend.shared_index`.
+        """
+        if isinstance(candidates, str):
+            raise TypeError("candidates must be an iterable of platform names, not str")
+        key = tuple(candidates)
+        subsets = registry.subsets
+        found = subsets.get(key)
+        if found is None:
+            names = self._candidate_names(key, registry)
+            found = (names, registry.subset_index(names))
+            if len(subsets) >= 64:
+                subsets.clear()
+            subsets[key] = found
+        return found
+
+    @classmethod
+    def _extract_id(cls, match: re.Match) -> Optional[str]:
+        """Extract the cleaned platform identifier from a regex match.
+
+        Uses the named group "id", or falls back to the first non-empty
+        capturing group (see `sociallinks.matcher.extract_id`).
 
         Args:
             match: Regex match object.
 
         Returns:
-            Extracted identifier string, or None if not found.
+            The identifier cleaned by `_clean_id()`, or None if not found.
         """
-        if "id" in match.groupdict() and match.group("id"):
-            return match.group("id")
+        return cls._clean_id(extract_id(match))
 
-        for g in match.groups():
-            if g:
-                return g
-        return None
+    @staticmethod
+    def _clean_id(pid: Optional[str]) -> Optional[str]:
+        """Clean a raw platform identifier.
+
+        Args:
+            pid: Raw identifier, from a match or given by the caller.
+
+        Returns:
+            The identifier with surrounding whitespace and trailing slashes
+            removed, or None if it is missing or empty.
+        """
+        if not pid:
+            return None
+        return pid.strip().rstrip("/")
 
     # ------------------------------------------------------------------
     # Core API
     # ------------------------------------------------------------------
 
-    def detect_platform(self, url: str) -> Optional[str]:
+    def detect_platform(
+        self,
+        url: str,
+        *,
+        url_only: Optional[bool] = None,
+        candidates: Optional[Iterable[str]] = None,
+    ) -> Optional[str]:
         """Detect the social media platform from a URL.
 
-        Analyzes the provided URL against all registered platform patterns
+        Analyzes the provided URL against the registered platform patterns
         and returns the first matching platform name. The URL is automatically
         stripped of leading/trailing whitespace before matching.
 
+        Patterns are looked up through a host index, so only the patterns
+        registered for the URL's host (plus any pattern the index cannot
+        classify) are evaluated. The result is the same as trying every
+        platform in registration order.
+
         Args:
             url: The URL or username to analyze. Can be a full URL
                 (e.g., "https://linkedin.com/in/johndoe") or just a username
                 (e.g., "johndoe"). Whitespace is automatically stripped.
+            url_only: If True, skip bare-username patterns. Defaults to the
+                `url_only` option the instance was created with.
+            candidates: Optional platform names to restrict detection to.
+                Platforms are tried in the given order instead of
+                registration order. Use `detector()` to reuse the same
+                subset many times.
 
         Returns:
             The platform name (e.g., "linkedin", "github", "x") if detected,
@@ -173,6 +384,7 @@ class SocialLinks:
 
         Raises:
             TypeError: If url is not a string.
+            PlatformNotFoundError: If a candidate platform doesn't exist.
 
         Examples:
             >>> sl = SocialLinks()
@@ -188,18 +400,39 @@ class SocialLinks:
             None
             >>> sl.detect_platform("  https://instagram.com/user  ")  # Whitespace handled
             'instagram'
+            >>> sl.detect_platform("https://x.com/user", candidates=["github", "linkedin"])
+            None
         """
         if not isinstance(url, str):
             raise TypeError(f"url must be str, not {type(url).__name__}")
         
-        u = url.strip()
+        url_only = self._url_only(url_only)
+        registry = self._registry
+        if candidates is None:
+            index = registry.index
+            # URL-only results are keyed apart from the default mode
+            key: Any = (url,) if url_only else url
+        else:
+            names, index = self._get_candidates(registry, candidates)
+            key = (url, names, url_only)
+
+        cache = self._cache
+        if cache is None:
+            return self._detect(url, url_only, index)
+
+        generation = registry.generation
+        result = cache.get(key, generation)
+        if result is MISSING:
+            result = self._detect(url, url_only, index)
+            cache.put(key, result, generation)
+        return result
+
+    def _detect(self, url: str, url_only: bool, index: HostIndex) -> Optional[str]:
+        """Uncached implementation of `detect_platform()`."""
+        u = self._prepare(url)
         if not u:
             return None
-        
-        for name, entries in self._compiled.items():
-            if any(pattern.search(u) for pattern, _ in entries):
-                return name
-        return None
+        return index.detect(u, url_only)
 
     def is_valid(self, platform_name: str, url: str) -> bool:
         """Validate a URL against a specific platform.
@@ -239,15 +472,30 @@ class SocialLinks:
         if not isinstance(url, str):
             raise TypeError(f"url must be str, not {type(url).__name__}")
         
-        entries = self._compiled.get(platform_name)
-        if not entries:
+        registry = self._registry
+        compiled = registry.compiled.get(platform_name)
+        if compiled is None:
             return False
-        
-        u = url.strip()
+        matcher = registry.platform_matcher(platform_name, compiled)
+
+        cache = self._cache
+        if cache is None:
+            return self._is_valid(matcher, url)
+
+        generation = registry.generation
+        key = (platform_name, url, False)
+        result = cache.get(key, generation)
+        if result is MISSING:
+            result = self._is_valid(matcher, url)
+            cache.put(key, result, generation)
+        return result
+
+    def _is_valid(self, matcher: PlatformMatcher, url: str) -> bool:
+        """Uncached implementation of `is_valid()`."""
+        u = self._prepare(url)
         if not u:
             return False
-        
-        return any(pattern.search(u) for pattern, _ in entries)
+        return matcher.is_valid(u)
 
     def sanitize(self, platform_name: str, url: str) -> str:
         """Sanitize a URL to its canonical format for a specific platform.
@@ -291,24 +539,895 @@ class SocialLinks:
         if not isinstance(url, str):
             raise TypeError(f"url must be str, not {type(url).__name__}")
         
-        entries = self._compiled.get(platform_name)
-        if not entries:
+        registry = self._registry
+        compiled = registry.compiled.get(platform_name)
+        if compiled is None:
             raise PlatformNotFoundError(f"Unknown platform: {platform_name}")
 
-        u = url.strip()
+        cache = self._cache
+        if cache is None:
+            return self._sanitize(platform_name, compiled, url)
+
+        generation = registry.generation
+        key = (platform_name, url, True)
+        result = cache.get(key, generation)
+        if result is MISSING:
+            try:
+                result = self._sanitize(platform_name, compiled, url)
+            except (URLMismatchError, PlatformIDExtractionError) as e:
+                cache.put(key, CachedError(type(e), str(e)), generation)
+                raise
+            cache.put(key, result, generation)
+        elif isinstance(result, CachedError):
+            result.raise_()
+        return result
+
+    def _sanitize(self, platform_name: str, compiled: CompiledPlatform, url: str) -> str:
+        """Uncached implementation of `sanitize()`."""
+        u = self._prepare(url)
         if not u:
             raise URLMismatchError("URL cannot be empty")
-        
-        for pattern, sanitized in entries:
-            m = pattern.search(u)
-            if m:
-                pid = self._extract_id(m)
-                if not pid:
-                    raise PlatformIDExtractionError("Could not extract platform ID")
-                pid = pid.strip().rstrip("/")
-                return sanitized.format(id=pid)
 
-        raise URLMismatchError(f"URL does not match platform '{platform_name}'")
+        found = self._registry.platform_matcher(platform_name, compiled).match(u)
+        if found is None:
+            raise URLMismatchError(f"URL does not match platform '{platform_name}'")
+
+        pos, pid = found
+        pid = self._clean_id(pid)
+        if pid is None:
+            raise PlatformIDExtractionError("Could not extract platform ID")
+        return compiled.format(pos, pid)
+
+    def cache_info(self) -> CacheInfo:
+        """Return statistics about the result cache.
+
+        Returns:
+            A `CacheInfo` named tuple with `hits`, `misses`, `maxsize` and
+            `currsize`. All fields are 0 when caching is disabled.
+
+        Examples:
+            >>> sl = SocialLinks(cache_size=1000)
+            >>> sl.detect_platform("https://github.com/username")
+            'github'
+            >>> sl.detect_platform("https://github.com/username")
+            'github'
+            >>> sl.cache_info()
+            CacheInfo(hits=1, misses=1, maxsize=1000, currsize=1)
+        """
+        if self._cache is None:
+            return CacheInfo(0, 0, 0, 0)
+        return self._cache.info()
+
+    def cache_clear(self) -> None:
+        """Clear the result cache and its statistics.
+
+        Has no effect when caching is disabled.
+        """
+        if self._cache is not None:
+            self._cache.clear()
+
+    def snapshot(self) -> bytes:
+        """Serialize the platform registry into a compact, versioned blob.
+
+        The blob holds the platform definitions, including custom ones, the
+        regex flags, the `url_only` default, the normalizer and the host
+        index classification of every pattern (see `sociallinks.snapshot`). Pass it
+        to `from_snapshot()` in another process, for instance from a pool
+        initializer, or store it on disk.
+
+        Returns:
+            The snapshot blob.
+
+        Raises:
+            InvalidPlatformRegexError: If a lazily compiled pattern is invalid.
+            TypeError: If a platform definition is not JSON-serializable.
+
+        Examples:
+            >>> sl = SocialLinks(use_predefined_platforms=False)
+            >>> sl.set_platform("example", [{"patterns": [r"https?://example\\.com/(?P<id>\\w+)"],
+            ...                              "sanitized": "https://example.com/{id}"}])
+            >>> restored = SocialLinks.from_snapshot(sl.snapshot())
+            >>> restored.sanitize("example", "https://example.com/johndoe")
+            'https://example.com/johndoe'
+        """
+        # Imported here so that importing the package does not load json and zlib
+        from sociallinks.snapshot import dumps as dump_snapshot
+
+        registry = self._registry
+        compiled = {name: (data, registry.compiled[name]) for name, data in registry.platforms.items()}
+        return dump_snapshot(compiled, self.regex_flags, self.url_only, self._normalize_config())
+
+    @classmethod
+    def from_snapshot(
+        cls, blob: bytes, *, cache_size: int = 0, adaptive: bool = False, backend: MatcherBackend = INDEXED
+    ) -> "SocialLinks":
+        """Create an instance from a blob returned by `snapshot()`.
+
+        Faster than building the same registry with `set_platforms()`: the
+        patterns, validated when the snapshot was taken, are compiled on
+        first use, and the host index is built from the stored
+        classification. A blob written by another Python version is still
+        accepted, but its patterns are compiled and analysed again.
+
+        Args:
+            blob: Snapshot blob.
+            cache_size: Result cache size, as for `SocialLinks()`.
+            adaptive: Adaptive pattern ordering, as for `SocialLinks()`.
+            backend: Matcher backend, as for `SocialLinks()`.
+
+        Returns:
+            A new instance with the snapshot's platforms, `regex_flags`,
+            `url_only` default and normalizer.
+
+        Raises:
+            TypeError: If blob is not bytes.
+            ValueError: If blob is not a valid snapshot, or was written with
+                an unsupported format version.
+        """
+        from sociallinks.normalize import Normalizer
+        from sociallinks.snapshot import loads as load_snapshot
+
+        data = load_snapshot(blob)
+        sl = cls(
+            use_predefined_platforms=False,
+            regex_flags=data.regex_flags,
+            cache_size=cache_size,
+            url_only=data.url_only,
+            adaptive=adaptive,
+            normalize=Normalizer(**data.normalize) if data.normalize is not None else False,
+            backend=backend,
+        )
+        kinds = data.kinds
+        compiled = {
+            name: restore_platform(name, entry, data.regex_flags, kinds[name] if kinds is not None else None)
+            for name, entry in data.platforms.items()
+        }
+        sl._registry = RegistrySnapshot(data.platforms, compiled, adaptive=adaptive, backend=backend)
+        return sl
+
+    def compile_module(self) -> str:
+        """Generate the source of a specialized matcher module.
+
+        Write the returned source to a file, import it and pass it to
+        `from_compiled()`, typically at build time with ``sociallinks
+        compile --out matcher.py``.
+
+        Returns:
+            Python source code.
+
+        Raises:
+            InvalidPlatformRegexError: If a lazily compiled pattern is invalid.
+        """
+        # Imported here so that importing the package does not load the generator
+        from sociallinks.codegen import generate as generate_module
+
+        return generate_module(self._registry, self.regex_flags, self.url_only, self._normalize_config())
+
+    @classmethod
+    def from_compiled(
+        cls, module: ModuleType, *, cache_size: int = 0, adaptive: bool = False, backend: MatcherBackend = INDEXED
+    ) -> "SocialLinks":
+        """Create an instance from a module generated by ``sociallinks compile``.
+
+        The module holds the registry together with everything derived from
+        it: the host index classification, one combined regex per host
+        bucket and the split sanitized URL templates (see
+        `sociallinks.codegen`). Regexes are compiled on first use, so
+        startup costs little more than importing the module. Detection uses
+        a `CompiledIndex` until the registry is changed, unless adaptive
+        ordering or another backend is chosen. A module generated by another
+        sociallinks release or Python version is still accepted, but its
+        patterns are compiled and analysed again.
+
+        Args:
+            module: Imported generated module.
+            cache_size: Result cache size, as for `SocialLinks()`.
+            adaptive: Adaptive pattern ordering, as for `SocialLinks()`.
+            backend: Matcher backend, as for `SocialLinks()`.
+
+        Returns:
+            A new instance with the module's platforms, `regex_flags`,
+            `url_only` default and normalizer.
+
+        Raises:
+            ValueError: If module is not a generated matcher module, or was
+                generated with an unsupported format version.
+
+        Examples:
+            >>> import matcher  # doctest: +SKIP
+            >>> sl = SocialLinks.from_compiled(matcher)  # doctest: +SKIP
+        """
+        from sociallinks.codegen import load_registry as load_compiled
+        from sociallinks.normalize import Normalizer
+
+        registry, regex_flags, url_only, normalize = load_compiled(module, adaptive, backend)
+        sl = cls(
+            use_predefined_platforms=False,
+            regex_flags=regex_flags,
+            cache_size=cache_size,
+            url_only=url_only,
+            adaptive=adaptive,
+            normalize=Normalizer(**normalize) if normalize is not None else False,
+            backend=backend,
+        )
+        sl._registry = registry
+        return sl
+
+    @property
+    def instrumentation(self) -> Optional[Instrumentation]:
+        """Per-pattern counters, or None when instrumentation is disabled."""
+        return self._registry.instrumentation
+
+    def enable_instrumentation(self, sample_every: int = SAMPLE_EVERY) -> Instrumentation:
+        """Start recording per-pattern evaluation counts, hits and timings.
+
+        Every pattern counts its evaluations and hits, and times one
+        evaluation out of every `sample_every`. `is_valid()`, `sanitize()`
+        and batches with a fixed platform try the patterns of the platform
+        one by one meanwhile, instead of running the combined regex.
+        Instrumentation is opt-in: without it, detection runs the plain
+        index and pays nothing. Results served from the result
+        cache evaluate no pattern and are not counted.
+
+        Calling this again keeps the current counters.
+
+        Args:
+            sample_every: Time one evaluation out of this many. Ignored if
+                instrumentation is already enabled.
+
+        Returns:
+            The `sociallinks.instrument.Instrumentation` collecting the
+            counters, exportable with `as_dict()` and `to_prometheus()`.
+
+        Raises:
+            ValueError: If sample_every is not positive.
+
+        Examples:
+            >>> sl = SocialLinks()
+            >>> stats = sl.enable_instrumentation()
+            >>> sl.detect_platform("https://github.com/username")
+            'github'
+            >>> stats.as_dict()["platforms"]["github"][0]["hits"]
+            1
+        """
+        with self._write_lock:
+            registry = self._registry
+            if registry.instrumentation is None:
+                self._registry = registry.instrumented(Instrumentation(sample_every))
+            return self._registry.instrumentation  # type: ignore[return-value]
+
+    def disable_instrumentation(self) -> None:
+        """Stop recording per-pattern statistics.
+
+        The `Instrumentation` returned by `enable_instrumentation()` keeps
+        the counters collected so far.
+        """
+        with self._write_lock:
+            registry = self._registry
+            if registry.instrumentation is not None:
+                self._registry = registry.instrumented(None)
+
+    def parse(
+        self,
+        url: str,
+        *,
+        url_only: Optional[bool] = None,
+        candidates: Optional[Iterable[str]] = None,
+    ) -> Optional[ParseResult]:
+        """Detect the platform of a URL and sanitize it in a single pass.
+
+        Equivalent to calling `detect_platform()` followed by `sanitize()`
+        with the detected platform, but the URL is stripped once and the
+        regex match found during detection is reused to extract the
+        identifier, so no pattern is evaluated twice.
+
+        Args:
+            url: The URL or username to parse. Whitespace is automatically
+                stripped.
+            url_only: If True, skip bare-username patterns. Defaults to the
+                `url_only` option the instance was created with.
+            candidates: Optional platform names to restrict detection to,
+                tried in the given order (see `detect_platform()`).
+
+        Returns:
+            A `ParseResult` holding the platform name, the index of the
+            matching configuration entry, the extracted identifier, the
+            sanitized URL and the source of the matching pattern. None if no
+            platform matches.
+
+        Raises:
+            TypeError: If url is not a string.
+            PlatformNotFoundError: If a candidate platform doesn't exist.
+            PlatformIDExtractionError: If a platform matches but the platform
+                identifier cannot be extracted from the URL.
+
+        Examples:
+            >>> sl = SocialLinks()
+            >>> result = sl.parse("https://www.github.com/username/")
+            >>> result.platform, result.id, result.url
+            ('github', 'username', 'https://github.com/username')
+            >>> sl.parse("https://example.com") is None
+            True
+        """
+        if not isinstance(url, str):
+            raise TypeError(f"url must be str, not {type(url).__name__}")
+
+        registry = self._registry
+        if candidates is None:
+            index = registry.index
+        else:
+            _, index = self._get_candidates(registry, candidates)
+        return self._parse(url, registry.compiled, index, self._url_only(url_only))
+
+    def _parse(
+        self, url: str, compiled: Dict[str, CompiledPlatform], index: HostIndex, url_only: bool = False
+    ) -> Optional[ParseResult]:
+        """Implementation of `parse()` against a host index of `compiled`."""
+        u = self._prepare(url)
+        if not u:
+            return None
+
+        found = index.match(u, url_only)
+        if found is None:
+            return None
+
+        name, pos, m = found
+        platform = compiled[name]
+        pid = self._extract_id(m)
+        if pid is None:
+            raise PlatformIDExtractionError("Could not extract platform ID")
+        return ParseResult(name, platform.entries[pos][2], pid, platform.format(pos, pid), m.re.pattern)
+
+    def detector(self, platforms: Iterable[str], *, url_only: Optional[bool] = None) -> Detector:
+        """Create a reusable detector restricted to a subset of platforms.
+
+        The returned `Detector` only tries the given platforms, in the given
+        order, and keeps its host index between calls. It stays bound to this
+        instance and picks up later changes to these platforms.
+
+        Args:
+            platforms: Platform names to detect, in priority order. Duplicates
+                are ignored.
+            url_only: If True, skip bare-username patterns. Defaults to the
+                `url_only` option this instance was created with.
+
+        Returns:
+            A `Detector` over the given platforms.
+
+        Raises:
+            TypeError: If platforms is a string or contains non-strings.
+            PlatformNotFoundError: If a platform doesn't exist.
+
+        Examples:
+            >>> sl = SocialLinks()
+            >>> profiles = sl.detector(["linkedin", "github", "x"])
+            >>> profiles.detect("https://github.com/username")
+            'github'
+            >>> profiles.detect("https://instagram.com/username") is None
+            True
+        """
+        return Detector(self, self._candidate_names(platforms), self._url_only(url_only))
+
+    # ------------------------------------------------------------------
+    # Batch API
+    # ------------------------------------------------------------------
+
+    def _iter_detect(
+        self, urls: Iterable[str], index: HostIndex, url_only: bool = False
+    ) -> Iterator[Optional[str]]:
+        """Yield `detect_platform()` results for each URL."""
+        detect = index.detect
+        prepare = self._prepare
+        for url in urls:
+            if not isinstance(url, str):
+                raise TypeError(f"url must be str, not {type(url).__name__}")
+            u = prepare(url)
+            yield detect(u, url_only) if u else None
+
+    def _iter_parse(
+        self, urls: Iterable[str], compiled: Dict[str, CompiledPlatform], index: HostIndex, url_only: bool = False
+    ) -> Iterator[ParseResult]:
+        """Yield a `ParseResult` for each URL, detecting its platform."""
+        match = index.match
+        extract = self._extract_id
+        prepare = self._prepare
+        for url in urls:
+            if not isinstance(url, str):
+                yield ParseResult.failure(INVALID_TYPE)
+                continue
+            u = prepare(url)
+            if not u:
+                yield ParseResult.failure(EMPTY_URL)
+                continue
+            found = match(u, url_only)
+            if found is None:
+                yield ParseResult.failure(NO_MATCH)
+                continue
+            name, pos, m = found
+            platform = compiled[name]
+            pid = extract(m)
+            if pid is None:
+                yield ParseResult.failure(ID_EXTRACTION, name)
+            else:
+                yield ParseResult(name, platform.entries[pos][2], pid, platform.format(pos, pid), m.re.pattern)
+
+    def _iter_parse_platform(
+        self, platform_name: str, compiled: CompiledPlatform, urls: Iterable[str]
+    ) -> Iterator[ParseResult]:
+        """Yield a `ParseResult` for each URL against a fixed platform."""
+        entries = compiled.entries
+        render = compiled.format
+        match = self._registry.platform_matcher(platform_name, compiled).match
+        clean_id = self._clean_id
+        prepare = self._prepare
+        for url in urls:
+            if not isinstance(url, str):
+                yield ParseResult.failure(INVALID_TYPE, platform_name)
+                continue
+            u = prepare(url)
+            if not u:
+                yield ParseResult.failure(EMPTY_URL, platform_name)
+                continue
+            found = match(u)
+            if found is None:
+                yield ParseResult.failure(URL_MISMATCH, platform_name)
+                continue
+            pos, pid = found
+            pid = clean_id(pid)
+            if pid is None:
+                yield ParseResult.failure(ID_EXTRACTION, platform_name)
+                continue
+            pattern, _, entry = entries[pos]
+            yield ParseResult(platform_name, entry, pid, render(pos, pid), pattern.pattern)
+
+    @staticmethod
+    def _iter_format(compiled: CompiledPlatform, pos: int, ids: Iterable[str]) -> Iterator[Optional[str]]:
+        """Yield `format_many()` results for each identifier."""
+        template = compiled.templates[pos]
+        if template is None:
+            sanitized = compiled.entries[pos][1]
+        else:
+            prefix, suffix = template
+        clean_id = SocialLinks._clean_id
+        for pid in ids:
+            if not isinstance(pid, str):
+                raise TypeError(f"id must be str, not {type(pid).__name__}")
+            pid = clean_id(pid)
+            if not pid:
+                yield None
+            elif template is None:
+                yield sanitized.format(id=pid)
+            else:
+                yield prefix + pid + suffix
+
+    def _check_platform(self, platform_name: str) -> CompiledPlatform:
+        """Validate a platform name argument of the batch API.
+
+        Returns:
+            The compiled platform, from the current registry snapshot.
+
+        Raises:
+            TypeError: If platform_name is not a string.
+            PlatformNotFoundError: If the platform doesn't exist.
+        """
+        if not isinstance(platform_name, str):
+            raise TypeError(f"platform_name must be str, not {type(platform_name).__name__}")
+        compiled = self._registry.compiled.get(platform_name)
+        if compiled is None:
+            raise PlatformNotFoundError(f"Unknown platform: {platform_name}")
+        return compiled
+
+    def detect_many(
+        self, urls: Iterable[str], *, lazy: bool = False, url_only: Optional[bool] = None
+    ) -> Union[List[Optional[str]], Iterator[Optional[str]]]:
+        """Detect the platform of many URLs at once.
+
+        Batch counterpart of `detect_platform()`. The host index is looked up
+        once for the whole batch instead of once per URL, which removes most
+        of the per-call overhead when processing large inputs.
+
+        Args:
+            urls: Iterable of URLs or usernames.
+            lazy: If True, return an iterator that processes URLs on demand
+                instead of a list. Useful for streaming very large inputs.
+            url_only: If True, skip bare-username patterns. Defaults to the
+                `url_only` option the instance was created with.
+
+        Returns:
+            The detected platform name (or None) for each URL, in input order.
+
+        Raises:
+            TypeError: If any URL is not a string.
+
+        Examples:
+            >>> sl = SocialLinks()
+            >>> sl.detect_many(["https://github.com/username", "https://example.com"])
+            ['github', None]
+        """
+        results = self._iter_detect(urls, self._registry.index, self._url_only(url_only))
+        return results if lazy else list(results)
+
+    def sanitize_many(
+        self, platform_name: str, urls: Iterable[str], *, lazy: bool = False
+    ) -> Union[List[Tuple[Optional[str], Optional[str]]], Iterator[Tuple[Optional[str], Optional[str]]]]:
+        """Sanitize many URLs for a specific platform at once.
+
+        Batch counterpart of `sanitize()`. Instead of raising
+        `URLMismatchError` or `PlatformIDExtractionError`, failures are
+        reported per URL as error codes from `sociallinks.results`.
+
+        Args:
+            platform_name: The name of the platform (e.g., "linkedin").
+            urls: Iterable of URLs to sanitize.
+            lazy: If True, return an iterator instead of a list.
+
+        Returns:
+            A ``(sanitized_url, error)`` pair for each URL, in input order.
+            On success `error` is None; on failure `sanitized_url` is None and
+            `error` is one of ``"invalid_type"``, ``"empty_url"``,
+            ``"url_mismatch"`` or ``"id_extraction"``.
+
+        Raises:
+            TypeError: If platform_name is not a string.
+            PlatformNotFoundError: If the platform doesn't exist.
+
+        Examples:
+            >>> sl = SocialLinks()
+            >>> sl.sanitize_many("github", ["http://www.github.com/username", "https://example.com"])
+            [('https://github.com/username', None), (None, 'url_mismatch')]
+        """
+        compiled = self._check_platform(platform_name)
+        results = ((r.url, r.error) for r in self._iter_parse_platform(platform_name, compiled, urls))
+        return results if lazy else list(results)
+
+    def format_many(
+        self, platform_name: str, ids: Iterable[str], *, entry: int = 0, lazy: bool = False
+    ) -> Union[List[Optional[str]], Iterator[Optional[str]]]:
+        """Build the sanitized URLs of known platform identifiers.
+
+        No regex is run: each identifier is cleaned as `sanitize()` cleans
+        extracted identifiers (surrounding whitespace and trailing slashes
+        removed) and rendered with the sanitized template of the given
+        configuration entry. Useful to rebuild canonical URLs from
+        identifiers already stored in a database.
+
+        Args:
+            platform_name: The name of the platform (e.g., "linkedin").
+            ids: Iterable of platform identifiers.
+            entry: Index of the platform configuration entry whose template
+                is used, as reported by `ParseResult.entry`. Defaults to the
+                first entry.
+            lazy: If True, return an iterator instead of a list.
+
+        Returns:
+            The sanitized URL of each identifier, in input order, or None for
+            identifiers that are empty once cleaned.
+
+        Raises:
+            TypeError: If platform_name or any identifier is not a string.
+            PlatformNotFoundError: If the platform doesn't exist.
+            ValueError: If the platform has no such configuration entry.
+
+        Examples:
+            >>> sl = SocialLinks()
+            >>> sl.format_many("github", ["username", " other/ ", ""])
+            ['https://github.com/username', 'https://github.com/other', None]
+            >>> sl.format_many("crunchbase", ["username"], entry=1)
+            ['https://www.crunchbase.com/person/username']
+        """
+        compiled = self._check_platform(platform_name)
+        pos = next((pos for pos, (_, _, index) in enumerate(compiled.entries) if index == entry), None)
+        if pos is None:
+            raise ValueError(f"Platform {platform_name!r} has no configuration entry {entry}")
+        results = self._iter_format(compiled, pos, ids)
+        return results if lazy else list(results)
+
+    def parse_many(
+        self,
+        urls: Iterable[str],
+        platform_name: Optional[str] = None,
+        *,
+        lazy: bool = False,
+        url_only: Optional[bool] = None,
+    ) -> Union[List[ParseResult], Iterator[ParseResult]]:
+        """Parse many URLs at once.
+
+        Batch counterpart of `parse()`. When `platform_name` is given, every
+        URL is matched against that platform only, as `sanitize()` does.
+        Failures never raise; they are reported through `ParseResult.error`.
+
+        Args:
+            urls: Iterable of URLs or usernames.
+            platform_name: Optional platform to match every URL against. If
+                None, the platform is detected per URL.
+            lazy: If True, return an iterator instead of a list.
+            url_only: If True, skip bare-username patterns during platform
+                detection. Ignored when `platform_name` is given. Defaults to
+                the `url_only` option the instance was created with.
+
+        Returns:
+            A `ParseResult` for each URL, in input order. Failed items have
+            `error` set to one of ``"invalid_type"``, ``"empty_url"``,
+            ``"no_match"`` (platform detection only), ``"url_mismatch"``
+            (fixed platform only) or ``"id_extraction"``.
+
+        Raises:
+            TypeError: If platform_name is given and is not a string.
+            PlatformNotFoundError: If platform_name is given and doesn't exist.
+
+        Examples:
+            >>> sl = SocialLinks()
+            >>> results = sl.parse_many(["https://x.com/username", "nope://"])
+            >>> [(r.platform, r.url, r.error) for r in results]
+            [('x', 'https://x.com/username', None), (None, None, 'no_match')]
+        """
+        if platform_name is None:
+            registry = self._registry
+            results = self._iter_parse(urls, registry.compiled, registry.index, self._url_only(url_only))
+        else:
+            compiled = self._check_platform(platform_name)
+            results = self._iter_parse_platform(platform_name, compiled, urls)
+        return results if lazy else list(results)
+
+    def map_parallel(
+        self,
+        urls: Iterable[str],
+        platform_name: Optional[str] = None,
+        *,
+        workers: Optional[int] = None,
+        chunk_size: int = CHUNK_SIZE,
+        url_only: Optional[bool] = None,
+        candidates: Optional[Iterable[str]] = None,
+        lazy: bool = False,
+    ) -> Union[List[Row], Iterator[Row]]:
+        """Parse many URLs in a pool of worker processes.
+
+        Parallel counterpart of `parse_many()` for large, CPU-bound jobs.
+        The platform definitions are sent to each worker once, when the pool
+        starts; afterwards workers only receive chunks of `chunk_size` URLs
+        and send back compact tuples. At most two chunks per worker are in
+        flight at once, so inputs are streamed with bounded memory.
+
+        On platforms that start worker processes with ``spawn`` (Windows,
+        macOS), call this from code guarded by ``if __name__ == "__main__":``.
+
+        Args:
+            urls: Iterable of URLs or usernames.
+            platform_name: Optional platform to match every URL against. If
+                None, the platform is detected per URL.
+            workers: Number of worker processes. Defaults to the number of
+                CPUs; with 1, URLs are parsed in the calling process.
+            chunk_size: Number of URLs sent to a worker at once.
+            url_only: If True, skip bare-username patterns during platform
+                detection. Defaults to the `url_only` option the instance
+                was created with.
+            candidates: Optional platform names to restrict detection to, in
+                priority order. Ignored when `platform_name` is given.
+            lazy: If True, return an iterator instead of a list. The pool is
+                shut down when the iterator is exhausted or closed.
+
+        Returns:
+            A ``(platform, id, url, error)`` tuple for each URL, in input
+            order, with the same values as the `ParseResult` attributes of
+            `parse_many()`.
+
+        Raises:
+            TypeError: If platform_name or a candidate is not a string.
+            ValueError: If workers or chunk_size is not positive.
+            PlatformNotFoundError: If platform_name or a candidate doesn't
+                exist.
+
+        Examples:
+            >>> sl = SocialLinks()
+            >>> sl.map_parallel(["https://x.com/username", "nope://"], workers=2)
+            [('x', 'username', 'https://x.com/username', None), (None, None, None, 'no_match')]
+        """
+        if workers is None:
+            workers = os.cpu_count() or 1
+        if workers <= 0:
+            raise ValueError("workers must be positive")
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be positive")
+        names = None
+        if platform_name is not None:
+            self._check_platform(platform_name)
+        elif candidates is not None:
+            names = self._candidate_names(candidates)
+
+        chunks = imap_rows(
+            self,
+            chunked(urls, chunk_size),
+            workers=workers,
+            platform_name=platform_name,
+            url_only=self._url_only(url_only),
+            candidates=names,
+        )
+        results = (row for _, rows in chunks for row in rows)
+        return results if lazy else list(results)
+
+    # ------------------------------------------------------------------
+    # Text API
+    # ------------------------------------------------------------------
+
+    def _iter_links(
+        self, text: Union[str, Iterable[str]], compiled: Dict[str, CompiledPlatform], index: HostIndex
+    ) -> Iterator[ExtractedLink]:
+        """Yield the profile links among the candidate URLs of `text`."""
+        match = index.match
+        extract = self._extract_id
+        normalize = self._normalizer
+        for start, end, url in iter_candidates(text, index.prefilter):
+            found = match(normalize(url) if normalize is not None else url)
+            if found is None:
+                continue
+            name, pos, m = found
+            pid = extract(m)
+            if pid is None:
+                continue
+            yield ExtractedLink((start, end), name, pid, compiled[name].format(pos, pid))
+
+    def _link_matcher(
+        self, compiled: Dict[str, CompiledPlatform], index: HostIndex
+    ) -> "Callable[[str], Optional[MatchedLink]]":
+        """Return a function matching a single link against `index`."""
+        match = index.match
+        extract = self._extract_id
+        normalize = self._normalizer
+
+        def match_link(url: str) -> "Optional[MatchedLink]":
+            if normalize is not None:
+                url = normalize(url)
+            found = match(url, True) if url else None
+            if found is None:
+                return None
+            name, pos, m = found
+            pid = extract(m)
+            if pid is None:
+                return None
+            return name, pid, compiled[name].format(pos, pid)
+
+        return match_link
+
+    def iter_links(
+        self,
+        text: Union[str, Iterable[str]],
+        *,
+        candidates: Optional[Iterable[str]] = None,
+    ) -> Iterator[ExtractedLink]:
+        """Find social profile links in arbitrary text.
+
+        The text is cut into candidate URLs (``scheme://...`` up to the next
+        whitespace, quote or angle bracket, without trailing punctuation) in
+        a single linear pass, and only those candidates are matched, through
+        the host index, as `parse()` would. Bare usernames are never
+        extracted from text.
+
+        Args:
+            text: The text to scan, or an iterable of text chunks such as a
+                file opened in text mode. Chunks may split a URL anywhere;
+                only a bounded tail of each chunk is kept in memory (see
+                `sociallinks.extract.MAX_CARRY`).
+            candidates: Optional platform names to restrict detection to,
+                tried in the given order (see `detect_platform()`).
+
+        Returns:
+            An iterator of `ExtractedLink` tuples, in text order. Spans are
+            offsets into the whole text, across chunks.
+
+        Raises:
+            TypeError: If text is neither a string nor an iterable of strings.
+            PlatformNotFoundError: If a candidate platform doesn't exist.
+
+        Examples:
+            >>> sl = SocialLinks()
+            >>> text = "Find me on https://x.com/username or (https://github.com/username)."
+            >>> [(link.platform, link.url) for link in sl.iter_links(text)]
+            [('x', 'https://x.com/username'), ('github', 'https://github.com/username')]
+
+            >>> with open("resume.txt") as f:  # doctest: +SKIP
+            ...     links = list(sl.iter_links(f))
+        """
+        if isinstance(text, (bytes, bytearray)):
+            raise TypeError(f"text must be str, not {type(text).__name__}")
+        registry = self._registry
+        if candidates is None:
+            index = registry.index
+        else:
+            _, index = self._get_candidates(registry, candidates)
+        return self._iter_links(text, registry.compiled, index)
+
+    def extract_links(
+        self,
+        text: Union[str, Iterable[str]],
+        *,
+        candidates: Optional[Iterable[str]] = None,
+    ) -> List[ExtractedLink]:
+        """Find all social profile links in arbitrary text.
+
+        List counterpart of `iter_links()`.
+
+        Args:
+            text: The text to scan, or an iterable of text chunks.
+            candidates: Optional platform names to restrict detection to.
+
+        Returns:
+            A list of `ExtractedLink` tuples, in text order.
+
+        Examples:
+            >>> sl = SocialLinks()
+            >>> sl.extract_links("See https://www.linkedin.com/in/username/, thanks!")[0].url
+            'https://linkedin.com/in/username'
+        """
+        return list(self.iter_links(text, candidates=candidates))
+
+    def iter_html_links(
+        self,
+        html: Union[str, Iterable[str]],
+        base_url: Optional[str] = None,
+        *,
+        candidates: Optional[Iterable[str]] = None,
+    ) -> "LinkHarvester":
+        """Find social profile links in the anchors of an HTML document.
+
+        The document is parsed with `html.parser` and only the ``href`` of
+        ``<a>``, ``<area>`` and ``<link>`` tags is considered: entities are
+        unescaped, relative URLs are resolved against `base_url` (or the
+        document's ``<base href>``), and each link is matched as `parse()`
+        would, skipping bare usernames. Memory use stays bounded for any
+        document size (see `sociallinks.harvest`).
+
+        Args:
+            html: The document, or an iterable of text chunks such as a file
+                opened in text mode or a decoded HTTP response stream.
+            base_url: URL the document was fetched from.
+            candidates: Optional platform names to restrict detection to,
+                tried in the given order (see `detect_platform()`).
+
+        Returns:
+            A `LinkHarvester` iterating over `HtmlLink` tuples in document
+            order. Its `stats` report the number of characters and hrefs
+            seen and the time spent on the document.
+
+        Raises:
+            TypeError: If html is neither a string nor an iterable of strings.
+            PlatformNotFoundError: If a candidate platform doesn't exist.
+
+        Examples:
+            >>> sl = SocialLinks()
+            >>> page = '<a href="https://www.linkedin.com/in/user&#110;ame/">in</a>'
+            >>> [link.url for link in sl.iter_html_links(page)]
+            ['https://linkedin.com/in/username']
+        """
+        # Imported here so that importing the package does not load html.parser
+        from sociallinks.harvest import LinkHarvester
+
+        registry = self._registry
+        if candidates is None:
+            index = registry.index
+        else:
+            _, index = self._get_candidates(registry, candidates)
+        return LinkHarvester(html, base_url, self._link_matcher(registry.compiled, index))
+
+    def extract_html_links(
+        self,
+        html: Union[str, Iterable[str]],
+        base_url: Optional[str] = None,
+        *,
+        candidates: Optional[Iterable[str]] = None,
+    ) -> List[HtmlLink]:
+        """Find all social profile links in the anchors of an HTML document.
+
+        List counterpart of `iter_html_links()`.
+
+        Args:
+            html: The document, or an iterable of text chunks.
+            base_url: URL the document was fetched from.
+            candidates: Optional platform names to restrict detection to.
+
+        Returns:
+            A list of `HtmlLink` tuples, in document order.
+        """
+        return list(self.iter_html_links(html, base_url, candidates=candidates))
 
     # ------------------------------------------------------------------
     # Platform CRUD (single + bulk)
@@ -359,12 +1478,13 @@ class SocialLinks:
             >>> # Update existing platform
             >>> sl.set_platform("example", custom, override=True)
         """
-        exists = name in self.platforms
-        if exists and not override:
-            raise PlatformAlreadyExistsError(f"Platform '{name}' already exists. Use override=True.")
+        with self._write_lock:
+            registry = self._registry
+            if name in registry.platforms and not override:
+                raise PlatformAlreadyExistsError(f"Platform '{name}' already exists. Use override=True.")
 
-        self.platforms[name] = data
-        self._compile_platform(name, data)
+            compiled = self._compile_platform(name, data)
+            self._registry = registry.replace({name: (data, compiled)})
 
     def delete_platform(self, name: str) -> None:
         """Delete a platform configuration.
@@ -386,10 +1506,11 @@ class SocialLinks:
             >>> "linkedin" in sl.list_platforms()
             False
         """
-        if name not in self.platforms:
-            raise PlatformNotFoundError(f"Platform '{name}' not found")
-        del self.platforms[name]
-        self._compiled.pop(name, None)
+        with self._write_lock:
+            registry = self._registry
+            if name not in registry.platforms:
+                raise PlatformNotFoundError(f"Platform '{name}' not found")
+            self._registry = registry.replace(deletes=(name,))
 
     def set_platforms(self, platforms: PlatformEntries, *, override: bool = False) -> None:
         """Add or update multiple platform configurations at once.
@@ -397,7 +1518,11 @@ class SocialLinks:
         Bulk operation to register multiple platforms. If any platform already
         exists, updates occur only when override=True (default behavior raises
         an error). This is more efficient than calling `set_platform()` multiple
-        times.
+        times: the batch is installed with a single registry change.
+
+        The operation is atomic. Every configuration is compiled and
+        validated first; if any of them is invalid, all the failures are
+        reported in one exception and the registry is left unchanged.
 
         Args:
             platforms: Dictionary mapping platform names to their
@@ -411,7 +1536,10 @@ class SocialLinks:
             PlatformAlreadyExistsError: If any platform already exists and
                 override is False.
             InvalidPlatformError: If any platform configuration is invalid.
-            InvalidPlatformRegexError: If any regex pattern is invalid.
+                Its `errors` attribute maps the name of every invalid
+                platform to its own error.
+            InvalidPlatformRegexError: If every invalid configuration is
+                invalid because of its regex patterns.
 
         Examples:
             >>> sl = SocialLinks(use_predefined_platforms=False)
@@ -430,18 +1558,54 @@ class SocialLinks:
             2
         """
         if not override:
-            conflicts = [name for name in platforms if name in self.platforms]
-            if conflicts:
-                raise PlatformAlreadyExistsError(f"Platforms already exist: {', '.join(conflicts)}")
-
+            self._check_conflicts(platforms, self._registry)
+
+        # Compiled outside the lock: only the install has to be serialized
+        updates = self._compile_batch(platforms)
+        with self._write_lock:
+            registry = self._registry
+            if not override:
+                self._check_conflicts(platforms, registry)
+            self._registry = registry.replace(updates)
+
+    def _compile_batch(self, platforms: PlatformEntries) -> Dict[str, Tuple[PlatformEntry, CompiledPlatform]]:
+        """Compile a batch of platforms, reporting every invalid one at once."""
+        updates = {}
+        errors: Dict[str, InvalidPlatformError] = {}
         for name, data in platforms.items():
-            self.set_platform(name, data, override=override)
+            try:
+                updates[name] = (data, self._compile_platform(name, data))
+            except InvalidPlatformError as e:
+                errors[name] = e
+        if errors:
+            raise self._batch_error(errors)
+        return updates
+
+    @staticmethod
+    def _check_conflicts(platforms: PlatformEntries, registry: RegistrySnapshot) -> None:
+        """Raise `PlatformAlreadyExistsError` if any platform is registered."""
+        conflicts = [name for name in platforms if name in registry.platforms]
+        if conflicts:
+            raise PlatformAlreadyExistsError(f"Platforms already exist: {', '.join(conflicts)}")
+
+    @staticmethod
+    def _batch_error(errors: Dict[str, InvalidPlatformError]) -> InvalidPlatformError:
+        """Combine the errors of the invalid platforms of a batch into one."""
+        if len(errors) == 1:
+            message = str(next(iter(errors.values())))
+        else:
+            details = "; ".join(f"{name}: {e}" for name, e in errors.items())
+            message = f"{len(errors)} invalid platforms: {details}"
+        if all(isinstance(e, InvalidPlatformRegexError) for e in errors.values()):
+            return InvalidPlatformRegexError(message, errors)
+        return InvalidPlatformError(message, errors)
 
     def delete_platforms(self, names: List[str]) -> None:
         """Delete multiple platform configurations at once.
 
         Bulk operation to remove multiple platforms. This is more efficient
-        than calling `delete_platform()` multiple times.
+        than calling `delete_platform()` multiple times: all platforms are
+        removed with a single registry change, or none if any is missing.
 
         Args:
             names: List of platform names to delete.
@@ -458,11 +1622,12 @@ class SocialLinks:
             >>> "github" in sl.list_platforms()
             False
         """
-        missing = [n for n in names if n not in self.platforms]
-        if missing:
-            raise PlatformNotFoundError(f"Platforms not found: {', '.join(missing)}")
-        for n in names:
-            self.delete_platform(n)
+        with self._write_lock:
+            registry = self._registry
+            missing = [n for n in names if n not in registry.platforms]
+            if missing:
+                raise PlatformNotFoundError(f"Platforms not found: {', '.join(missing)}")
+            self._registry = registry.replace(deletes=tuple(dict.fromkeys(names)))
 
     def clear_platforms(self) -> None:
         """Remove all platform configurations.
@@ -478,8 +1643,11 @@ class SocialLinks:
             >>> sl.list_platforms()
             []
         """
-        self.platforms.clear()
-        self._compiled.clear()
+        with self._write_lock:
+            registry = self._registry
+            self._registry = RegistrySnapshot(
+                {}, {}, registry.generation + 1, registry.instrumentation, registry.adaptive, backend=registry.backend
+            )
 
     def get_platform(self, name: str) -> PlatformEntry:
         """Get the configuration for a specific platform.
@@ -507,9 +1675,10 @@ class SocialLinks:
             >>> "sanitized" in config[0]
             True
         """
-        if name not in self.platforms:
+        data = self.platforms.get(name)
+        if data is None:
             raise PlatformNotFoundError(f"Platform '{name}' not found")
-        return self.platforms[name]
+        return data
 
     def list_platforms(self) -> List[str]:
         """List all registered platform names.
@@ -0,0 +1,142 @@
+"""Detection restricted to a fixed subset of platforms.
+
+A `Detector` is a lightweight view over a `SocialLinks` instance, created with
+`SocialLinks.detector`. It holds the host index of its platforms, built once
+and shared through `sociallinks.backend.shared_index`, so restricting
+detection to a handful of platforms costs nothing per call.
+"""
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from sociallinks.exceptions import PlatformNotFoundError
+from sociallinks.index import HostIndex
+from sociallinks.results import ParseResult
+
+if TYPE_CHECKING:
+    from sociallinks.core import SocialLinks
+    from sociallinks.registry import CompiledPlatform, RegistrySnapshot
+
+
+class Detector:
+    """Platform detection over an ordered subset of a registry.
+
+    Platforms are tried in the order given to `SocialLinks.detector`, so the
+    result for an input matching several of them is deterministic. The view
+    follows changes to its `SocialLinks` instance: the index is rebuilt on
+    first use after the registry changed.
+
+    Attributes:
+        platforms: Names of the platforms tried, in order.
+        url_only: Whether bare-username patterns are skipped.
+
+    Examples:
+        >>> sl = SocialLinks()
+        >>> profiles = sl.detector(["github", "linkedin"])
+        >>> profiles.detect_many(["https://github.com/username", "https://x.com/username"])
+        ['github', None]
+    """
+
+    __slots__ = ("platforms", "url_only", "_owner", "_state")
+
+    def __init__(self, owner: "SocialLinks", platforms: Tuple[str, ...], url_only: bool = False):
+        self.platforms = platforms
+        self.url_only = url_only
+        self._owner = owner
+        self._state: Optional[Tuple["RegistrySnapshot", HostIndex]] = None
+
+    def _get_state(self) -> Tuple[Dict[str, "CompiledPlatform"], HostIndex]:
+        """Return the compiled platforms and the host index of this view.
+
+        Both come from the same registry snapshot, and are replaced together
+        when the owner's registry changed.
+
+        Raises:
+            PlatformNotFoundError: If one of the platforms has been deleted.
+        """
+        registry = self._owner._registry
+        state = self._state
+        if state is None or state[0] is not registry:
+            for name in self.platforms:
+                if name not in registry.compiled:
+                    raise PlatformNotFoundError(f"Unknown platform: {name}")
+            state = self._state = (registry, registry.subset_index(self.platforms))
+        return registry.compiled, state[1]
+
+    def _get_index(self) -> HostIndex:
+        """Return the host index, rebuilding it if the registry changed."""
+        return self._get_state()[1]
+
+    def detect(self, url: str) -> Optional[str]:
+        """Detect the platform of a URL among this view's platforms.
+
+        Same as `SocialLinks.detect_platform()` with ``candidates``, without
+        the result cache.
+
+        Args:
+            url: The URL or username to analyze.
+
+        Returns:
+            The platform name, or None if none of the platforms matches.
+
+        Raises:
+            TypeError: If url is not a string.
+            PlatformNotFoundError: If one of the platforms has been deleted.
+        """
+        if not isinstance(url, str):
+            raise TypeError(f"url must be str, not {type(url).__name__}")
+        return self._owner._detect(url, self.url_only, self._get_index())
+
+    def parse(self, url: str) -> Optional[ParseResult]:
+        """Detect the platform of a URL and sanitize it in a single pass.
+
+        Same as `SocialLinks.parse()` with ``candidates``.
+
+        Args:
+            url: The URL or username to parse.
+
+        Returns:
+            A `ParseResult`, or None if none of the platforms matches.
+
+        Raises:
+            TypeError: If url is not a string.
+            PlatformNotFoundError: If one of the platforms has been deleted.
+            PlatformIDExtractionError: If a platform matches but the platform
+                identifier cannot be extracted from the URL.
+        """
+        if not isinstance(url, str):
+            raise TypeError(f"url must be str, not {type(url).__name__}")
+        compiled, index = self._get_state()
+        return self._owner._parse(url, compiled, index, self.url_only)
+
+    def detect_many(
+        self, urls: Iterable[str], *, lazy: bool = False
+    ) -> Union[List[Optional[str]], Iterator[Optional[str]]]:
+        """Detect the platform of many URLs, as `SocialLinks.detect_many()`.
+
+        Args:
+            urls: Iterable of URLs or usernames.
+            lazy: If True, return an iterator instead of a list.
+
+        Returns:
+            The detected platform name (or None) for each URL, in input order.
+        """
+        results = self._owner._iter_detect(urls, self._get_index(), self.url_only)
+        return results if lazy else list(results)
+
+    def parse_many(
+        self, urls: Iterable[str], *, lazy: bool = False
+    ) -> Union[List[ParseResult], Iterator[ParseResult]]:
+        """Parse many URLs, as `SocialLinks.parse_many()` without a platform.
+
+        Args:
+            urls: Iterable of URLs or usernames.
+            lazy: If True, return an iterator instead of a list.
+
+        Returns:
+            A `ParseResult` for each URL, in input order.
+        """
+        compiled, index = self._get_state()
+        results = self._owner._iter_parse(urls, compiled, index, self.url_only)
+        return results if lazy else list(results)
+
+    def __repr__(self) -> str:
+        return f"Detector({list(self.platforms)!r}, url_only={self.url_only})"
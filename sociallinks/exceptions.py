@@ -4,6 +4,8 @@ This module defines all custom exceptions used throughout the social-links
 library. All exceptions inherit from `SocialLinksError`, allowing
 you to catch all social-links related errors with a single exception handler.
 """
+from typing import Dict, Optional
+
 
 class SocialLinksError(Exception):
     """Base exception for all social-links errors.
@@ -56,8 +58,16 @@ class InvalidPlatformError(PlatformError):
     of dictionaries, each containing both `patterns` and `sanitized` keys.
     Entries missing either field are skipped, but at least one complete entry
     is required for the platform to be valid.
+
+    Attributes:
+        errors: When raised by `SocialLinks.set_platforms`, the error of
+            every invalid platform in the batch, by platform name. Empty
+            otherwise.
     """
-    pass
+
+    def __init__(self, message: str = "", errors: Optional[Dict[str, "InvalidPlatformError"]] = None):
+        super().__init__(message)
+        self.errors: Dict[str, "InvalidPlatformError"] = errors or {}
 
 
 class InvalidPlatformRegexError(InvalidPlatformError):
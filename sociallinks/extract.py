@@ -0,0 +1,148 @@
+"""Candidate URL scanner used to extract links from free text.
+
+Platform patterns are written for a single, already isolated URL: most of them
+end with ``/?$``. Running them over a whole document would be both wrong and
+slow, so `SocialLinks.iter_links` first cuts the text into candidate URLs with
+this module, in one linear pass, and only then matches each candidate through
+the host index.
+
+A candidate is a ``scheme://...`` run of characters up to the next whitespace,
+quote, backtick or angle bracket, with trailing punctuation and unbalanced
+closing brackets removed (``"see https://x.com/johndoe)."`` yields
+``https://x.com/johndoe``). Bare usernames are never extracted from text.
+
+Most URLs in scraped pages point to hosts no platform knows about (assets,
+trackers, ...). A prefilter regex built from the literal hosts of the
+registry (`sociallinks.index.HostIndex.prefilter`) lets the regex engine skip
+those in C, so Python only looks at candidates that may be profile links.
+"""
+import re
+from typing import Iterable, Iterator, Optional, Tuple, Union
+
+Candidate = Tuple[int, int, str]
+"""A candidate URL: start offset, end offset and the URL itself."""
+
+MAX_CARRY = 64 * 1024
+"""Maximum number of characters kept between chunks of a stream. A run of
+text longer than this without any delimiter is scanned as is, so memory use
+stays bounded whatever the input."""
+
+_DELIMITERS = " \t\n\r\f\v<>\"'`"
+_SCHEME_CHARS = frozenset("abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789+.-")
+_MAX_SCHEME = 32
+_TRAILING = ".,;:!?*'\""
+_BRACKETS = {")": "(", "]": "[", "}": "{"}
+_URL_TAIL = re.compile(r"[^\s<>\"'`]*")
+
+
+def _is_delimiter(c: str) -> bool:
+    """Return True if `c` ends a candidate URL, as `_URL_TAIL` does."""
+    return c.isspace() or c in _DELIMITERS
+
+
+def _trim(text: str, start: int, end: int) -> int:
+    """Return the end offset of a candidate without trailing punctuation."""
+    while end > start:
+        c = text[end - 1]
+        if c in _TRAILING:
+            end -= 1
+        elif c in _BRACKETS and text.count(_BRACKETS[c], start, end) < text.count(c, start, end):
+            end -= 1
+        else:
+            break
+    return end
+
+
+def find_candidates(
+    text: str, base: int = 0, prefilter: Optional["re.Pattern[str]"] = None
+) -> Iterator[Candidate]:
+    """Yield the candidate URLs in `text`.
+
+    Args:
+        text: Text to scan.
+        base: Offset added to every reported position.
+        prefilter: Optional regex matching the ``://`` of URLs worth
+            considering. Runs of text without a match are skipped; other
+            candidates are yielded exactly as without a prefilter.
+
+    Yields:
+        ``(start, end, url)`` tuples in text order.
+
+    Examples:
+        >>> list(find_candidates("Follow (https://x.com/johndoe)."))
+        [(8, 29, 'https://x.com/johndoe')]
+    """
+    find = text.find
+    tail = _URL_TAIL.match
+    search = prefilter.search if prefilter is not None else None
+    pos = 0
+    while True:
+        if search is None:
+            pos = find("://", pos)
+            if pos < 0:
+                return
+        else:
+            m = search(text, pos)
+            if m is None:
+                return
+            # Candidates start at the first "://" of a run of non-delimiters
+            lo = m.start()
+            while lo > pos and not _is_delimiter(text[lo - 1]):
+                lo -= 1
+            pos = find("://", lo)
+
+        start = pos
+        limit = max(pos - _MAX_SCHEME, 0)
+        while start > limit and text[start - 1] in _SCHEME_CHARS:
+            start -= 1
+        while start < pos and not text[start].isalpha():
+            start += 1
+
+        stop = tail(text, pos + 3).end()
+        if start < pos:
+            end = _trim(text, start, stop)
+            if end > pos + 3:
+                yield base + start, base + end, text[start:end]
+        pos = max(stop, pos + 3)
+
+
+def _last_delimiter(text: str) -> int:
+    """Return the offset of the last delimiter in `text`, or -1."""
+    return max(text.rfind(c) for c in _DELIMITERS)
+
+
+def iter_candidates(
+    source: Union[str, Iterable[str]], prefilter: Optional["re.Pattern[str]"] = None
+) -> Iterator[Candidate]:
+    """Yield the candidate URLs of a text or of a stream of text chunks.
+
+    Chunks can be split anywhere, including in the middle of a URL: text
+    after the last delimiter of a chunk is carried over to the next one, up
+    to `MAX_CARRY` characters. Offsets are relative to the whole stream.
+
+    Args:
+        source: A string, or an iterable of string chunks such as a text file
+            object.
+        prefilter: Optional prefilter regex (see `find_candidates`).
+
+    Yields:
+        ``(start, end, url)`` tuples in stream order.
+    """
+    if isinstance(source, str):
+        yield from find_candidates(source, 0, prefilter)
+        return
+
+    carry = ""
+    base = 0
+    for chunk in source:
+        if not isinstance(chunk, str):
+            raise TypeError(f"chunk must be str, not {type(chunk).__name__}")
+        text = carry + chunk if carry else chunk
+        cut = _last_delimiter(text) + 1
+        if len(text) - cut > MAX_CARRY:
+            cut = len(text)
+        yield from find_candidates(text[:cut], base, prefilter)
+        carry = text[cut:]
+        base += cut
+    if carry:
+        yield from find_candidates(carry, base, prefilter)
@@ -0,0 +1,184 @@
+"""Profile link harvesting from HTML documents.
+
+Regex-scanning raw HTML misses links hidden behind entities (``&#47;``,
+``&amp;``) and relative URLs, and reports links that only appear in comments
+or scripts. This module feeds the document, chunk by chunk, into
+`html.parser.HTMLParser` and only looks at the ``href`` attribute of ``<a>``,
+``<area>`` and ``<link>`` tags. Attribute values are unescaped by the parser
+and resolved against the document's base URL before being matched.
+
+Memory use does not depend on the document size: links are handed over after
+every chunk, and the text the parser holds while waiting for the end of a tag
+is capped at `MAX_PENDING` characters.
+"""
+import time
+from html.parser import HTMLParser
+from typing import Callable, Iterable, Iterator, List, NamedTuple, Optional, Tuple, Union
+from urllib.parse import urljoin
+
+from sociallinks.results import HtmlLink
+
+MatchedLink = Tuple[str, str, str]
+"""Platform name, identifier and sanitized URL of a matched link."""
+
+MAX_PENDING = 1024 * 1024
+"""Maximum number of characters the parser may hold while waiting for the
+end of a tag. Beyond that the pending text is dropped (see
+`HarvestStats.dropped`), so that a malformed document cannot exhaust memory."""
+
+_LINK_TAGS = frozenset({"a", "area", "link"})
+_URL_WHITESPACE = str.maketrans("", "", "\t\n\r")
+
+
+class HarvestStats(NamedTuple):
+    """Statistics about one harvested document.
+
+    Attributes:
+        chars: Number of characters read from the document.
+        hrefs: Number of ``href`` attributes inspected.
+        links: Number of profile links found.
+        dropped: Number of characters discarded because the parser could not
+            make progress within `MAX_PENDING` characters.
+        elapsed: Seconds spent parsing and matching, excluding time spent by
+            the consumer between links.
+    """
+
+    chars: int
+    hrefs: int
+    links: int
+    dropped: int
+    elapsed: float
+
+
+class _AnchorParser(HTMLParser):
+    """Collects the ``href`` of link tags, resolved against the base URL."""
+
+    def __init__(self, base_url: Optional[str]):
+        super().__init__(convert_charrefs=True)
+        self.base_url = base_url
+        self.base_seen = False
+        self.found: List[Tuple[Tuple[int, int], str]] = []
+
+    def handle_starttag(self, tag: str, attrs: List[Tuple[str, Optional[str]]]) -> None:
+        if tag not in _LINK_TAGS and tag != "base":
+            return
+        href = None
+        for name, value in attrs:
+            if name == "href":
+                href = value
+                break
+        if href is None:
+            return
+        # Browsers strip surrounding whitespace and drop tabs and newlines
+        href = href.strip().translate(_URL_WHITESPACE)
+
+        base = self.base_url
+        if tag == "base":
+            # Only the first <base href> counts
+            if not self.base_seen:
+                self.base_seen = True
+                self.base_url = urljoin(base, href) if base else href
+            return
+        if base and "://" not in href:
+            href = urljoin(base, href)
+        self.found.append((self.getpos(), href))
+
+
+class LinkHarvester:
+    """Iterator over the profile links of one HTML document.
+
+    Created by `SocialLinks.iter_html_links`. Links are yielded in document
+    order; `stats` is updated as the document is consumed and is final once
+    the iterator is exhausted.
+
+    Attributes:
+        done: True once the whole document has been read.
+
+    Args:
+        source: The document, or an iterable of text chunks.
+        base_url: URL the document was fetched from, used to resolve
+            relative links. A ``<base href>`` in the document takes
+            precedence, as in browsers.
+        match: Callable returning the platform, identifier and sanitized URL
+            of a link, or None if it is not a profile link.
+
+    Examples:
+        >>> sl = SocialLinks()
+        >>> harvester = sl.iter_html_links('<a href="/username">GitHub</a>', "https://github.com/about")
+        >>> [link.url for link in harvester]
+        ['https://github.com/username']
+        >>> harvester.stats.links
+        1
+    """
+
+    __slots__ = ("done", "_match", "_links", "_chars", "_hrefs", "_found", "_dropped", "_elapsed")
+
+    def __init__(
+        self,
+        source: Union[str, Iterable[str]],
+        base_url: Optional[str],
+        match: Callable[[str], Optional[MatchedLink]],
+    ):
+        if isinstance(source, (bytes, bytearray)):
+            raise TypeError(f"html must be str, not {type(source).__name__}")
+        self.done = False
+        self._match = match
+        self._chars = 0
+        self._hrefs = 0
+        self._found = 0
+        self._dropped = 0
+        self._elapsed = 0.0
+        self._links = self._harvest([source] if isinstance(source, str) else source, base_url)
+
+    @property
+    def stats(self) -> HarvestStats:
+        """Statistics about the document read so far."""
+        return HarvestStats(self._chars, self._hrefs, self._found, self._dropped, self._elapsed)
+
+    def __iter__(self) -> Iterator[HtmlLink]:
+        return self
+
+    def __next__(self) -> HtmlLink:
+        return next(self._links)
+
+    def _drain(self, parser: _AnchorParser) -> List[HtmlLink]:
+        """Match the hrefs collected by `parser` since the last call."""
+        found = parser.found
+        if not found:
+            return []
+        parser.found = []
+        self._hrefs += len(found)
+        match = self._match
+        links = []
+        for position, href in found:
+            matched = match(href)
+            if matched is not None:
+                links.append(HtmlLink(position, href, *matched))
+        self._found += len(links)
+        return links
+
+    def _harvest(self, chunks: Iterable[str], base_url: Optional[str]) -> Iterator[HtmlLink]:
+        clock = time.perf_counter
+        parser = _AnchorParser(base_url)
+        for chunk in chunks:
+            if not isinstance(chunk, str):
+                raise TypeError(f"chunk must be str, not {type(chunk).__name__}")
+            started = clock()
+            self._chars += len(chunk)
+            parser.feed(chunk)
+            pending = len(parser.rawdata)
+            if pending > MAX_PENDING:
+                self._dropped += pending
+                base_url, base_seen = parser.base_url, parser.base_seen
+                parser.reset()
+                parser.base_url, parser.base_seen = base_url, base_seen
+            links = self._drain(parser)
+            self._elapsed += clock() - started
+            yield from links
+
+        started = clock()
+        parser.close()
+        links = self._drain(parser)
+        self._elapsed += clock() - started
+        self.done = True
+        yield from links
@@ -0,0 +1,813 @@
+"""Host index used to speed up platform detection.
+
+Platform definitions are plain regex strings, so detection would normally have
+to run every registered pattern against every input. This module inspects each
+pattern source once, at compile time, and sorts it into one of four kinds:
+
+- ``HOST``: the pattern requires ``scheme://host`` and the host is known to end
+  with a literal such as ``linkedin.com`` or ``bsky.app``. These patterns are
+  bucketed by that literal host.
+- ``HANDLE``: the pattern is anchored at both ends and provably cannot match a
+  string containing ``://``, such as ``^u/{PROFILE_ID}$``.
+- ``BARE``: a ``HANDLE`` pattern that does not start with literal text, i.e. a
+  catch-all for bare usernames such as ``^{PROFILE_ID}$``. Detection can skip
+  these (see `HostIndex.candidates`).
+- ``OTHER``: anything the analysis cannot reason about. These patterns are
+  always evaluated, so custom platforms keep working unchanged.
+
+The analysis is conservative: a pattern is only put in a bucket when it cannot
+match an input whose host lies outside that bucket. `HostIndex.detect` is
+therefore guaranteed to return the same platform as a linear scan over all
+patterns in registry order.
+"""
+import re
+from operator import itemgetter
+from typing import Any, Dict, FrozenSet, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+HOST = "host"
+HANDLE = "handle"
+BARE = "bare"
+OTHER = "other"
+
+PatternKind = Tuple[str, Tuple[str, ...]]
+"""Classification of a single pattern: its kind and, for ``HOST``, its host keys."""
+
+IndexEntry = Tuple[int, str, int, "re.Pattern[str]"]
+"""An indexed pattern: registry-wide position, platform name, position within
+the platform's compiled patterns and the compiled pattern itself."""
+
+# Characters that decide whether a pattern can span a URL boundary. A space
+# stands in for any whitespace character.
+_PROBES = frozenset("/?#: ")
+_NO_PROBES: FrozenSet[str] = frozenset()
+_HOST_TERMINATORS = ("/", "?", "#")
+_HOST_CHARS = frozenset("abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789-.")
+
+_SCHEME_PREFIX = re.compile(r"\^?[A-Za-z][A-Za-z0-9\-]*?(?:s\?)?://")
+_QUANTIFIER = re.compile(r"\{\d*(?:,\d*)?\}")
+_URL_HOST = re.compile(r"[^/?#\s]*")
+
+# Token kinds produced by `_tokenize`.
+_ATOM = 0
+_OPEN = 1
+_CLOSE = 2
+_ALT = 3
+_QUANT = 4
+_BOL = 5
+_EOL = 6
+
+# (kind, literal character or None, probe characters it may match or None for "any")
+_Token = Tuple[int, Optional[str], Optional[FrozenSet[str]]]
+
+
+def _probe_chars(char: str) -> FrozenSet[str]:
+    """Return the probe characters a literal character stands for."""
+    if char.isspace():
+        return frozenset(" ")
+    if char in _PROBES:
+        return frozenset(char)
+    return _NO_PROBES
+
+
+def _class_chars(body: str) -> Optional[FrozenSet[str]]:
+    """Return the probe characters a ``[...]`` character class may match.
+
+    Args:
+        body: Class contents without the surrounding brackets.
+
+    Returns:
+        The matching probe characters, or None if the class is too complex to
+        reason about (negation, ``\\s``, hex escapes, non-ASCII ranges, ...).
+    """
+    if body.startswith("^"):
+        return None
+
+    chars = set()
+    i, n = 0, len(body)
+    while i < n:
+        c = body[i]
+        if c == "\\":
+            if i + 1 >= n:
+                return None
+            c = body[i + 1]
+            i += 2
+            if c in "dw":
+                continue
+            if c.isalnum():
+                return None
+        else:
+            i += 1
+
+        if i + 1 < n and body[i] == "-":
+            hi = body[i + 1]
+            i += 2
+            if hi == "\\":
+                if i >= n or body[i].isalnum():
+                    return None
+                hi = body[i]
+                i += 1
+            if not (c.isascii() and hi.isascii()):
+                return None
+            for probe in "/?#:\t\n\x0b\x0c\r ":
+                if c <= probe <= hi:
+                    chars |= _probe_chars(probe)
+        else:
+            chars |= _probe_chars(c)
+    return frozenset(chars)
+
+
+def _tokenize(source: str) -> Optional[List[_Token]]:
+    """Split a regex source into a flat token list.
+
+    Only the subset of regex syntax needed to reason about host names and
+    anchors is understood. Constructs that change how the rest of the pattern
+    is read (lookarounds, inline flags, conditionals) make the whole pattern
+    unsupported.
+
+    Args:
+        source: Regex pattern source.
+
+    Returns:
+        The token list, or None if the pattern uses unsupported syntax.
+    """
+    tokens: List[_Token] = []
+    i, n = 0, len(source)
+    while i < n:
+        c = source[i]
+        if c == "\\":
+            if i + 1 >= n:
+                return None
+            e = source[i + 1]
+            i += 2
+            if e in "dw":
+                tokens.append((_ATOM, None, _NO_PROBES))
+            elif e in "bB":
+                continue
+            elif e.isalnum():
+                # \s, \S, \W, \D, \A, \Z, escapes and backreferences
+                tokens.append((_ATOM, None, None))
+            else:
+                tokens.append((_ATOM, e, _probe_chars(e)))
+        elif c == "[":
+            j = i + 1
+            if j < n and source[j] == "^":
+                j += 1
+            if j < n and source[j] == "]":
+                j += 1
+            while j < n and source[j] != "]":
+                j += 2 if source[j] == "\\" else 1
+            if j >= n:
+                return None
+            tokens.append((_ATOM, None, _class_chars(source[i + 1:j])))
+            i = j + 1
+        elif c == "(":
+            if source.startswith("(?:", i):
+                i += 3
+            elif source.startswith("(?P<", i):
+                j = source.find(">", i)
+                if j < 0:
+                    return None
+                i = j + 1
+            elif source.startswith("(?", i):
+                return None
+            else:
+                i += 1
+            tokens.append((_OPEN, None, None))
+        elif c == ")":
+            tokens.append((_CLOSE, None, None))
+            i += 1
+        elif c == "|":
+            tokens.append((_ALT, None, None))
+            i += 1
+        elif c in "*+?":
+            i += 1
+            if i < n and source[i] in "?+":
+                i += 1
+            tokens.append((_QUANT, c, None))
+        elif c == "{" and _QUANTIFIER.match(source, i):
+            i = _QUANTIFIER.match(source, i).end()
+            if i < n and source[i] in "?+":
+                i += 1
+            tokens.append((_QUANT, "{", None))
+        elif c == "^":
+            tokens.append((_BOL, None, None))
+            i += 1
+        elif c == "$":
+            tokens.append((_EOL, None, None))
+            i += 1
+        elif c == ".":
+            tokens.append((_ATOM, None, None))
+            i += 1
+        else:
+            tokens.append((_ATOM, c, _probe_chars(c)))
+            i += 1
+    return tokens
+
+
+def _has_top_level_alternation(tokens: Sequence[_Token]) -> bool:
+    """Return True if the token list contains a ``|`` outside any group."""
+    depth = 0
+    for kind, _, _ in tokens:
+        if kind == _OPEN:
+            depth += 1
+        elif kind == _CLOSE:
+            depth -= 1
+        elif kind == _ALT and depth == 0:
+            return True
+    return False
+
+
+def _may_match(tokens: Sequence[_Token], probes: str) -> bool:
+    """Return True if any atom in `tokens` may match one of `probes`."""
+    for kind, _, chars in tokens:
+        if kind == _ATOM and (chars is None or any(p in chars for p in probes)):
+            return True
+    return False
+
+
+def _starts_at_label(prefix: Sequence[_Token]) -> Optional[bool]:
+    """Return True if whatever `prefix` matches leaves us at a host label start.
+
+    Holds for an empty prefix (the literal directly follows ``://``) and for
+    one optional group whose alternatives all end in a dot, such as
+    ``(www\\.)?``, ``([a-z]{2,3}\\.)?`` or ``(m\\.|mobile\\.)?``.
+
+    Returns:
+        True if the prefix ends at a label start, None for an optional group
+        with an alternative that may end inside a label, as ``a`` in
+        ``(a|b\\.)?``, and False otherwise.
+    """
+    if not prefix:
+        return True
+    if len(prefix) < 4 or prefix[0][0] != _OPEN or prefix[-2][0] != _CLOSE:
+        return False
+    if prefix[-1][0] != _QUANT or prefix[-1][1] != "?":
+        return False
+    depth = 0
+    ends = []
+    last: Optional[_Token] = None
+    for token in prefix[1:-2]:
+        kind = token[0]
+        if kind == _OPEN:
+            depth += 1
+        elif kind == _CLOSE:
+            depth -= 1
+            if depth < 0:
+                return False
+        elif kind == _ALT and depth == 0:
+            ends.append(last)
+            last = None
+            continue
+        last = token
+    ends.append(last)
+    aligned = [end is not None and end[0] == _ATOM and end[1] == "." for end in ends]
+    if all(aligned):
+        return True
+    return None if len(ends) > 1 else False
+
+
+def _host_key(literal: str, at_label: bool) -> Optional[str]:
+    """Turn the literal end of a host into an index key.
+
+    Args:
+        literal: Literal characters the host is known to end with.
+        at_label: Whether `literal` is known to start at a label boundary.
+
+    Returns:
+        The lowercased key, or None if no label-aligned key can be derived.
+    """
+    literal = literal.lower()
+    if literal.startswith("."):
+        key = literal[1:]
+    elif at_label:
+        key = literal
+    elif "." in literal:
+        key = literal.split(".", 1)[1]
+    else:
+        return None
+    if not key or not all(key.split(".")):
+        return None
+    return key
+
+
+def _host_keys(host: Sequence[_Token]) -> Optional[Tuple[str, ...]]:
+    """Derive the index keys for the host part of a URL pattern.
+
+    Args:
+        host: Tokens between ``://`` and the end of the host.
+
+    Returns:
+        The host keys, or None if the host does not end with a literal.
+    """
+    j = len(host)
+    while j and host[j - 1][0] == _ATOM and host[j - 1][1] in _HOST_CHARS:
+        j -= 1
+    if j < len(host):
+        literal = "".join(token[1] for token in host[j:])  # type: ignore[misc]
+        at_label = _starts_at_label(host[:j])
+        if at_label is None:
+            return None
+        key = _host_key(literal, at_label)
+        return (key,) if key else None
+
+    # Host ends with a group of literal alternatives, e.g. (t\.me|telegram\.me)
+    if not host or host[-1][0] != _CLOSE:
+        return None
+    start = len(host) - 2
+    while start >= 0 and host[start][0] != _OPEN:
+        if host[start][0] == _ALT or (host[start][0] == _ATOM and host[start][1] in _HOST_CHARS):
+            start -= 1
+        else:
+            return None
+    if start < 0:
+        return None
+
+    at_label = _starts_at_label(host[:start])
+    if at_label is None:
+        return None
+    keys = []
+    literal = ""
+    for kind, char, _ in host[start + 1:-1]:
+        if kind == _ALT:
+            keys.append(_host_key(literal, at_label))
+            literal = ""
+        else:
+            literal += char  # type: ignore[operator]
+    keys.append(_host_key(literal, at_label))
+    if not all(keys):
+        return None
+    return tuple(dict.fromkeys(keys))  # type: ignore[arg-type]
+
+
+def classify_pattern(source: str, flags: int = 0) -> PatternKind:
+    """Classify a platform pattern for the host index.
+
+    Args:
+        source: Regex pattern source.
+        flags: Regex flags the pattern is compiled with.
+
+    Returns:
+        A ``(kind, keys)`` tuple where `kind` is one of `HOST`, `HANDLE`,
+        `BARE` or `OTHER` and `keys` holds the lowercased host keys for `HOST`
+        patterns.
+
+    Examples:
+        >>> classify_pattern(r"https?://(www\\.)?github\\.com/(?P<id>\\w+)/?$")
+        ('host', ('github.com',))
+        >>> classify_pattern(r"^u/(?P<id>[A-Za-z0-9_.-]+)$")
+        ('handle', ())
+        >>> classify_pattern(r"^(?P<id>[A-Za-z0-9_.-]+)$")
+        ('bare', ())
+    """
+    if flags & re.VERBOSE:
+        return OTHER, ()
+
+    scheme = _SCHEME_PREFIX.match(source)
+    if scheme:
+        tokens = _tokenize(source[scheme.end():])
+        if tokens is None or _has_top_level_alternation(tokens):
+            return OTHER, ()
+
+        depth = 0
+        for pos, (kind, char, _) in enumerate(tokens):
+            if kind == _OPEN:
+                depth += 1
+            elif kind == _CLOSE:
+                depth -= 1
+            elif depth == 0 and (kind == _EOL or (kind == _ATOM and char in _HOST_TERMINATORS)):
+                break
+        else:
+            return OTHER, ()
+
+        rest = tokens[pos + 1:]
+        if rest and rest[0][0] == _QUANT:
+            # An optional terminator such as "/?" only counts when the pattern ends there
+            if rest[0][1] not in "?*" or len(rest) < 2 or rest[1][0] != _EOL:
+                return OTHER, ()
+
+        host = tokens[:pos]
+        if any(kind in (_BOL, _EOL) for kind, _, _ in host) or _may_match(host, "/?# "):
+            return OTHER, ()
+        keys = _host_keys(host)
+        return (HOST, keys) if keys else (OTHER, ())
+
+    if flags & re.MULTILINE:
+        return OTHER, ()
+    tokens = _tokenize(source)
+    if (
+        tokens is None
+        or len(tokens) < 2
+        or tokens[0][0] != _BOL
+        or tokens[-1][0] != _EOL
+        or _has_top_level_alternation(tokens)
+    ):
+        return OTHER, ()
+    if _may_match(tokens, ":") and _may_match(tokens, "/"):
+        return OTHER, ()
+    first = tokens[1]
+    if first[0] == _ATOM and first[1] is not None and tokens[2][0] != _QUANT:
+        return HANDLE, ()
+    return BARE, ()
+
+
+def is_start_anchored(source: str, flags: int = 0) -> bool:
+    """Return True if a pattern can only match at the start of the input.
+
+    Args:
+        source: Regex pattern source.
+        flags: Regex flags the pattern is compiled with.
+
+    Examples:
+        >>> is_start_anchored(r"^(?P<id>\\w+)$")
+        True
+        >>> is_start_anchored(r"https?://github\\.com/(?P<id>\\w+)")
+        False
+    """
+    if flags & (re.MULTILINE | re.VERBOSE):
+        return False
+    tokens = _tokenize(source)
+    return bool(tokens) and tokens[0][0] == _BOL and not _has_top_level_alternation(tokens)  # type: ignore[index]
+
+
+def literal_prefix(source: str, flags: int = 0) -> str:
+    """Return the literal text every match of a pattern starts with.
+
+    Args:
+        source: Regex pattern source.
+        flags: Regex flags the pattern is compiled with.
+
+    Returns:
+        The literal prefix, unescaped, or an empty string if the pattern has
+        none. Under `re.IGNORECASE` the prefix matches case-insensitively.
+
+    Examples:
+        >>> literal_prefix(r"https?://(www\\.)?github\\.com/(?P<id>\\w+)")
+        'http'
+        >>> literal_prefix(r"^(?P<id>\\w+)$")
+        ''
+    """
+    if flags & re.VERBOSE:
+        return ""
+    tokens = _tokenize(source)
+    if not tokens or _has_top_level_alternation(tokens):
+        return ""
+    prefix = []
+    for pos, (kind, char, _) in enumerate(tokens):
+        if kind != _ATOM or char is None:
+            break
+        if pos + 1 < len(tokens) and tokens[pos + 1][0] == _QUANT:
+            break
+        prefix.append(char)
+    return "".join(prefix)
+
+
+def url_hosts(url: str) -> Optional[List[str]]:
+    """Return the lowercased host that follows every ``://`` in `url`.
+
+    Args:
+        url: Input string containing at least one ``://``.
+
+    Returns:
+        The hosts in order of appearance, or None if any host contains
+        non-ASCII characters (whose case folding the index does not model).
+    """
+    hosts = []
+    for part in url.split("://")[1:]:
+        host = _URL_HOST.match(part).group()  # type: ignore[union-attr]
+        if not host.isascii():
+            return None
+        hosts.append(host.lower())
+    return hosts
+
+
+_UNSET = object()
+
+# Host characters as seen by `url_hosts`, minus ":" so that a run of "://"
+# cannot make the prefilter rescan the same text
+_PREFILTER_HOST = r"[^/?#:\s<>\"'`]"
+
+
+def _trie_source(words: Iterable[str]) -> str:
+    """Return a regex source matching exactly `words`, factored as a trie.
+
+    The regex engine tries alternatives one by one, so sharing prefixes
+    keeps the number of alternatives tried per position small.
+    """
+    trie: Dict[str, dict] = {}
+    for word in words:
+        node = trie
+        for c in word:
+            node = node.setdefault(c, {})
+        node[""] = {}
+
+    def emit(node: Dict[str, dict]) -> str:
+        alts = [re.escape(c) + emit(child) for c, child in sorted(node.items()) if c]
+        if not alts:
+            return ""
+        source = alts[0] if len(alts) == 1 else "(?:" + "|".join(alts) + ")"
+        if "" in node:
+            source = f"(?:{alts[0]})?" if len(alts) == 1 else source + "?"
+        return source
+
+    return emit(trie) if trie else "(?!)"
+
+
+def _build_prefilter(hosts: Iterable[str]) -> "re.Pattern[str]":
+    """Compile the `HostIndex.prefilter` regex for the given host keys."""
+    keys = _trie_source(hosts)
+    return re.compile(
+        rf"://(?:{_PREFILTER_HOST}*\.)?{keys}(?=[.,;:!?*)\]}}]*(?:[/?#\s<>\"'`]|\Z))"
+        rf"|://{_PREFILTER_HOST}*[^\x00-\x7f]",
+        re.IGNORECASE,
+    )
+
+
+class HostIndex:
+    """Candidate lookup table for `SocialLinks.detect_platform`.
+
+    The index is an immutable view over the compiled patterns of a registry.
+    It is rebuilt whenever the registry changes.
+
+    Args:
+        platforms: ``(name, [(pattern, kind), ...])`` pairs in registry order.
+    """
+
+    __slots__ = ("_hosts", "_others", "_urls", "_plain", "_handles", "_prefilter")
+
+    def __init__(
+        self,
+        platforms: Iterable[Tuple[str, Sequence[Tuple["re.Pattern[str]", PatternKind]]]],
+    ):
+        self._hosts: Dict[str, List[IndexEntry]] = {}
+        self._others: List[IndexEntry] = []
+        self._urls: List[IndexEntry] = []
+        self._plain: List[IndexEntry] = []
+        self._handles: List[IndexEntry] = []
+        self._prefilter: Any = _UNSET
+
+        order = 0
+        for name, patterns in platforms:
+            for pos, (pattern, (kind, keys)) in enumerate(patterns):
+                entry = (order, name, pos, pattern)
+                order += 1
+                if kind == HOST:
+                    for key in keys:
+                        self._hosts.setdefault(key, []).append(entry)
+                    self._urls.append(entry)
+                elif kind == BARE:
+                    self._plain.append(entry)
+                elif kind == HANDLE:
+                    self._plain.append(entry)
+                    self._handles.append(entry)
+                else:
+                    self._others.append(entry)
+                    self._urls.append(entry)
+                    self._plain.append(entry)
+                    self._handles.append(entry)
+
+    def candidates(self, url: str, url_only: bool = False) -> Sequence[IndexEntry]:
+        """Return the patterns that may match `url`, in registry order.
+
+        Args:
+            url: Stripped, non-empty input string.
+            url_only: If True, leave out `BARE` patterns. They cannot match
+                an input containing ``://`` anyway, so this only changes the
+                result for inputs without one.
+
+        Returns:
+            Index entries sorted by their registry position. The sequence
+            may be one of the index's own lists and must not be modified.
+        """
+        if "://" not in url:
+            return self._handles if url_only else self._plain
+
+        hosts = url_hosts(url)
+        if hosts is None:
+            return self._urls
+
+        found: List[IndexEntry] = []
+        buckets = 0
+        for host in hosts:
+            while True:
+                bucket = self._hosts.get(host)
+                if bucket:
+                    found = bucket if not buckets else found + bucket
+                    buckets += 1
+                dot = host.find(".")
+                if dot < 0:
+                    break
+                host = host[dot + 1:]
+
+        if self._others:
+            found = self._others if not buckets else found + self._others
+            buckets += 1
+        if buckets > 1:
+            found = sorted(dict.fromkeys(found), key=itemgetter(0))
+        return found
+
+    @property
+    def prefilter(self) -> Optional["re.Pattern[str]"]:
+        """Regex locating the ``://`` of URLs whose host is in the index.
+
+        Used to scan text for profile links in a single pass: every ``://``
+        followed by a host that `candidates` may return patterns for is
+        matched (a superset: trailing punctuation is tolerated, non-ASCII
+        hosts are always matched), and every other ``://`` is skipped by the
+        regex engine. Built on first access.
+
+        Returns:
+            The compiled prefilter, or None if the index has `OTHER`
+            patterns and every URL must be considered.
+        """
+        prefilter = self._prefilter
+        if prefilter is _UNSET:
+            prefilter = self._prefilter = _build_prefilter(self._hosts) if not self._others else None
+        return prefilter
+
+    def detect(self, url: str, url_only: bool = False) -> Optional[str]:
+        """Return the first platform whose patterns match `url`.
+
+        Args:
+            url: Stripped, non-empty input string.
+            url_only: If True, skip `BARE` patterns.
+
+        Returns:
+            The platform name, or None if nothing matches.
+        """
+        for _, name, _, pattern in self.candidates(url, url_only):
+            if pattern.search(url):
+                return name
+        return None
+
+    def match(self, url: str, url_only: bool = False) -> Optional[Tuple[str, int, "re.Match[str]"]]:
+        """Return the first pattern match for `url`.
+
+        Args:
+            url: Stripped, non-empty input string.
+            url_only: If True, skip `BARE` patterns.
+
+        Returns:
+            A ``(platform name, pattern position, match)`` tuple, where the
+            position indexes the platform's compiled patterns, or None if
+            nothing matches.
+        """
+        for _, name, pos, pattern in self.candidates(url, url_only):
+            m = pattern.search(url)
+            if m:
+                return name, pos, m
+        return None
+
+
+REORDER_INTERVAL = 4096
+"""Default number of matches between two reorderings of an `AdaptiveIndex`."""
+
+
+def _anchored_shape(source: str) -> Tuple[str, Optional[FrozenSet[str]]]:
+    """Describe a ``HANDLE`` or ``BARE`` pattern for `AdaptiveIndex`.
+
+    Returns:
+        The lowercased literal text every match starts with, and the probe
+        characters the pattern may match anywhere, or None if it may match
+        any character.
+    """
+    tokens = _tokenize(source) or []
+    chars: Optional[FrozenSet[str]] = frozenset()
+    for kind, _, probes in tokens:
+        if kind == _ATOM:
+            if probes is None:
+                chars = None
+                break
+            chars = chars | probes  # type: ignore[operator]
+    return literal_prefix(source[1:]).lower(), chars
+
+
+def _excludes(prefix: str, chars: Optional[FrozenSet[str]]) -> bool:
+    """Return True if a pattern matching only `chars` cannot match `prefix`."""
+    return chars is not None and any(_probe_chars(c) and not _probe_chars(c) & chars for c in prefix)
+
+
+class AdaptiveIndex(HostIndex):
+    """A `HostIndex` that tries the most frequently matching patterns first.
+
+    Matches are counted per pattern, and every `interval` matches each
+    candidate list is reordered by descending hit count. Reordering is
+    constrained so that it never changes which platform wins: a pattern only
+    moves ahead of patterns that are independent of it, that is
+
+    - patterns of the same platform and configuration entry, or
+    - anchored patterns (``HANDLE`` and ``BARE``) that provably cannot match
+      the same input: their literal prefixes diverge, as for ``^u/...`` and
+      ``^spotify:artist:...``, or one starts with a character such as ``/``
+      or ``:`` that the other cannot match anywhere, as for ``^u/...`` and
+      the catch-all ``^[A-Za-z0-9_.-]+$``.
+
+    Bare-username catch-alls overlap each other, so they are never
+    reordered between platforms: a plain username is still attributed to
+    the first platform registered with a matching pattern. Neither are URL
+    patterns of different platforms sharing a host bucket, nor patterns the
+    index cannot classify. Patterns of one platform but different
+    configuration entries do not swap either, so the entry and sanitized
+    URL of a result stay the same. The only observable change is which
+    pattern of the winning entry reports the match, and only for inputs
+    matched by several of its patterns.
+
+    Candidate lists merged from several host buckets are still returned in
+    registry order.
+
+    Between reorderings, the per-call cost is one counter update per match.
+    Reordering is deterministic: ties keep registry order.
+
+    Args:
+        platforms: ``(name, [(pattern, kind), ...])`` pairs in registry order.
+        interval: Number of matches between two reorderings.
+        entries: Configuration entry index of each pattern, by platform name
+            and pattern position. If None, all patterns of a platform are
+            treated as one entry.
+    """
+
+    __slots__ = ("interval", "_hits", "_countdown", "_shapes", "_entries")
+
+    def __init__(
+        self,
+        platforms: Iterable[Tuple[str, Sequence[Tuple["re.Pattern[str]", PatternKind]]]],
+        interval: int = REORDER_INTERVAL,
+        entries: Optional[Mapping[str, Sequence[int]]] = None,
+    ):
+        if interval <= 0:
+            raise ValueError("interval must be positive")
+        super().__init__(platforms)
+        self.interval = interval
+        self._countdown = interval
+        ordered = sorted(set(self._urls) | set(self._plain), key=itemgetter(0))
+        self._hits = [0] * len(ordered)
+        anchored = set(self._plain) - set(self._others)
+        self._shapes = [_anchored_shape(entry[3].pattern) if entry in anchored else None for entry in ordered]
+        self._entries = [entries[name][pos] for _, name, pos, _ in ordered] if entries is not None else None
+
+    @property
+    def hits(self) -> Dict[Tuple[str, int], int]:
+        """Matches counted so far, by ``(platform name, pattern position)``."""
+        entries = sorted(set(self._urls) | set(self._plain), key=itemgetter(0))
+        return {(name, pos): self._hits[order] for order, name, pos, _ in entries}
+
+    def _independent(self, a: IndexEntry, b: IndexEntry) -> bool:
+        """Return True if `a` and `b` may swap without changing the winner."""
+        if a[1] == b[1] and (self._entries is None or self._entries[a[0]] == self._entries[b[0]]):
+            return True
+        shape_a, shape_b = self._shapes[a[0]], self._shapes[b[0]]
+        if shape_a is None or shape_b is None:
+            return False
+        (p, chars_a), (q, chars_b) = shape_a, shape_b
+        if p and q and not (p.startswith(q) or q.startswith(p)):
+            return True
+        return _excludes(p, chars_b) or _excludes(q, chars_a)
+
+    def _sorted(self, entries: List[IndexEntry]) -> List[IndexEntry]:
+        """Return `entries` sorted by descending hits, within the constraints.
+
+        An insertion sort: each entry moves back past entries with fewer
+        hits, and stops at the first one it is not independent of.
+        """
+        hits = self._hits
+        result: List[IndexEntry] = []
+        for entry in sorted(entries, key=itemgetter(0)):
+            score = hits[entry[0]]
+            i = len(result)
+            while i and hits[result[i - 1][0]] < score and self._independent(entry, result[i - 1]):
+                i -= 1
+            result.insert(i, entry)
+        return result
+
+    def reorder(self) -> None:
+        """Reorder every candidate list by the hit counts so far.
+
+        Called automatically every `interval` matches. The new lists replace
+        the old ones in single assignments, so concurrent lookups see either.
+        """
+        self._countdown = self.interval
+        self._hosts = {key: self._sorted(bucket) for key, bucket in self._hosts.items()}
+        self._others = self._sorted(self._others)
+        self._urls = self._sorted(self._urls)
+        self._plain = self._sorted(self._plain)
+        self._handles = self._sorted(self._handles)
+
+    def _hit(self, order: int) -> None:
+        self._hits[order] += 1
+        self._countdown -= 1
+        if self._countdown <= 0:
+            self.reorder()
+
+    def detect(self, url: str, url_only: bool = False) -> Optional[str]:
+        for order, name, _, pattern in self.candidates(url, url_only):
+            if pattern.search(url):
+                self._hit(order)
+                return name
+        return None
+
+    def match(self, url: str, url_only: bool = False) -> Optional[Tuple[str, int, "re.Match[str]"]]:
+        for order, name, pos, pattern in self.candidates(url, url_only):
+            m = pattern.search(url)
+            if m:
+                self._hit(order)
+                return name, pos, m
+        return None
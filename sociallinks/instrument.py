@@ -0,0 +1,243 @@
+"""Opt-in per-pattern instrumentation.
+
+`SocialLinks.enable_instrumentation` swaps the host index of an instance for
+one whose patterns are wrapped in `InstrumentedPattern`. Each wrapper counts
+how often its pattern is evaluated and how often it matches, and times one
+evaluation out of every `sample_every`, so the cost of the clock calls stays
+low. The index used when instrumentation is disabled is left untouched and
+pays nothing.
+
+Detection, `parse()`, the batch methods and link extraction are recorded
+through the host index. `is_valid()`, `sanitize()` and batches with a fixed
+platform normally run one combined regex per platform; while instrumentation
+is enabled they try the wrapped patterns one by one instead, so every
+evaluation is recorded against its own pattern. Results served from the
+result cache evaluate no pattern at all.
+
+Counters are updated without locking: under concurrent use a few updates
+may be lost, which is acceptable for statistics.
+"""
+import re
+from time import perf_counter
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from sociallinks.backend import LinearMatcher
+from sociallinks.index import HostIndex
+
+if TYPE_CHECKING:
+    from sociallinks.registry import CompiledPlatform
+
+SAMPLE_EVERY = 64
+"""Default timing sample interval: one evaluation out of this many is timed."""
+
+_PROMETHEUS_METRICS = (
+    ("evaluations_total", "counter", "Number of times the pattern was evaluated.", "evaluations"),
+    ("hits_total", "counter", "Number of evaluations that matched.", "hits"),
+    ("sampled_evaluations_total", "counter", "Number of evaluations that were timed.", "samples"),
+    ("sampled_seconds_total", "counter", "Time spent in timed evaluations.", "sampled_seconds"),
+    # Extrapolated from samples, so it may decrease between scrapes: a gauge, not a counter
+    ("estimated_seconds", "gauge", "Estimated time spent in all evaluations, extrapolated from samples.", "estimated_seconds"),
+)
+
+
+class PatternStats:
+    """Counters of a single pattern.
+
+    Attributes:
+        platform: Platform name.
+        position: Position of the pattern among the platform's patterns.
+        pattern: Regex source.
+        evaluations: Number of times the pattern was evaluated.
+        hits: Number of evaluations that matched.
+        samples: Number of evaluations that were timed.
+        sampled_seconds: Total time of the timed evaluations.
+    """
+
+    __slots__ = ("platform", "position", "pattern", "evaluations", "hits", "samples", "sampled_seconds")
+
+    def __init__(self, platform: str, position: int, pattern: str):
+        self.platform = platform
+        self.position = position
+        self.pattern = pattern
+        self.evaluations = 0
+        self.hits = 0
+        self.samples = 0
+        self.sampled_seconds = 0.0
+
+    @property
+    def estimated_seconds(self) -> float:
+        """Estimated time spent in all evaluations, extrapolated from samples."""
+        if not self.samples:
+            return 0.0
+        return self.sampled_seconds / self.samples * self.evaluations
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the counters as a dictionary."""
+        return {
+            "position": self.position,
+            "pattern": self.pattern,
+            "evaluations": self.evaluations,
+            "hits": self.hits,
+            "samples": self.samples,
+            "sampled_seconds": self.sampled_seconds,
+            "estimated_seconds": self.estimated_seconds,
+        }
+
+
+class InstrumentedPattern:
+    """A compiled pattern whose `search` updates a `PatternStats`.
+
+    Other attributes are forwarded to the wrapped pattern.
+
+    Args:
+        pattern: Compiled pattern, or `sociallinks.registry.LazyPattern`.
+        stats: Counters to update.
+        sample_every: Time one evaluation out of this many.
+    """
+
+    __slots__ = ("_pattern", "_stats", "_sample_every")
+
+    def __init__(self, pattern: Any, stats: PatternStats, sample_every: int):
+        self._pattern = pattern
+        self._stats = stats
+        self._sample_every = sample_every
+
+    def search(self, string: str, *args: Any) -> Optional["re.Match[str]"]:
+        stats = self._stats
+        count = stats.evaluations
+        stats.evaluations = count + 1
+        if count % self._sample_every:
+            m = self._pattern.search(string, *args)
+        else:
+            start = perf_counter()
+            m = self._pattern.search(string, *args)
+            stats.sampled_seconds += perf_counter() - start
+            stats.samples += 1
+        if m is not None:
+            stats.hits += 1
+        return m
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._pattern, name)
+
+    def __repr__(self) -> str:
+        return f"InstrumentedPattern({self._pattern!r})"
+
+
+def _escape_label(value: str) -> str:
+    """Escape a Prometheus label value."""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class Instrumentation:
+    """Per-pattern counters of a `SocialLinks` instance.
+
+    Counters are keyed by platform name, position and regex source, so they
+    survive registry changes that keep a pattern in place, and start from
+    zero for patterns that are added, edited or moved. Identical patterns of
+    a platform have counters of their own. Every pattern of the registry is listed as soon
+    as the host index is built, including patterns that never run.
+
+    Attributes:
+        sample_every: Timing sample interval.
+
+    Examples:
+        >>> sl = SocialLinks()
+        >>> stats = sl.enable_instrumentation(sample_every=1)
+        >>> sl.detect_platform("https://github.com/username")
+        'github'
+        >>> [p["hits"] for p in stats.as_dict()["platforms"]["github"]]
+        [1, 0]
+    """
+
+    def __init__(self, sample_every: int = SAMPLE_EVERY):
+        if sample_every <= 0:
+            raise ValueError("sample_every must be positive")
+        self.sample_every = sample_every
+        self._stats: Dict[Tuple[str, int, str], PatternStats] = {}
+
+    def _wrap(self, name: str, position: int, pattern: Any) -> InstrumentedPattern:
+        """Wrap a pattern, sharing counters with earlier wrappers of it."""
+        key = (name, position, pattern.pattern)
+        stats = self._stats.get(key)
+        if stats is None:
+            stats = self._stats.setdefault(key, PatternStats(name, position, pattern.pattern))
+        return InstrumentedPattern(pattern, stats, self.sample_every)
+
+    def build_index(
+        self, platforms: Iterable[Tuple[str, "CompiledPlatform"]], index_class: Callable[..., Any] = HostIndex
+    ) -> Any:
+        """Build a host index whose patterns update these counters.
+
+        Args:
+            platforms: ``(name, compiled platform)`` pairs in registry order.
+            index_class: `HostIndex`, a subclass such as
+                `sociallinks.index.AdaptiveIndex`, or the index class of
+                another matcher backend (see `sociallinks.backend`).
+        """
+        wrap = self._wrap
+        return index_class(
+            (name, [(wrap(name, pos, pattern), kind) for pos, (pattern, kind) in enumerate(zip(compiled.patterns(), compiled.kinds))])
+            for name, compiled in platforms
+        )
+
+    def platform_matcher(self, name: str, platform: "CompiledPlatform") -> LinearMatcher:
+        """Build a single-platform matcher whose patterns update these counters.
+
+        The patterns are tried one by one, as by the reference backend,
+        instead of as one combined regex.
+        """
+        return LinearMatcher([self._wrap(name, pos, pattern) for pos, pattern in enumerate(platform.patterns())])
+
+    def patterns(self) -> List[PatternStats]:
+        """Return the counters of every pattern, by platform and position."""
+        return sorted(self._stats.values(), key=lambda s: (s.platform, s.position, s.pattern))
+
+    def reset(self) -> None:
+        """Set every counter back to zero."""
+        for stats in self._stats.values():
+            stats.evaluations = stats.hits = stats.samples = 0
+            stats.sampled_seconds = 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Export the counters as a JSON-serializable dictionary.
+
+        Returns:
+            ``{"sample_every": int, "platforms": {name: [pattern, ...]}}``
+            where each pattern is a dictionary with its position, regex
+            source, evaluation, hit and sample counts, sampled time and
+            estimated total time in seconds.
+        """
+        platforms: Dict[str, List[Dict[str, Any]]] = {}
+        for stats in self.patterns():
+            platforms.setdefault(stats.platform, []).append(stats.as_dict())
+        return {"sample_every": self.sample_every, "platforms": platforms}
+
+    def to_prometheus(self, prefix: str = "sociallinks_pattern") -> str:
+        """Export the counters in the Prometheus text exposition format.
+
+        Every metric is labelled with ``platform``, ``position`` and
+        ``regex``.
+
+        Args:
+            prefix: Metric name prefix.
+
+        Returns:
+            The exposition text, ending with a newline.
+        """
+        patterns = self.patterns()
+        labels = [
+            f'platform="{_escape_label(s.platform)}",position="{s.position}",regex="{_escape_label(s.pattern)}"'
+            for s in patterns
+        ]
+        lines = []
+        for suffix, kind, help_text, attr in _PROMETHEUS_METRICS:
+            name = f"{prefix}_{suffix}"
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+            for stats, label in zip(patterns, labels):
+                lines.append(f"{name}{{{label}}} {getattr(stats, attr)!r}")
+        return "\n".join(lines) + "\n"
+
+    def __repr__(self) -> str:
+        return f"Instrumentation(sample_every={self.sample_every}, patterns={len(self._stats)})"
@@ -0,0 +1,506 @@
+"""Combined per-platform regex used by `is_valid` and `sanitize`.
+
+A platform is defined by several patterns, and the reference behavior of
+`SocialLinks.sanitize` is to try them one after another and use the first
+one that matches anywhere in the input. `PlatformMatcher` compiles all the
+patterns of a platform into a single alternation instead:
+
+- each pattern becomes one capturing group, so the configuration entry of a
+  match is found from `re.Match.lastindex` without trying the other patterns;
+- named groups are turned into plain groups and the position of the ``id``
+  group is resolved up front, so extracting the identifier needs no
+  ``groupdict()`` call;
+- consecutive patterns starting with the same literal text, such as
+  ``https?://``, share that prefix, which keeps the regex engine from
+  re-entering every alternative at every input position.
+
+An alternation prefers the leftmost match, while the reference loop prefers
+the first pattern. The two only differ when an earlier pattern also matches
+further right in the input; a small guard regex detects this case and falls
+back to the reference loop, so results are always identical. Patterns using
+syntax the combination cannot preserve (backreferences, conditionals, global
+inline flags, `re.VERBOSE`) also use the reference loop.
+"""
+import re
+from typing import Any, List, Optional, Sequence, Tuple
+
+from sociallinks.index import is_start_anchored, literal_prefix
+
+# Characters a shared prefix may consist of; "?" is only accepted as a quantifier.
+_PREFIX_CHARS = frozenset("abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789:/-")
+
+# (entry position, combined "id" group or 0, first and last combined group + 1, guard)
+_Alternative = Tuple[int, int, int, int, Optional["re.Pattern[str]"]]
+
+MatcherState = Tuple[
+    Optional[str],
+    List[Optional[Tuple[int, int, int, int, Optional[str]]]],
+    Optional[str],
+    List[Optional[Tuple[int, int, int, int, Optional[str]]]],
+]
+"""Serialized combined regexes of a `PlatformMatcher`: the ``start`` source
+and table, then the ``rest`` source and table, with guards as sources."""
+
+
+def extract_id(match: "re.Match[str]") -> Optional[str]:
+    """Extract the platform identifier from a match of a single pattern.
+
+    Uses the named group "id", or falls back to the first non-empty capturing
+    group.
+
+    Args:
+        match: Regex match object.
+
+    Returns:
+        Extracted identifier string, or None if not found.
+    """
+    if "id" in match.groupdict() and match.group("id"):
+        return match.group("id")
+
+    for g in match.groups():
+        if g:
+            return g
+    return None
+
+
+def _strip_group_names(source: str) -> Optional[Tuple[str, int, int]]:
+    """Rewrite a pattern so that it can be embedded in a larger alternation.
+
+    Named groups become plain capturing groups, which keeps the group
+    numbering unchanged.
+
+    Args:
+        source: Regex pattern source.
+
+    Returns:
+        A ``(source, group count, id group)`` tuple, where `id group` is the
+        number of the group named "id" or 0. None if the pattern uses syntax
+        that depends on its own group numbering or on being the whole regex.
+    """
+    out: List[str] = []
+    groups = 0
+    id_group = 0
+    i, n = 0, len(source)
+    while i < n:
+        c = source[i]
+        if c == "\\":
+            e = source[i + 1:i + 2]
+            if e.isdigit() and e != "0":
+                return None  # numbered backreference
+            out.append(source[i:i + 2])
+            i += 2
+        elif c == "[":
+            j = i + 1
+            if j < n and source[j] == "^":
+                j += 1
+            if j < n and source[j] == "]":
+                j += 1
+            while j < n and source[j] != "]":
+                j += 2 if source[j] == "\\" else 1
+            if j >= n:
+                return None
+            out.append(source[i:j + 1])
+            i = j + 1
+        elif c == "(" and source.startswith("(?", i):
+            if source.startswith("(?P<", i):
+                j = source.find(">", i)
+                if j < 0:
+                    return None
+                groups += 1
+                if source[i + 4:j] == "id":
+                    id_group = groups
+                out.append("(")
+                i = j + 1
+                continue
+            head = source[i + 2:i + 3]
+            if head == "<" and source[i + 3:i + 4] not in ("=", "!"):
+                return None
+            if head in ("P", "(", "#"):
+                return None  # named backreference, conditional or comment
+            if head not in (":", "=", "!", "<", ">"):
+                # Inline flags: only the scoped form "(?i:...)" is position independent
+                j = i + 2
+                while j < n and source[j] not in ":)":
+                    j += 1
+                if j >= n or source[j] != ":":
+                    return None
+            out.append("(?")
+            i += 2
+        elif c == "(":
+            groups += 1
+            out.append(c)
+            i += 1
+        else:
+            out.append(c)
+            i += 1
+    return "".join(out), groups, id_group
+
+
+_PrefixToken = Tuple[str, bool]
+"""A prefix character and whether it is optional (followed by ``?``)."""
+
+
+def _prefix_tokens(source: str, flags: int) -> List[_PrefixToken]:
+    """Return the leading part of a pattern that can be shared with others.
+
+    The prefix consists of literal characters, each optionally followed by
+    ``?``. It is cut so that it matches any input in at most one way, which
+    makes ``prefix(?:a|b)`` behave exactly like ``prefix a|prefix b``. A
+    pattern with a top-level ``|`` has no prefix, as it only belongs to the
+    first branch.
+    """
+    tokens: List[_PrefixToken] = []
+    if _has_top_level_bar(source):
+        return tokens
+    i, n = 0, len(source)
+    while i < n and source[i] in _PREFIX_CHARS:
+        quantifier = source[i + 1:i + 2]
+        if quantifier in ("*", "+", "{"):
+            break
+        if quantifier == "?":
+            if source[i + 2:i + 3] in ("?", "+"):
+                break  # lazy or possessive
+            tokens.append((source[i], True))
+            i += 2
+        else:
+            tokens.append((source[i], False))
+            i += 1
+    return _trim_prefix(tokens, flags)
+
+
+def _has_top_level_bar(source: str) -> bool:
+    """Return whether a pattern is an alternation outside of any group."""
+    depth = 0
+    i, n = 0, len(source)
+    while i < n:
+        c = source[i]
+        if c == "\\":
+            i += 2
+            continue
+        if c == "[":
+            i += 2 if source[i + 1:i + 2] == "^" else 1
+            if source[i:i + 1] == "]":
+                i += 1  # a leading "]" is literal
+            while i < n and source[i] != "]":
+                i += 2 if source[i] == "\\" else 1
+        elif c == "(":
+            depth += 1
+        elif c == ")":
+            depth -= 1
+        elif c == "|" and not depth:
+            return True
+        i += 1
+    return False
+
+
+def _trim_prefix(tokens: List[_PrefixToken], flags: int) -> List[_PrefixToken]:
+    """Cut a prefix back to a part that matches in at most one way.
+
+    An optional character must differ from every character up to the next
+    required one, otherwise the input does not decide whether it is present;
+    the prefix also has to end on a required character.
+    """
+    fold = str.lower if flags & re.IGNORECASE else str
+    for pos, (char, optional) in enumerate(tokens):
+        if not optional:
+            continue
+        for following, following_optional in tokens[pos + 1:]:
+            if fold(following) == fold(char):
+                tokens = tokens[:pos]
+                break
+            if not following_optional:
+                break
+        else:
+            tokens = tokens[:pos]
+        if len(tokens) <= pos:
+            break
+    while tokens and tokens[-1][1]:
+        tokens = tokens[:-1]
+    return tokens
+
+
+def _prefix_length(tokens: Sequence[_PrefixToken]) -> int:
+    """Return the length of a prefix in the pattern source."""
+    return sum(2 if optional else 1 for _, optional in tokens)
+
+
+def _alternation(
+    positions: Sequence[int],
+    stripped: Sequence[Tuple[str, int, int]],
+    guards: Sequence[Optional["re.Pattern[str]"]],
+    flags: int,
+) -> Tuple["re.Pattern[str]", List[Optional[_Alternative]]]:
+    """Compile some patterns into one alternation, preserving their order.
+
+    Args:
+        positions: Positions of the patterns to combine, in order.
+        stripped: Rewritten source, group count and id group of every pattern.
+        guards: Priority guard of every pattern.
+        flags: Regex flags.
+
+    Returns:
+        The compiled alternation, and a table mapping the number of the group
+        wrapping each alternative to its `_Alternative` tuple.
+
+    Raises:
+        re.error: If the combined regex cannot be compiled.
+    """
+    # Group consecutive patterns by their longest shared prefix
+    runs: List[Tuple[List[_PrefixToken], List[int]]] = []
+    for pos in positions:
+        tokens = _prefix_tokens(stripped[pos][0], flags)
+        if runs and runs[-1][0]:
+            shared = runs[-1][0]
+            common = 0
+            while common < min(len(shared), len(tokens)) and shared[common] == tokens[common]:
+                common += 1
+            shared = _trim_prefix(shared[:common], flags)
+            if shared:
+                runs[-1] = (shared, runs[-1][1] + [pos])
+                continue
+        runs.append((tokens, [pos]))
+
+    parts = []
+    table: List[Optional[_Alternative]] = [None]
+    for tokens, members in runs:
+        shared = _prefix_length(tokens) if len(members) > 1 else 0
+        bodies = []
+        for pos in members:
+            body, groups, id_group = stripped[pos]
+            wrapper = len(table)
+            table.append((pos, wrapper + id_group if id_group else 0, wrapper, wrapper + groups, guards[pos]))
+            table.extend([None] * groups)
+            bodies.append(f"({body[shared:]})")
+        if shared:
+            prefix = stripped[members[0]][0][:shared]
+            parts.append(f"{prefix}(?:{'|'.join(bodies)})")
+        else:
+            parts.extend(bodies)
+
+    return re.compile("|".join(parts), flags), table
+
+
+class PlatformMatcher:
+    """Match a URL against all patterns of a platform in one regex call.
+
+    Args:
+        patterns: The platform's compiled patterns, in order. `LazyPattern`
+            objects are accepted and only compiled if the reference loop is
+            needed.
+        flags: Regex flags the patterns are compiled with.
+
+    Examples:
+        >>> import re
+        >>> matcher = PlatformMatcher(
+        ...     [re.compile(r"https?://x\\.com/(?P<id>\\w+)"), re.compile(r"^@(?P<id>\\w+)$")], 0
+        ... )
+        >>> matcher.match("@johndoe")
+        (1, 'johndoe')
+    """
+
+    __slots__ = ("_patterns", "_combined", "_start", "_start_table", "_rest", "_rest_table")
+
+    def __init__(self, patterns: Sequence["re.Pattern[str]"], flags: int):
+        self._patterns = tuple(patterns)
+        self._combined = False
+        # Patterns anchored with "^" can only match at position 0. If there
+        # are any, `_start` holds all patterns and is only tried at position
+        # 0, and `_rest` the remaining ones, searched from position 1.
+        # Otherwise `_rest` holds all patterns and is searched from 0.
+        self._start: Optional["re.Pattern[str]"] = None
+        self._start_table: List[Optional[_Alternative]] = []
+        self._rest: Optional["re.Pattern[str]"] = None
+        self._rest_table: List[Optional[_Alternative]] = []
+        if not flags & re.VERBOSE:
+            self._combine(flags)
+
+    @property
+    def combined(self) -> bool:
+        """True if combined regexes are used, False for the reference loop."""
+        return self._combined
+
+    def _combine(self, flags: int) -> None:
+        """Compile the combined regexes and their per-alternative lookup tables."""
+        sources = [pattern.pattern for pattern in self._patterns]
+        stripped = []
+        for source in sources:
+            result = _strip_group_names(source)
+            if result is None:
+                return
+            stripped.append(result)
+
+        # Guard for alternative k: can an earlier pattern match to the right
+        # of where alternative k matched? Anchored patterns never can; others
+        # are represented by their literal prefix when they have one.
+        anchored = [is_start_anchored(source, flags) for source in sources]
+        guards: List[Optional["re.Pattern[str]"]] = []
+        terms: List[str] = []
+        for pos, source in enumerate(sources):
+            guards.append(re.compile("|".join(terms), flags) if terms else None)
+            if not anchored[pos]:
+                prefix = literal_prefix(source, flags)
+                term = re.escape(prefix) if prefix else f"(?:{stripped[pos][0]})"
+                if term not in terms:
+                    terms.append(term)
+
+        everything = list(range(len(sources)))
+        floating = [pos for pos in everything if not anchored[pos]]
+        try:
+            if len(floating) < len(everything):
+                self._start, self._start_table = _alternation(everything, stripped, guards, flags)
+            if floating:
+                self._rest, self._rest_table = _alternation(floating, stripped, guards, flags)
+        except (re.error, OverflowError, RecursionError):
+            self._start = self._rest = None
+            return
+        self._combined = True
+
+    def state(self) -> Optional[MatcherState]:
+        """Return the combined regexes as plain data, or None if not combined.
+
+        Used to generate code that rebuilds the matcher with `from_state()`
+        without analysing the patterns again.
+        """
+        if not self._combined:
+            return None
+
+        def table(rows: List[Optional[_Alternative]]) -> List[Optional[Tuple[int, int, int, int, Optional[str]]]]:
+            return [row and row[:4] + (row[4].pattern if row[4] is not None else None,) for row in rows]
+
+        start, rest = self._start, self._rest
+        return (
+            start.pattern if start is not None else None,
+            table(self._start_table),
+            rest.pattern if rest is not None else None,
+            table(self._rest_table),
+        )
+
+    @classmethod
+    def from_state(
+        cls, patterns: Sequence["re.Pattern[str]"], flags: int, state: Optional[MatcherState], compile: Any = re.compile
+    ) -> "PlatformMatcher":
+        """Rebuild a matcher from the output of `state()`.
+
+        Args:
+            patterns: The patterns the state was computed for, in order.
+            flags: Regex flags.
+            state: Output of `state()`. None uses the reference loop.
+            compile: Called as ``compile(source, flags)`` for every combined
+                regex and guard, e.g. to wrap them in
+                `sociallinks.registry.LazyPattern`.
+        """
+        matcher = cls.__new__(cls)
+        matcher._patterns = tuple(patterns)
+        matcher._combined = state is not None
+        matcher._start = matcher._rest = None
+        matcher._start_table = matcher._rest_table = []
+        if state is not None:
+            start, start_table, rest, rest_table = state
+
+            def table(rows: Any) -> List[Optional[_Alternative]]:
+                return [row and tuple(row[:4]) + (compile(row[4], flags) if row[4] is not None else None,) for row in rows]
+
+            matcher._start = compile(start, flags) if start is not None else None
+            matcher._start_table = table(start_table)
+            matcher._rest = compile(rest, flags) if rest is not None else None
+            matcher._rest_table = table(rest_table)
+        return matcher
+
+    def is_valid(self, url: str) -> bool:
+        """Return True if any pattern matches `url`."""
+        if not self._combined:
+            return any(pattern.search(url) for pattern in self._patterns)
+        start = self._start
+        if start is None:
+            return self._rest.search(url) is not None  # type: ignore[union-attr]
+        if start.match(url) is not None:
+            return True
+        rest = self._rest
+        return rest is not None and rest.search(url, 1) is not None
+
+    def match(self, url: str) -> Optional[Tuple[int, Optional[str]]]:
+        """Find the first pattern matching `url` and extract the identifier.
+
+        Args:
+            url: Stripped input URL.
+
+        Returns:
+            A ``(position, id)`` tuple with the position of the first matching
+            pattern and the raw identifier (None if it has no non-empty
+            group), or None if no pattern matches.
+        """
+        if not self._combined:
+            return self._match_linear(url)
+        start = self._start
+        if start is None:
+            m = self._rest.search(url)  # type: ignore[union-attr]
+            table = self._rest_table
+        else:
+            m = start.match(url)
+            table = self._start_table
+            if m is None and self._rest is not None:
+                m = self._rest.search(url, 1)
+                table = self._rest_table
+        if m is None:
+            return None
+
+        pos, id_group, first, last, guard = table[m.lastindex]  # type: ignore[index,misc]
+        if guard is not None and guard.search(url, m.start() + 1):
+            return self._match_linear(url)
+        pid = m.group(id_group) if id_group else None
+        if not pid:
+            for pid in m.groups()[first:last]:
+                if pid:
+                    break
+            else:
+                pid = None
+        return pos, pid
+
+    def locate(self, url: str) -> Optional[Tuple[int, "re.Match[str]"]]:
+        """Find the first pattern matching `url` and return its own match.
+
+        Like `match()`, but returns the match of the pattern itself, as its
+        ``search`` would: the combined regex finds the pattern and where it
+        matches, and the pattern is then matched at that position only.
+
+        Returns:
+            A ``(position, match)`` tuple, or None if no pattern matches.
+        """
+        if not self._combined:
+            return self._locate_linear(url)
+        start = self._start
+        if start is None:
+            m = self._rest.search(url)  # type: ignore[union-attr]
+            table = self._rest_table
+        else:
+            m = start.match(url)
+            table = self._start_table
+            if m is None and self._rest is not None:
+                m = self._rest.search(url, 1)
+                table = self._rest_table
+        if m is None:
+            return None
+
+        pos, _, _, _, guard = table[m.lastindex]  # type: ignore[index,misc]
+        if guard is not None and guard.search(url, m.start() + 1):
+            return self._locate_linear(url)
+        found = self._patterns[pos].match(url, m.start())
+        if found is None:
+            return self._locate_linear(url)
+        return pos, found
+
+    def _locate_linear(self, url: str) -> Optional[Tuple[int, "re.Match[str]"]]:
+        """Reference implementation of `locate`: try each pattern in order."""
+        for pos, pattern in enumerate(self._patterns):
+            m = pattern.search(url)
+            if m:
+                return pos, m
+        return None
+
+    def _match_linear(self, url: str) -> Optional[Tuple[int, Optional[str]]]:
+        """Reference implementation of `match`: try each pattern in order."""
+        for pos, pattern in enumerate(self._patterns):
+            m = pattern.search(url)
+            if m:
+                return pos, extract_id(m)
+        return None
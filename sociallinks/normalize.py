@@ -0,0 +1,213 @@
+"""Normalization of URLs before matching.
+
+Platform patterns describe canonical URLs and most end in ``/?$``, so links
+copied from the wild, such as ``https://m.facebook.com/johndoe?ref=share``
+or ``https://x.com/johndoe#top``, do not match them. A `Normalizer`
+rewrites each input once, before any pattern runs:
+
+- the scheme and host are lowercased;
+- leading subdomains listed in a table, such as ``m.``, ``mobile.`` and
+  ``www.``, are dropped or replaced;
+- hosts whose first label is the profile identifier, such as
+  ``johndoe.bandcamp.com``, are left exactly as they are;
+- query parameters listed as tracking parameters are dropped, and the
+  ``?`` with them when none is left;
+- the fragment is dropped, unless it looks like a client-side route
+  (``#/user``, ``#@name``, ``#p/...``) or the host is one of the web apps
+  whose fragments are routes, such as ``web.telegram.org``.
+
+Inputs without ``://`` are only stripped. This covers usernames and
+handles, but also scheme-less links such as ``m.facebook.com/johndoe?ref=x``:
+they cannot be told apart from usernames containing dots, so they are
+matched as given. Paths, and the parameters platforms identify profiles by (``?id=``,
+``?username=``), are left alone.
+"""
+from typing import Any, Dict, FrozenSet, Iterable, Mapping, Tuple
+from urllib.parse import urlsplit
+
+MOBILE_SUBDOMAINS: Mapping[str, str] = {
+    "www": "",
+    "m": "",
+    "mobile": "",
+    "mbasic": "",
+    "touch": "",
+}
+"""Default subdomain table: mobile and ``www`` subdomains are dropped."""
+
+TRACKING_PARAMS: Tuple[str, ...] = (
+    "utm_*",
+    "fbclid",
+    "gclid",
+    "igshid",
+    "igsh",
+    "mibextid",
+    "ref",
+    "ref_src",
+    "ref_url",
+    "referrer",
+    "share",
+    "si",
+    "s",
+    "t",
+    "trk",
+    "lipi",
+    "originalSubdomain",
+    "feature",
+    "hl",
+    "locale",
+    "lang",
+)
+"""Default query parameters to drop. Names ending in ``*`` are prefixes."""
+
+ROUTE_HOSTS: Tuple[str, ...] = ("web.telegram.org", "signal.me")
+"""Default hosts whose fragments are always kept, as they identify profiles."""
+
+ID_SUBDOMAIN_HOSTS: Tuple[str, ...] = ("bandcamp.com", "substack.com", "tumblr.com", "gumroad.com", "hashnode.dev")
+"""Default hosts whose subdomains are profile identifiers, as in
+``johndoe.bandcamp.com``. Their subdomains are neither mapped nor lowercased."""
+
+
+class Normalizer:
+    """Rewrites URLs into the canonical shape platform patterns expect.
+
+    Call an instance with a URL to normalize it. Instances are picklable,
+    and `as_dict()` returns their configuration as plain data.
+
+    Args:
+        subdomains: Maps a leading host label to its replacement, or to
+            ``""`` to drop it. Applied repeatedly while the host keeps more
+            than two labels, so ``www.m.facebook.com`` becomes
+            ``facebook.com``. Add locale labels (e.g. ``{"de": ""}``) only
+            for hosts that never use the first label as an identifier.
+        drop_params: Names of the query parameters to drop. Names ending in
+            ``*`` match every parameter starting with the rest.
+        drop_fragment: If True, drop fragments that do not look like
+            client-side routes.
+        route_hosts: Hosts, after subdomain mapping, whose fragments are
+            always kept.
+        id_hosts: Hosts whose subdomains are identifiers. A host ending with
+            ``.`` and one of them is kept unchanged, so ``m.bandcamp.com``
+            is not shortened and ``JohnDoe.substack.com`` keeps its case.
+
+    Examples:
+        >>> normalize = Normalizer()
+        >>> normalize("  HTTPS://M.Facebook.com/JohnDoe?ref=share&id=1#top ")
+        'https://facebook.com/JohnDoe?id=1'
+        >>> normalize("https://signal.me/#p/+15551234567")
+        'https://signal.me/#p/+15551234567'
+        >>> normalize("https://M.Bandcamp.com/?from=x")
+        'https://M.Bandcamp.com/?from=x'
+        >>> normalize(" @johndoe ")
+        '@johndoe'
+    """
+
+    __slots__ = ("subdomains", "drop_params", "drop_fragment", "route_hosts", "id_hosts", "_names", "_prefixes", "_suffixes")
+
+    def __init__(
+        self,
+        subdomains: Mapping[str, str] = MOBILE_SUBDOMAINS,
+        drop_params: Iterable[str] = TRACKING_PARAMS,
+        drop_fragment: bool = True,
+        route_hosts: Iterable[str] = ROUTE_HOSTS,
+        id_hosts: Iterable[str] = ID_SUBDOMAIN_HOSTS,
+    ):
+        self.subdomains: Dict[str, str] = {label.lower(): value.lower() for label, value in subdomains.items()}
+        self.drop_params: Tuple[str, ...] = tuple(drop_params)
+        self.drop_fragment = drop_fragment
+        self.route_hosts: FrozenSet[str] = frozenset(host.lower() for host in route_hosts)
+        self.id_hosts: FrozenSet[str] = frozenset(host.lower() for host in id_hosts)
+        self._suffixes = tuple("." + host for host in sorted(self.id_hosts))
+        self._names = frozenset(name for name in self.drop_params if not name.endswith("*"))
+        self._prefixes = tuple(name[:-1] for name in self.drop_params if name.endswith("*"))
+
+    def __call__(self, url: str) -> str:
+        """Normalize a URL.
+
+        Args:
+            url: URL or username.
+
+        Returns:
+            The normalized URL, or the stripped input if it has no ``://``.
+        """
+        u = url.strip()
+        if "://" not in u:
+            return u
+        try:
+            scheme, netloc, path, query, fragment = urlsplit(u)
+        except ValueError:
+            return u
+        if not netloc:
+            return u
+
+        userinfo, at, host = netloc.rpartition("@")
+        lowered = host.lower()
+        if not lowered.partition(":")[0].endswith(self._suffixes):
+            host = lowered = self._host(lowered)
+        parts = [scheme, "://", userinfo, at, host, path]
+        if query:
+            query = self._query(query)
+            if query:
+                parts += ("?", query)
+        if fragment and (not self.drop_fragment or _is_route(fragment) or lowered in self.route_hosts):
+            parts += ("#", fragment)
+        return "".join(parts)
+
+    def _host(self, host: str) -> str:
+        subdomains = self.subdomains
+        if not subdomains:
+            return host
+        name, colon, port = host.partition(":")
+        labels = name.split(".")
+        while len(labels) > 2:
+            replacement = subdomains.get(labels[0])
+            if replacement is None:
+                break
+            if replacement:
+                labels[0] = replacement
+                break
+            del labels[0]
+        return ".".join(labels) + colon + port
+
+    def _query(self, query: str) -> str:
+        names, prefixes = self._names, self._prefixes
+        if not names and not prefixes:
+            return query
+        kept = []
+        for param in query.split("&"):
+            name = param.partition("=")[0]
+            if not param or name in names or (prefixes and name.startswith(prefixes)):
+                continue
+            kept.append(param)
+        return "&".join(kept)
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the constructor arguments as JSON-serializable data."""
+        return {
+            "subdomains": dict(self.subdomains),
+            "drop_params": list(self.drop_params),
+            "drop_fragment": self.drop_fragment,
+            "route_hosts": sorted(self.route_hosts),
+            "id_hosts": sorted(self.id_hosts),
+        }
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Normalizer):
+            return NotImplemented
+        return self.as_dict() == other.as_dict()
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __getstate__(self) -> Dict[str, Any]:
+        return self.as_dict()
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__init__(**state)  # type: ignore[misc]
+
+    def __repr__(self) -> str:
+        return "Normalizer(" + ", ".join(f"{key}={value!r}" for key, value in self.as_dict().items()) + ")"
+
+
+def _is_route(fragment: str) -> bool:
+    """Return True for fragments used as client-side routes, not anchors."""
+    return "/" in fragment or fragment[0] in "@!"
+
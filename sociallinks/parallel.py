@@ -0,0 +1,149 @@
+"""Process pool used to spread batch work over several CPU cores.
+
+Matching is pure regex work that holds the GIL, so threads do not speed it
+up. The pool initializer (`init_worker`) sends a registry snapshot
+(`SocialLinks.snapshot()`) to every worker process once; each worker
+restores its own `SocialLinks` instance from it and afterwards only receives
+lists of URLs. `imap_rows`, behind `SocialLinks.map_parallel()` and the
+command line, turns them into compact result tuples; `sociallinks.aio` runs
+batch methods on them with `run_chunk`.
+"""
+from collections import deque
+from itertools import islice
+from typing import TYPE_CHECKING, Any, Deque, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+if TYPE_CHECKING:
+    from sociallinks.core import SocialLinks
+
+Row = Tuple[Optional[str], Optional[str], Optional[str], Optional[str]]
+"""Compact result for one URL: platform, identifier, sanitized URL and error
+code (see `sociallinks.results`)."""
+
+CHUNK_SIZE = 2048
+"""Default number of URLs sent to a worker process at once."""
+
+Task = Tuple[Optional[str], bool, Optional[Tuple[str, ...]], Sequence[Any]]
+"""Work item sent to a worker: platform name, URL-only flag, candidate
+platforms and the URLs themselves."""
+
+_worker: Optional["SocialLinks"] = None
+
+
+def chunked(values: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    """Split an iterable into lists of at most `size` items."""
+    values = iter(values)
+    while True:
+        chunk = list(islice(values, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def init_worker(snapshot: bytes) -> None:
+    """Pool initializer: restore the worker's `SocialLinks` instance.
+
+    Args:
+        snapshot: Registry snapshot, as returned by `SocialLinks.snapshot()`.
+    """
+    global _worker
+    from sociallinks.core import SocialLinks
+
+    _worker = SocialLinks.from_snapshot(snapshot)
+
+
+def parse_rows(sl: "SocialLinks", task: Task) -> List[Row]:
+    """Parse a list of URLs into compact rows.
+
+    Args:
+        sl: Instance to parse with.
+        task: ``(platform_name, url_only, candidates, urls)``. With a
+            platform name every URL is matched against that platform only;
+            otherwise the platform is detected, among `candidates` if given.
+
+    Returns:
+        One row per URL, in input order.
+    """
+    platform_name, url_only, candidates, urls = task
+    if platform_name is not None:
+        results = sl.parse_many(urls, platform_name)
+    elif candidates is not None:
+        results = sl.detector(candidates, url_only=url_only).parse_many(urls)
+    else:
+        results = sl.parse_many(urls, url_only=url_only)
+    return [(r.platform, r.id, r.url, r.error) for r in results]
+
+
+def _work(task: Task) -> List[Row]:
+    """Pool task: parse a list of URLs with the worker's instance."""
+    assert _worker is not None, "worker not initialized"
+    return parse_rows(_worker, task)
+
+
+def run_chunk(
+    method: str, urls: Sequence[Any], args: Tuple[Any, ...] = (), kwargs: Optional[Dict[str, Any]] = None
+) -> Any:
+    """Pool task: run a batch method of the worker's instance on a chunk.
+
+    Args:
+        method: Name of a `SocialLinks` batch method, such as
+            ``"parse_many"``.
+        urls: The chunk, passed after `args`.
+        args: Positional arguments before the chunk, such as a platform name.
+        kwargs: Keyword arguments.
+
+    Returns:
+        The method's result.
+    """
+    assert _worker is not None, "worker not initialized"
+    return getattr(_worker, method)(*args, urls, **(kwargs or {}))
+
+
+def imap_rows(
+    sl: "SocialLinks",
+    chunks: Iterable[Sequence[Any]],
+    *,
+    workers: int = 1,
+    platform_name: Optional[str] = None,
+    url_only: bool = False,
+    candidates: Optional[Tuple[str, ...]] = None,
+    window: Optional[int] = None,
+) -> Iterator[Tuple[Sequence[Any], List[Row]]]:
+    """Parse chunks of URLs, optionally in worker processes.
+
+    Chunks are consumed lazily and at most `window` of them are in flight at
+    once, so arbitrarily long inputs can be streamed with bounded memory.
+
+    Args:
+        sl: Instance whose registry is used.
+        chunks: Lists of URLs.
+        workers: Number of worker processes. With 1 or less, chunks are
+            parsed in the calling process.
+        platform_name: Optional platform to match every URL against.
+        url_only: If True, skip bare-username patterns during detection.
+        candidates: Optional platforms to restrict detection to.
+        window: Maximum number of chunks in flight. Defaults to twice the
+            number of workers.
+
+    Yields:
+        ``(chunk, rows)`` pairs in input order.
+    """
+    if workers <= 1:
+        for chunk in chunks:
+            yield chunk, parse_rows(sl, (platform_name, url_only, candidates, chunk))
+        return
+
+    # Imported here so that importing the package does not load multiprocessing
+    import multiprocessing
+
+    window = window or 2 * workers
+    pending: Deque[Tuple[Sequence[Any], Any]] = deque()
+    with multiprocessing.Pool(workers, init_worker, (sl.snapshot(),)) as pool:
+        for chunk in chunks:
+            task = (platform_name, url_only, candidates, chunk)
+            pending.append((chunk, pool.apply_async(_work, (task,))))
+            if len(pending) >= window:
+                chunk, result = pending.popleft()
+                yield chunk, result.get()
+        while pending:
+            chunk, result = pending.popleft()
+            yield chunk, result.get()
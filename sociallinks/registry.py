@@ -0,0 +1,489 @@
+"""Process-wide cache of compiled platform definitions.
+
+Compiling the regex patterns of every platform is the most expensive part of
+constructing a `SocialLinks` instance. Compiled platforms are immutable, so
+this module interns them by ``(platform definition, regex flags)``: every
+instance built from the same definitions references the same compiled
+patterns and the same host index instead of compiling its own copies.
+
+The registry of an instance is itself a `RegistrySnapshot`: an immutable
+mapping of platform definitions to compiled platforms. Registry changes build
+a new snapshot and publish it with a single attribute assignment, so readers
+never observe a half-updated registry and need no lock.
+
+Platforms can also be compiled lazily: each pattern is then wrapped in a
+`LazyPattern` that only calls `re.compile` the first time it is evaluated.
+"""
+import re
+import threading
+from string import Formatter
+from typing import TYPE_CHECKING, Any, Dict, Hashable, Iterator, Optional, Tuple
+
+from sociallinks.backend import INDEXED, Index, MatcherBackend, PlatformMatch, shared_index
+from sociallinks.constants import PlatformEntries, PlatformEntry
+from sociallinks.exceptions import InvalidPlatformError, InvalidPlatformRegexError
+from sociallinks.index import PatternKind, classify_pattern
+from sociallinks.matcher import PlatformMatcher
+
+if TYPE_CHECKING:
+    from sociallinks.instrument import Instrumentation
+
+CompiledEntry = Tuple["re.Pattern[str]", str, int]
+"""A compiled pattern with its sanitized template and configuration entry index."""
+
+
+class LazyPattern:
+    """A regex pattern that is compiled the first time it is used.
+
+    Exposes the `search`, `match` and `fullmatch` methods of `re.Pattern`.
+    The first call compiles the pattern and rebinds these methods to the
+    compiled pattern's own, so later calls cost the same as on an eagerly
+    compiled pattern. Other attributes are forwarded to the compiled pattern.
+
+    Args:
+        pattern: Regex source.
+        flags: Regex flags.
+        platform: Name of the platform the pattern belongs to, used in error
+            messages.
+    """
+
+    __slots__ = ("pattern", "flags", "platform", "search", "match", "fullmatch", "_compiled")
+
+    def __init__(self, pattern: str, flags: int, platform: str):
+        self.pattern = pattern
+        self.flags = flags
+        self.platform = platform
+        self._compiled: Optional["re.Pattern[str]"] = None
+        self.search = self._lazy("search")
+        self.match = self._lazy("match")
+        self.fullmatch = self._lazy("fullmatch")
+
+    def _lazy(self, method: str) -> Any:
+        def call(*args: Any, **kwargs: Any) -> Any:
+            return getattr(self.compile(), method)(*args, **kwargs)
+
+        return call
+
+    @property
+    def compiled(self) -> bool:
+        """True once the pattern has been compiled."""
+        return self._compiled is not None
+
+    def compile(self) -> "re.Pattern[str]":
+        """Compile the pattern if needed and return the compiled pattern.
+
+        Raises:
+            InvalidPlatformRegexError: If the pattern is not a valid regex.
+        """
+        compiled = self._compiled
+        if compiled is None:
+            try:
+                compiled = re.compile(self.pattern, flags=self.flags)
+            except re.error as e:
+                raise InvalidPlatformRegexError(
+                    f"Invalid regex pattern for platform '{self.platform}': {self.pattern}"
+                ) from e
+            self.search = compiled.search
+            self.match = compiled.match
+            self.fullmatch = compiled.fullmatch
+            self._compiled = compiled
+        return compiled
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self.compile(), name)
+
+    def __repr__(self) -> str:
+        return f"LazyPattern({self.pattern!r}, flags={self.flags})"
+
+
+Template = Optional[Tuple[str, str]]
+"""A sanitized URL template split around its ``{id}`` field, or None if it
+must be rendered with `str.format`."""
+
+
+def split_template(sanitized: str) -> Template:
+    """Split a sanitized URL template into the text around its ``{id}`` field.
+
+    Args:
+        sanitized: Template such as ``"https://github.com/{id}"``.
+
+    Returns:
+        A ``(prefix, suffix)`` pair such that ``prefix + pid + suffix`` equals
+        ``sanitized.format(id=pid)`` for every identifier, or None if the
+        template has other fields, several ``{id}`` fields, a conversion or
+        a format spec, or is malformed.
+
+    Examples:
+        >>> split_template("https://github.com/{id}")
+        ('https://github.com/', '')
+        >>> split_template("https://{id}.substack.com/{{x}}")
+        ('https://', '.substack.com/{x}')
+        >>> split_template("https://x.com/{id!r}") is None
+        True
+    """
+    try:
+        parts = list(Formatter().parse(sanitized))
+    except ValueError:
+        return None
+    fields = [pos for pos, (_, field, _, _) in enumerate(parts) if field is not None]
+    if len(fields) != 1:
+        return None
+    literal, field, spec, conversion = parts[fields[0]]
+    if field != "id" or spec or conversion:
+        return None
+    prefix = "".join(text for text, _, _, _ in parts[:fields[0]]) + literal
+    suffix = "".join(text for text, _, _, _ in parts[fields[0] + 1:])
+    return prefix, suffix
+
+
+class CompiledPlatform:
+    """Immutable compiled form of a platform configuration.
+
+    Attributes:
+        entries: ``(pattern, sanitized, entry index)`` tuples in pattern order.
+            Patterns are `re.Pattern` objects, or `LazyPattern` objects for
+            platforms compiled lazily.
+        flags: Regex flags the patterns were compiled with.
+    """
+
+    __slots__ = ("entries", "flags", "_kinds", "_matcher", "_templates", "__weakref__")
+
+    def __init__(self, entries: Tuple[CompiledEntry, ...], flags: int):
+        self.entries = entries
+        self.flags = flags
+        self._kinds: Optional[Tuple[PatternKind, ...]] = None
+        self._matcher: Optional[PlatformMatcher] = None
+        self._templates: Optional[Tuple[Template, ...]] = None
+
+    @property
+    def kinds(self) -> Tuple[PatternKind, ...]:
+        """Host index classification of each pattern, aligned with `entries`.
+
+        Computed on first access, when a host index is first built.
+        """
+        kinds = self._kinds
+        if kinds is None:
+            kinds = self._kinds = tuple(
+                classify_pattern(pattern.pattern, self.flags) for pattern, _, _ in self.entries
+            )
+        return kinds
+
+    @property
+    def matcher(self) -> PlatformMatcher:
+        """Combined matcher used by `is_valid()` and `sanitize()`.
+
+        Built on first access, so that platforms only used for detection, or
+        compiled lazily and never validated, do not pay for it.
+        """
+        matcher = self._matcher
+        if matcher is None:
+            matcher = self._matcher = PlatformMatcher(list(self.patterns()), self.flags)
+        return matcher
+
+    @property
+    def templates(self) -> Tuple[Template, ...]:
+        """Sanitized URL templates split by `split_template`, aligned with `entries`."""
+        templates = self._templates
+        if templates is None:
+            templates = self._templates = tuple(split_template(sanitized) for _, sanitized, _ in self.entries)
+        return templates
+
+    def format(self, pos: int, pid: str) -> str:
+        """Render the sanitized URL of the pattern at `pos` for an identifier.
+
+        Args:
+            pos: Position of the matching pattern in `entries`.
+            pid: Cleaned platform identifier.
+        """
+        template = self.templates[pos]
+        if template is None:
+            return self.entries[pos][1].format(id=pid)
+        return template[0] + pid + template[1]
+
+    def patterns(self) -> Iterator["re.Pattern[str]"]:
+        """Iterate over the patterns of this platform."""
+        return (pattern for pattern, _, _ in self.entries)
+
+    def copy(self) -> "CompiledPlatform":
+        """Return a copy sharing the patterns and whatever was derived so far.
+
+        Used to attach stored derived data, such as the classification of a
+        snapshot, without changing the shared instance of the process-wide
+        cache.
+        """
+        platform = CompiledPlatform(self.entries, self.flags)
+        platform._kinds = self._kinds
+        platform._matcher = self._matcher
+        platform._templates = self._templates
+        return platform
+
+
+MAX_CACHED_PLATFORMS = 4096
+"""Upper bound on the number of cached compiled platforms. When reached, the
+oldest entries are dropped so that many short-lived custom definitions cannot
+grow the cache without bounds."""
+
+_cache: Dict[Hashable, CompiledPlatform] = {}
+_lock = threading.Lock()
+
+
+def _freeze(data: PlatformEntry) -> Optional[Hashable]:
+    """Build a hashable cache key for a platform configuration.
+
+    Args:
+        data: Platform configuration.
+
+    Returns:
+        A hashable key, or None if the configuration contains unhashable
+        values and cannot be cached.
+    """
+    try:
+        key = []
+        for entry in data:
+            if not isinstance(entry, dict):
+                key.append(None)
+                continue
+            patterns = entry.get("patterns")
+            if isinstance(patterns, list):
+                patterns = tuple(patterns)
+            key.append((patterns, entry.get("sanitized")))
+        frozen = tuple(key)
+        hash(frozen)
+        return frozen
+    except TypeError:
+        return None
+
+
+def _compile(name: str, data: PlatformEntry, flags: int, lazy: bool = False) -> CompiledPlatform:
+    """Compile a platform configuration without consulting the cache.
+
+    With `lazy`, patterns are wrapped in `LazyPattern` and not validated.
+    """
+    entries = []
+
+    for index, entry in enumerate(data):
+        if not isinstance(entry, dict):
+            continue
+
+        patterns = entry.get("patterns")
+        sanitized = entry.get("sanitized")
+
+        if not patterns or not sanitized:
+            continue
+
+        for p in (patterns if isinstance(patterns, list) else [patterns]):
+            if lazy:
+                entries.append((LazyPattern(p, flags, name), sanitized, index))
+                continue
+            try:
+                entries.append((re.compile(p, flags=flags), sanitized, index))
+            except re.error as e:
+                raise InvalidPlatformRegexError(
+                    f"Invalid regex pattern for platform '{name}': {p}"
+                ) from e
+
+    if not entries:
+        raise InvalidPlatformError(f"Platform '{name}' has no valid patterns or templates.")
+
+    return CompiledPlatform(tuple(entries), flags)
+
+
+def compile_platform(name: str, data: PlatformEntry, flags: int, lazy: bool = False) -> CompiledPlatform:
+    """Compile a platform configuration, reusing a cached result if possible.
+
+    Args:
+        name: Platform name, used in error messages only.
+        data: Platform configuration.
+        flags: Regex flags used for pattern compilation.
+        lazy: If True, defer compiling each pattern until it is first used.
+            Invalid patterns are then only reported on first use. An eagerly
+            compiled platform is reused if one is already cached.
+
+    Returns:
+        The shared `CompiledPlatform` for this configuration and flags.
+
+    Raises:
+        InvalidPlatformError: If no valid patterns are found.
+        InvalidPlatformRegexError: If any regex pattern is invalid.
+    """
+    frozen = _freeze(data)
+    if frozen is None:
+        return _compile(name, data, flags, lazy)
+
+    key = (frozen, flags, False)
+    compiled = _cache.get(key)
+    if compiled is None and lazy:
+        key = (frozen, flags, True)
+        compiled = _cache.get(key)
+    if compiled is None:
+        compiled = _compile(name, data, flags, lazy)
+        with _lock:
+            while len(_cache) >= MAX_CACHED_PLATFORMS:
+                del _cache[next(iter(_cache))]
+            compiled = _cache.setdefault(key, compiled)
+    return compiled
+
+
+def restore_platform(
+    name: str, data: PlatformEntry, flags: int, kinds: Optional[Tuple[PatternKind, ...]]
+) -> CompiledPlatform:
+    """Compile a platform restored from a snapshot.
+
+    With the classification stored in the snapshot, the patterns are known to
+    be valid: they are compiled lazily and the stored classification is used
+    instead of analysing them again. Without it, the platform is compiled
+    eagerly, as by `compile_platform`.
+
+    Args:
+        name: Platform name, used in error messages only.
+        data: Platform configuration.
+        flags: Regex flags used for pattern compilation.
+        kinds: Stored classification of each pattern, or None.
+
+    Returns:
+        The shared `CompiledPlatform` for this configuration and flags, or a
+        private copy of it holding the stored classification.
+    """
+    compiled = compile_platform(name, data, flags, lazy=kinds is not None)
+    if kinds is not None and compiled._kinds is None and len(kinds) == len(compiled.entries):
+        compiled = compiled.copy()
+        compiled._kinds = kinds
+    return compiled
+
+
+class RegistrySnapshot:
+    """Immutable state of a `SocialLinks` registry.
+
+    A snapshot is never modified once published. Anything derived from it,
+    such as the host index, is built on first use and stays valid for the
+    snapshot's lifetime; concurrent first uses may both build it, which is
+    harmless since the results are equal.
+
+    Attributes:
+        platforms: Platform definitions by name, in registration order.
+        compiled: Compiled platforms by name, in the same order.
+        generation: Number of registry changes before this snapshot. Used as
+            the result cache generation.
+        subsets: Candidate subsets resolved against this snapshot, by the
+            `candidates` argument they were resolved from.
+        instrumentation: If set, host indexes are built with patterns that
+            record their evaluations in it (see `sociallinks.instrument`).
+        adaptive: If True, the backend builds host indexes owned by this
+            snapshot that reorder their patterns by hit count
+            (`sociallinks.index.AdaptiveIndex`). Ignored by backends without
+            adaptive ordering.
+        backend: Matcher backend building the indexes and platform
+            matchers (see `sociallinks.backend`). Identical registries
+            share their indexes through `sociallinks.backend.shared_index`.
+
+    Args:
+        index: Prebuilt host index over all platforms, used instead of
+            building one (see `sociallinks.codegen`). Not carried over to
+            the next snapshot.
+    """
+
+    __slots__ = (
+        "platforms", "compiled", "generation", "subsets", "instrumentation", "adaptive", "backend", "_index", "_matchers"
+    )
+
+    def __init__(
+        self,
+        platforms: PlatformEntries,
+        compiled: Dict[str, CompiledPlatform],
+        generation: int = 0,
+        instrumentation: Optional["Instrumentation"] = None,
+        adaptive: bool = False,
+        index: Optional["Index"] = None,
+        backend: MatcherBackend = INDEXED,
+    ):
+        self.platforms = platforms
+        self.compiled = compiled
+        self.generation = generation
+        self.instrumentation = instrumentation
+        self.adaptive = adaptive
+        self.backend = backend
+        self.subsets: Dict[Tuple[Any, ...], Tuple[Tuple[str, ...], "Index"]] = {}
+        self._index: Optional["Index"] = index
+        self._matchers: Dict[str, "PlatformMatch"] = {}
+
+    def _build_index(self, platforms: Tuple[Tuple[str, CompiledPlatform], ...]) -> "Index":
+        return self.backend.build_index(platforms, adaptive=self.adaptive, instrumentation=self.instrumentation)
+
+    @property
+    def index(self) -> "Index":
+        """Host index over all platforms, in registry order."""
+        index = self._index
+        if index is None:
+            index = self._index = self._build_index(tuple(self.compiled.items()))
+        return index
+
+    def subset_index(self, names: Tuple[str, ...]) -> "Index":
+        """Return the host index over the given platforms, in the given order.
+
+        Raises:
+            KeyError: If a platform is not registered.
+        """
+        compiled = self.compiled
+        return self._build_index(tuple((name, compiled[name]) for name in names))
+
+    def platform_matcher(self, name: str, platform: CompiledPlatform) -> "PlatformMatch":
+        """Return the matcher of one of the compiled platforms of this snapshot.
+
+        With instrumentation, the matcher records its evaluations and is
+        built once per snapshot.
+        """
+        instrumentation = self.instrumentation
+        if instrumentation is None:
+            return self.backend.platform_matcher(platform)
+        matcher = self._matchers.get(name)
+        if matcher is None:
+            matcher = self._matchers.setdefault(name, instrumentation.platform_matcher(name, platform))
+        return matcher
+
+    def replace(
+        self,
+        updates: Optional[Dict[str, Tuple[PlatformEntry, CompiledPlatform]]] = None,
+        deletes: Tuple[str, ...] = (),
+    ) -> "RegistrySnapshot":
+        """Return the next snapshot, with platforms added, replaced or deleted.
+
+        Replaced platforms keep their position; new ones are appended.
+        """
+        platforms = dict(self.platforms)
+        compiled = dict(self.compiled)
+        for name in deletes:
+            del platforms[name]
+            del compiled[name]
+        for name, (data, platform) in (updates or {}).items():
+            platforms[name] = data
+            compiled[name] = platform
+        return RegistrySnapshot(
+            platforms, compiled, self.generation + 1, self.instrumentation, self.adaptive, backend=self.backend
+        )
+
+    def instrumented(self, instrumentation: Optional["Instrumentation"]) -> "RegistrySnapshot":
+        """Return a snapshot of the same registry with other instrumentation.
+
+        The generation is kept: results cached from this snapshot stay valid.
+        """
+        return RegistrySnapshot(
+            self.platforms, self.compiled, self.generation, instrumentation, self.adaptive, backend=self.backend
+        )
+
+
+def clear_cache() -> None:
+    """Drop all cached compiled platforms and host indexes.
+
+    Existing `SocialLinks` instances keep working with the compiled patterns
+    they already reference.
+    """
+    with _lock:
+        _cache.clear()
+    shared_index.cache_clear()
+
+
+def cache_size() -> int:
+    """Return the number of cached compiled platforms."""
+    return len(_cache)
@@ -0,0 +1,149 @@
+"""Result types returned by the sociallinks library.
+
+This module defines the lightweight value objects returned by the parsing
+APIs of `SocialLinks`. They use ``__slots__`` or are named tuples, so that
+large batches of results stay cheap to create and to keep in memory.
+"""
+from typing import Any, Dict, NamedTuple, Optional, Tuple
+
+# ----------------------------------------------------------------------
+# Batch error codes
+# ----------------------------------------------------------------------
+
+INVALID_TYPE = "invalid_type"
+"""The input item is not a string."""
+
+EMPTY_URL = "empty_url"
+"""The input item is empty or whitespace only."""
+
+NO_MATCH = "no_match"
+"""No registered platform matches the URL."""
+
+URL_MISMATCH = "url_mismatch"
+"""The URL does not match the requested platform (see `URLMismatchError`)."""
+
+ID_EXTRACTION = "id_extraction"
+"""The URL matches but no identifier could be extracted (see `PlatformIDExtractionError`)."""
+
+
+class ParseResult:
+    """Outcome of parsing a URL with `SocialLinks.parse`.
+
+    Batch APIs such as `SocialLinks.parse_many` also use this class to
+    report failures: in that case `error` holds one of the error codes
+    defined in this module and the remaining attributes are None, except
+    `platform` when it is known.
+
+    Attributes:
+        platform: Name of the detected platform (e.g., "linkedin").
+        entry: Index of the matching configuration variant within the
+            platform's `PlatformEntry` list (e.g., 0 for LinkedIn profiles,
+            1 for LinkedIn companies).
+        id: Platform identifier extracted from the URL (e.g., "johndoe").
+        url: Sanitized URL in the platform's canonical format.
+        pattern: Source of the regex pattern that matched the URL.
+        error: Error code if the URL could not be parsed, None otherwise.
+
+    Examples:
+        >>> sl = SocialLinks()
+        >>> result = sl.parse("https://www.linkedin.com/company/acme/")
+        >>> result.platform, result.entry, result.id
+        ('linkedin', 1, 'acme')
+        >>> result.url
+        'https://linkedin.com/company/acme'
+    """
+
+    __slots__ = ("platform", "entry", "id", "url", "pattern", "error")
+
+    def __init__(
+        self,
+        platform: Optional[str],
+        entry: Optional[int],
+        id: Optional[str],
+        url: Optional[str],
+        pattern: Optional[str],
+        error: Optional[str] = None,
+    ):
+        self.platform = platform
+        self.entry = entry
+        self.id = id
+        self.url = url
+        self.pattern = pattern
+        self.error = error
+
+    @classmethod
+    def failure(cls, error: str, platform: Optional[str] = None) -> "ParseResult":
+        """Create a result describing a failed parse.
+
+        Args:
+            error: One of the error codes defined in this module.
+            platform: Platform name, if known.
+
+        Returns:
+            A `ParseResult` with only `error` (and optionally `platform`) set.
+        """
+        return cls(platform, None, None, None, None, error)
+
+    @property
+    def ok(self) -> bool:
+        """True if the URL was parsed successfully."""
+        return self.error is None
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the result as a plain dictionary.
+
+        Returns:
+            A dictionary with one key per attribute.
+        """
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ParseResult):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"ParseResult({fields})"
+
+
+class ExtractedLink(NamedTuple):
+    """A social profile link found in text by `SocialLinks.iter_links`.
+
+    Attributes:
+        span: ``(start, end)`` offsets of the link in the scanned text, so
+            that ``text[start:end]`` is the link as written.
+        platform: Name of the detected platform.
+        id: Platform identifier extracted from the link.
+        url: Sanitized URL in the platform's canonical format.
+
+    Examples:
+        >>> sl = SocialLinks()
+        >>> sl.extract_links("Code: https://www.github.com/username/.")
+        [ExtractedLink(span=(6, 38), platform='github', id='username', url='https://github.com/username')]
+    """
+
+    span: Tuple[int, int]
+    platform: str
+    id: str
+    url: str
+
+
+class HtmlLink(NamedTuple):
+    """A social profile link found in an HTML document by `SocialLinks.iter_html_links`.
+
+    Attributes:
+        position: ``(line, column)`` of the tag holding the link, with lines
+            starting at 1 and columns at 0, as reported by `html.parser`.
+        href: The ``href`` attribute, unescaped and resolved against the
+            document's base URL.
+        platform: Name of the detected platform.
+        id: Platform identifier extracted from the link.
+        url: Sanitized URL in the platform's canonical format.
+    """
+
+    position: Tuple[int, int]
+    href: str
+    platform: str
+    id: str
+    url: str
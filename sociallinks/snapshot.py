@@ -0,0 +1,138 @@
+"""Serialized form of a `SocialLinks` registry.
+
+`SocialLinks.snapshot()` encodes the platform definitions, the regex flags,
+the normalizer configuration and the host index classification of every pattern into a compact blob:
+a magic header, a format version byte and zlib-compressed JSON. The blob
+holds no code and is safe to load from untrusted sources, although the
+regexes it contains are of course run on the input.
+
+`SocialLinks.from_snapshot()` restores an instance without repeating the
+work a fresh build does. Patterns were validated when the snapshot was
+taken, so they are compiled lazily, on first use, and the stored
+classification replaces the pattern analysis of the host index.
+
+`SNAPSHOT_VERSION` must be incremented whenever the meaning of the stored
+data changes, such as the output of `sociallinks.index.classify_pattern`.
+Blobs written with another version are rejected.
+"""
+import json
+import sys
+import zlib
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+from sociallinks.constants import PlatformEntries, PlatformEntry
+from sociallinks.index import PatternKind
+from sociallinks.registry import CompiledPlatform, LazyPattern
+
+MAGIC = b"SLSNAP"
+"""Header of every snapshot blob."""
+
+SNAPSHOT_VERSION = 2
+"""Version of the snapshot format."""
+
+
+class Snapshot(NamedTuple):
+    """Decoded content of a snapshot blob.
+
+    Attributes:
+        platforms: Platform definitions by name, in registration order.
+        regex_flags: Regex flags the platforms were compiled with.
+        url_only: Default of the `url_only` detection mode.
+        kinds: Host index classification of the patterns of each platform,
+            or None if it cannot be reused, because the blob was written by
+            another Python version.
+        normalize: Configuration of the input normalizer
+            (`sociallinks.normalize.Normalizer.as_dict()`), or None.
+    """
+
+    platforms: PlatformEntries
+    regex_flags: int
+    url_only: bool
+    kinds: Optional[Dict[str, Tuple[PatternKind, ...]]]
+    normalize: Optional[Dict[str, Any]] = None
+
+
+def dumps(
+    compiled: Dict[str, Tuple[PlatformEntry, CompiledPlatform]],
+    regex_flags: int,
+    url_only: bool,
+    normalize: Optional[Dict[str, Any]] = None,
+) -> bytes:
+    """Encode a registry into a snapshot blob.
+
+    Lazily compiled patterns are compiled first, so that a blob only ever
+    holds valid patterns.
+
+    Args:
+        compiled: ``(definition, compiled platform)`` pairs by name, in
+            registration order.
+        regex_flags: Regex flags the platforms were compiled with.
+        url_only: Default of the `url_only` detection mode.
+        normalize: Configuration of the input normalizer, or None.
+
+    Returns:
+        The snapshot blob.
+
+    Raises:
+        InvalidPlatformRegexError: If a lazily compiled pattern is invalid.
+        TypeError: If a platform definition is not JSON-serializable.
+    """
+    platforms: List[Any] = []
+    for name, (data, platform) in compiled.items():
+        for pattern in platform.patterns():
+            if isinstance(pattern, LazyPattern):
+                pattern.compile()
+        platforms.append([name, data, [[kind, list(keys)] for kind, keys in platform.kinds]])
+    payload = {
+        "python": list(sys.version_info[:2]),
+        "regex_flags": int(regex_flags),
+        "url_only": url_only,
+        "normalize": normalize,
+        "platforms": platforms,
+    }
+    encoded = json.dumps(payload, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+    return MAGIC + bytes((SNAPSHOT_VERSION,)) + zlib.compress(encoded, 9)
+
+
+def loads(blob: bytes) -> Snapshot:
+    """Decode a snapshot blob.
+
+    Args:
+        blob: Blob returned by `dumps()`.
+
+    Returns:
+        The decoded `Snapshot`.
+
+    Raises:
+        TypeError: If blob is not bytes.
+        ValueError: If blob is not a snapshot, is corrupt, or was written
+            with another format version.
+    """
+    if not isinstance(blob, (bytes, bytearray, memoryview)):
+        raise TypeError("snapshot must be bytes")
+    blob = bytes(blob)
+    if not blob.startswith(MAGIC) or len(blob) <= len(MAGIC):
+        raise ValueError("not a sociallinks snapshot")
+    version = blob[len(MAGIC)]
+    if version != SNAPSHOT_VERSION:
+        raise ValueError(f"unsupported snapshot version {version} (expected {SNAPSHOT_VERSION})")
+    try:
+        payload = json.loads(zlib.decompress(blob[len(MAGIC) + 1:]).decode("utf-8"))
+        same_python = tuple(payload["python"]) == tuple(sys.version_info[:2])
+        platforms: PlatformEntries = {}
+        kinds: Dict[str, Tuple[PatternKind, ...]] = {}
+        for name, data, platform_kinds in payload["platforms"]:
+            platforms[name] = data
+            kinds[name] = tuple((kind, tuple(keys)) for kind, keys in platform_kinds)
+        normalize = payload["normalize"]
+        if normalize is not None and not isinstance(normalize, dict):
+            raise TypeError("normalize must be an object")
+        return Snapshot(
+            platforms,
+            int(payload["regex_flags"]),
+            bool(payload["url_only"]),
+            kinds if same_python else None,
+            normalize,
+        )
+    except (zlib.error, UnicodeDecodeError, KeyError, TypeError, ValueError) as e:
+        raise ValueError(f"corrupt sociallinks snapshot: {e}") from e
@@ -0,0 +1,155 @@
+"""Inputs and harnesses shared by the test modules."""
+import random
+from sociallinks.backend import REFERENCE
+from sociallinks.core import SocialLinks
+
+SAMPLE_URLS = [
+    "https://github.com/johndoe",
+    "https://www.linkedin.com/in/johndoe/",
+    "https://uk.linkedin.com/in/johndoe",
+    "https://de.linkedin.com/company/acme",
+    "https://t.me/johndoe",
+    "https://telegram.dog/johndoe",
+    "https://web.telegram.org/k/#@johndoe",
+    "https://johndoe.bandcamp.com",
+    "https://johndoe.substack.com/",
+    "https://music.apple.com/us/artist/name/id123456",
+    "https://open.spotify.com/artist/4r7sp4bvfy",
+    "spotify:artist:4r7sp4bvfy",
+    "weixin://dl/chat?johndoe",
+    "https://news.ycombinator.com/user?id=johndoe",
+    "https://signal.me/#p/johndoe",
+    "https://m.facebook.com/johndoe",
+    "https://mobile.twitter.com/@johndoe",
+    "https://x.com/johndoe",
+    "https://old.reddit.com/r/python",
+    "u/johndoe",
+    "r/python",
+    "@johndoe",
+    "johndoe",
+    "john.doe",
+    "+1234567890",
+    "https://example.com/johndoe",
+    "https://evil.com/https://github.com/johndoe",
+    "xhttps://github.com/johndoe",
+    "https://GITHUB.COM/JohnDoe",
+    "https://github.com:443/johndoe",
+    "https://gïthub.com/johndoe",
+    "github.com/johndoe",
+    "https://",
+    "://",
+    "not a url",
+]
+
+
+def mutations(urls, count, seed=7):
+    """Deterministic variations of `urls`: prefixes, suffixes and duplicated URLs."""
+    rng = random.Random(seed)
+    pieces = ["", " ", "/", "x", "http://", "https://", "@", "?a=1", "#top", "www.", "HTTPS://"]
+    out = []
+    for _ in range(count):
+        url = rng.choice(urls)
+        other = rng.choice(urls)
+        choice = rng.randrange(4)
+        if choice == 0:
+            out.append(rng.choice(pieces) + url)
+        elif choice == 1:
+            out.append(url + rng.choice(pieces))
+        elif choice == 2:
+            out.append(f"{url} {other}")
+        else:
+            cut = rng.randrange(len(url) + 1)
+            out.append(url[:cut] + rng.choice(pieces) + url[cut:])
+    return out
+
+
+def custom_platforms(count, seed=5):
+    """Deterministic custom platforms and inputs for them.
+
+    Patterns share literal prefixes such as ``https?://``, use optional
+    groups and top-level alternations, and overlap across platforms.
+    """
+    rng = random.Random(seed)
+    hosts = ["a.com", "b.com", "ab.com", "a.io"]
+    paths = ["", "u/", "in/", "u/in/"]
+    heads = ["https?://", "https://", "http://", "https?://(?:www\\.)?", "^https?://", "^", "@"]
+    platforms = {}
+    inputs = []
+    for number in range(count):
+        entries = []
+        for entry in range(rng.randint(1, 3)):
+            patterns = []
+            for _ in range(rng.randint(1, 3)):
+                branches = []
+                for branch in range(rng.choice([1, 1, 2])):
+                    host = rng.choice(hosts)
+                    path = rng.choice(paths)
+                    head = rng.choice(heads)
+                    # A group name can only be used once per pattern
+                    group = "(?P<id>{})" if not branch else "({})"
+                    if head in ("^", "@"):
+                        optional = f"(?:{path.replace('/', '[/:]')})?" if path else ""
+                        body = head + optional + group.format("[a-z0-9]+")
+                    else:
+                        optional = f"(?:{path})?" if path and rng.random() < 0.5 else path
+                        body = head + host.replace(".", "\\.") + "/" + optional + group.format("\\w+")
+                    body += rng.choice(["", "/?$", "/?", "$"])
+                    branches.append(body)
+                    inputs.append(f"{rng.choice(['https://', 'http://', 'https://www.', ''])}{host}/{path}user{number}")
+                    inputs.append(f"{rng.choice(['', '@', 'zz'])}{path}user{number}")
+                patterns.append("|".join(branches))
+            entries.append({"patterns": patterns, "sanitized": f"https://p{number}.example/{entry}/{{id}}"})
+        platforms[f"p{number}"] = entries
+    return platforms, inputs + mutations(inputs, 3 * len(inputs), seed=seed)
+
+
+class _Raised:
+    """An exception raised by a call, compared by type and message."""
+
+    def __init__(self, error):
+        self.error = error
+
+    def __eq__(self, other):
+        return isinstance(other, _Raised) and (type(self.error), str(self.error)) == (type(other.error), str(other.error))
+
+    def __repr__(self):
+        return f"raised {self.error!r}"
+
+
+def _outcome(method, args, kwargs):
+    try:
+        result = method(*args, **kwargs)
+    except Exception as e:
+        return _Raised(e)
+    if hasattr(result, "__next__"):
+        return list(result)
+    return result
+
+
+class DifferentialSocialLinks:
+    """Runs every call on a default and a reference backend instance.
+
+    Results, including raised exceptions, must be identical; they are then
+    returned, or raised, as a single instance would. Iterator arguments are
+    materialized first so that both instances see the same items.
+    """
+
+    def __init__(self, *args, **kwargs):
+        self.fast = SocialLinks(*args, **kwargs)
+        self.reference = SocialLinks(*args, backend=REFERENCE, **kwargs)
+
+    def __getattr__(self, name):
+        attr = getattr(self.fast, name)
+        if not callable(attr):
+            return attr
+
+        def call(*args, **kwargs):
+            args = [list(arg) if hasattr(arg, "__next__") else arg for arg in args]
+            expected = _outcome(getattr(self.reference, name), args, kwargs)
+            actual = _outcome(attr, args, kwargs)
+            assert actual == expected, (name, args, kwargs)
+            if isinstance(actual, _Raised):
+                raise actual.error
+            return actual
+
+        return call
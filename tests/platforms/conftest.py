@@ -1,10 +1,14 @@
 """Pytest configuration and fixtures for platform tests."""
 import pytest
-from sociallinks.core import SocialLinks
+from tests.helpers import DifferentialSocialLinks
 
 
 @pytest.fixture
 def sl():
-    """Create a SocialLinks instance with predefined platforms."""
-    return SocialLinks()
+    """Create a SocialLinks instance with predefined platforms.
+
+    Every call runs on both the default and the reference matcher backend,
+    and fails if their results differ.
+    """
+    return DifferentialSocialLinks()
 
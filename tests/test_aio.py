@@ -0,0 +1,144 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from sociallinks.aio import AsyncSocialLinks
+from sociallinks.core import SocialLinks
+from sociallinks.exceptions import PlatformNotFoundError
+from sociallinks.results import NO_MATCH, URL_MISMATCH
+
+URLS = [
+    "https://github.com/johndoe",
+    "  https://www.linkedin.com/in/johndoe/  ",
+    "https://example.com",
+    "",
+    "@johndoe",
+    "https://x.com/johndoe",
+] * 10
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+async def agen(items):
+    for item in items:
+        await asyncio.sleep(0)
+        yield item
+
+
+class TestBatch:
+    """Test the awaitable batch methods"""
+
+    @pytest.mark.parametrize("inline_threshold", [0, 256])
+    def test_adetect_many(self, inline_threshold):
+        """Test results match the sync API, inline or offloaded"""
+        asl = AsyncSocialLinks(chunk_size=7, inline_threshold=inline_threshold)
+        assert run(asl.adetect_many(URLS)) == asl.sl.detect_many(URLS)
+        assert run(asl.adetect_many(URLS, url_only=True)) == asl.sl.detect_many(URLS, url_only=True)
+
+    def test_async_iterable_input(self):
+        """Test async iterables are accepted"""
+        asl = AsyncSocialLinks(chunk_size=4, inline_threshold=0)
+        assert run(asl.adetect_many(agen(URLS))) == asl.sl.detect_many(URLS)
+
+    def test_asanitize_many(self):
+        """Test sanitizing reports errors per URL"""
+        asl = AsyncSocialLinks(chunk_size=5, inline_threshold=0)
+        results = run(asl.asanitize_many("github", URLS))
+        assert results == asl.sl.sanitize_many("github", URLS)
+        assert results[2] == (None, URL_MISMATCH)
+        with pytest.raises(PlatformNotFoundError):
+            run(asl.asanitize_many("unknown", URLS))
+
+    def test_aparse_many(self):
+        """Test parsing with and without a fixed platform"""
+        asl = AsyncSocialLinks(chunk_size=5, inline_threshold=0)
+        results = run(asl.aparse_many(URLS))
+        assert [r.url for r in results] == [r.url for r in asl.sl.parse_many(URLS)]
+        results = run(asl.aparse_many(URLS, "x"))
+        assert results[5].url == "https://x.com/johndoe"
+
+    def test_custom_executor(self):
+        """Test chunks can run in a given thread pool"""
+        with ThreadPoolExecutor(1) as executor:
+            asl = AsyncSocialLinks(executor=executor, chunk_size=8, inline_threshold=0)
+            assert run(asl.adetect_many(URLS)) == asl.sl.detect_many(URLS)
+
+    def test_errors_propagate(self):
+        """Test errors raised in chunks are raised to the caller"""
+        asl = AsyncSocialLinks(chunk_size=2, inline_threshold=0)
+        with pytest.raises(TypeError):
+            run(asl.adetect_many(URLS + [None]))
+
+    def test_invalid_arguments(self):
+        """Test constructor arguments are validated"""
+        with pytest.raises(ValueError):
+            AsyncSocialLinks(chunk_size=0)
+        with pytest.raises(ValueError):
+            AsyncSocialLinks(processes=0)
+        with pytest.raises(ValueError):
+            AsyncSocialLinks(executor=ThreadPoolExecutor(1), processes=1)
+
+
+class TestIterators:
+    """Test the async iterators"""
+
+    def test_aiter_detect(self):
+        """Test streaming detection keeps input order"""
+        asl = AsyncSocialLinks(chunk_size=3, inline_threshold=0)
+
+        async def collect():
+            return [p async for p in asl.aiter_detect(agen(URLS))]
+
+        assert run(collect()) == asl.sl.detect_many(URLS)
+
+    def test_aiter_parse(self):
+        """Test streaming parsing yields ParseResult items"""
+        asl = AsyncSocialLinks(chunk_size=3)
+
+        async def collect():
+            return [r.error async for r in asl.aiter_parse(URLS)]
+
+        assert run(collect()).count(NO_MATCH) == 10
+
+    def test_backpressure(self):
+        """Test the source is read at most `concurrency` chunks ahead"""
+        asl = AsyncSocialLinks(chunk_size=2, inline_threshold=0, concurrency=2)
+        consumed = []
+
+        async def source():
+            for url in URLS:
+                consumed.append(url)
+                yield url
+
+        async def first():
+            iterator = asl.aiter_detect(source())
+            platform = await iterator.__anext__()
+            await iterator.aclose()
+            return platform
+
+        assert run(first()) == "github"
+        assert len(consumed) <= 2 * 2 + 1
+
+
+class TestProcesses:
+    """Test offloading to a process pool"""
+
+    def test_processes(self):
+        """Test results match and the pool follows registry changes"""
+        sl = SocialLinks()
+
+        async def main():
+            async with AsyncSocialLinks(sl, processes=2, chunk_size=8, inline_threshold=0) as asl:
+                first = await asl.aparse_many(URLS)
+                sl.delete_platform("github")
+                second = await asl.adetect_many(URLS)
+                return first, second
+
+        first, second = run(main())
+        assert [(r.platform, r.url, r.error) for r in first] == [
+            (r.platform, r.url, r.error) for r in SocialLinks().parse_many(URLS)
+        ]
+        assert "github" not in second
+        assert second == sl.detect_many(URLS)
@@ -0,0 +1,119 @@
+import pytest
+from sociallinks.backend import INDEXED, REFERENCE, IndexedBackend, LinearIndex
+from sociallinks.core import SocialLinks
+from sociallinks.index import AdaptiveIndex, HostIndex
+from tests.helpers import SAMPLE_URLS, DifferentialSocialLinks, custom_platforms, mutations
+
+
+def test_default_backend():
+    """Test SocialLinks uses the indexed backend by default"""
+    sl = SocialLinks()
+    assert sl.backend is INDEXED
+    assert isinstance(sl._get_index(), HostIndex)
+    reference = SocialLinks(backend=REFERENCE)
+    assert isinstance(reference._get_index(), LinearIndex)
+    assert reference.detect_platform("https://github.com/johndoe") == "github"
+
+
+def test_indexes_built_by_backend():
+    """Test every index, including the default one, is built by the backend"""
+    built = []
+
+    class RecordingBackend(IndexedBackend):
+        def build_index(self, platforms, **kwargs):
+            built.append((len(platforms), kwargs["adaptive"]))
+            return super().build_index(platforms, **kwargs)
+
+    sl = SocialLinks(backend=RecordingBackend())
+    assert sl.detect_platform("https://github.com/johndoe") == "github"
+    assert sl.detect_platform("https://github.com/johndoe", candidates=["x", "github"]) == "github"
+    assert built == [(len(sl.list_platforms()), False), (2, False)]
+    assert isinstance(SocialLinks(adaptive=True)._get_index(), AdaptiveIndex)
+    assert SocialLinks()._get_index() is SocialLinks()._get_index()
+
+
+def test_reference_platform_matchers_cached():
+    """Test the reference backend builds one matcher per compiled platform"""
+    sl = SocialLinks(backend=REFERENCE)
+    compiled = sl._compiled["github"]
+    assert REFERENCE.platform_matcher(compiled) is REFERENCE.platform_matcher(compiled)
+    assert sl.is_valid("github", "https://github.com/johndoe")
+    assert sl.sanitize("github", "https://github.com/johndoe") == "https://github.com/johndoe"
+
+
+class TestDifferential:
+    """Test the default backend returns what the reference backend returns"""
+
+    @pytest.fixture
+    def sl(self):
+        return DifferentialSocialLinks()
+
+    def test_generated_inputs(self, sl):
+        """Test detection and parsing of generated inputs"""
+        urls = SAMPLE_URLS + mutations(SAMPLE_URLS, 1000)
+        sl.detect_many(urls)
+        sl.detect_many(urls, url_only=True)
+        sl.parse_many(urls)
+        sl.parse_many(urls, url_only=True)
+        for url in urls[:200]:
+            sl.detect_platform(url, candidates=["x", "github", "behance"])
+            try:
+                sl.parse(url)
+            except Exception:
+                pass
+
+    def test_generated_inputs_per_platform(self, sl):
+        """Test validation and sanitization of generated inputs on every platform"""
+        urls = SAMPLE_URLS + mutations(SAMPLE_URLS, 200, seed=11)
+        for name in sl.list_platforms():
+            sl.sanitize_many(name, urls)
+            for url in urls[:40]:
+                sl.is_valid(name, url)
+
+    def test_text_extraction(self, sl):
+        """Test link extraction from text"""
+        text = " and ".join(mutations(SAMPLE_URLS, 300, seed=3))
+        sl.extract_links(text)
+
+    def test_custom_platforms_and_changes(self, sl):
+        """Test custom and overlapping platforms, and registry changes"""
+        sl.set_platform("catchall", [{"patterns": [r"https?://[^/]+/(?P<id>\w+)/?$"], "sanitized": "https://all/{id}"}])
+        sl.detect_many(SAMPLE_URLS)
+        sl.delete_platform("github")
+        sl.parse_many(SAMPLE_URLS)
+        assert sl.reference.backend is REFERENCE
+
+    @pytest.mark.parametrize("seed", range(8))
+    def test_generated_custom_platforms(self, seed):
+        """Test generated alternations, shared prefixes and optional groups"""
+        platforms, urls = custom_platforms(6, seed)
+        sl = DifferentialSocialLinks(use_predefined_platforms=False)
+        sl.set_platforms(platforms)
+        sl.detect_many(urls)
+        sl.detect_many(urls, url_only=True)
+        sl.parse_many(urls)
+        sl.extract_links(" ".join(urls))
+        for name in platforms:
+            sl.sanitize_many(name, urls)
+            sl.parse_many(urls, name)
+            for url in urls[:40]:
+                sl.is_valid(name, url)
+                sl.detect_platform(url, candidates=[name, "p0"])
+
+    def test_mismatch_is_reported(self, monkeypatch):
+        """Test the harness notices diverging results"""
+        sl = DifferentialSocialLinks()
+        monkeypatch.setattr(sl.reference, "detect_platform", lambda url: "other")
+        with pytest.raises(AssertionError):
+            sl.detect_platform("https://github.com/johndoe")
+
+
+def test_reference_backend_with_instrumentation():
+    """Test instrumentation and snapshots keep the backend"""
+    sl = SocialLinks(backend=REFERENCE)
+    stats = sl.enable_instrumentation()
+    assert sl.detect_platform("https://github.com/johndoe") == "github"
+    assert isinstance(sl._get_index(), LinearIndex)
+    assert stats.as_dict()["platforms"]["behance"][0]["evaluations"] == 1
+    sl.clear_platforms()
+    assert sl.backend is REFERENCE
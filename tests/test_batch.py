@@ -0,0 +1,228 @@
+import pytest
+from sociallinks.core import SocialLinks
+from sociallinks.exceptions import PlatformNotFoundError
+from sociallinks.parallel import init_worker, run_chunk
+from sociallinks.results import (
+    EMPTY_URL,
+    ID_EXTRACTION,
+    INVALID_TYPE,
+    NO_MATCH,
+    URL_MISMATCH,
+)
+
+URLS = [
+    "https://github.com/johndoe",
+    "  https://www.linkedin.com/in/johndoe/  ",
+    "https://example.com",
+    "",
+    "@johndoe",
+    "https://x.com/johndoe",
+]
+
+
+class TestDetectMany:
+    """Test detect_many method"""
+
+    def test_detect_many_matches_detect_platform(self):
+        """Test batch detection agrees with single detection"""
+        sl = SocialLinks()
+        assert sl.detect_many(URLS) == [sl.detect_platform(url) for url in URLS]
+
+    def test_detect_many_lazy(self):
+        """Test lazy batch detection returns an iterator"""
+        sl = SocialLinks()
+        results = sl.detect_many(iter(URLS), lazy=True)
+        assert not isinstance(results, list)
+        assert list(results) == sl.detect_many(URLS)
+
+    def test_detect_many_invalid_type(self):
+        """Test batch detection with a non-string item"""
+        sl = SocialLinks()
+        with pytest.raises(TypeError, match="url must be str, not NoneType"):
+            sl.detect_many(["https://github.com/johndoe", None])
+
+
+class TestSanitizeMany:
+    """Test sanitize_many method"""
+
+    def test_sanitize_many(self):
+        """Test batch sanitization reports failures as error codes"""
+        sl = SocialLinks()
+        results = sl.sanitize_many("github", [
+            "http://www.github.com/johndoe",
+            "https://example.com",
+            "   ",
+            123,
+        ])
+        assert results == [
+            ("https://github.com/johndoe", None),
+            (None, URL_MISMATCH),
+            (None, EMPTY_URL),
+            (None, INVALID_TYPE),
+        ]
+
+    def test_sanitize_many_matches_sanitize(self):
+        """Test batch sanitization agrees with single sanitization"""
+        sl = SocialLinks()
+        urls = ["https://www.linkedin.com/in/johndoe/", "https://linkedin.com/company/acme"]
+        assert [url for url, _ in sl.sanitize_many("linkedin", urls)] == [
+            sl.sanitize("linkedin", url) for url in urls
+        ]
+
+    def test_sanitize_many_id_extraction(self):
+        """Test batch sanitization when no ID can be extracted"""
+        sl = SocialLinks(use_predefined_platforms=False)
+        sl.set_platform("example", [{
+            "patterns": [r"https?://example\.com/static/?$"],
+            "sanitized": "https://example.com/{id}",
+        }])
+        assert sl.sanitize_many("example", ["https://example.com/static"]) == [(None, ID_EXTRACTION)]
+
+    def test_sanitize_many_unknown_platform(self):
+        """Test batch sanitization raises for unknown platforms up front"""
+        sl = SocialLinks()
+        with pytest.raises(PlatformNotFoundError, match="Unknown platform"):
+            sl.sanitize_many("unknown", ["https://github.com/johndoe"], lazy=True)
+
+
+class TestFormatMany:
+    """Test format_many method"""
+
+    def test_format_many_matches_sanitize(self):
+        """Test formatting extracted IDs gives the sanitized URLs"""
+        sl = SocialLinks()
+        for result in sl.parse_many(URLS):
+            if result.error is None:
+                assert sl.format_many(result.platform, [result.id], entry=result.entry) == [result.url]
+
+    def test_format_many_cleans_ids(self):
+        """Test IDs are cleaned as extracted IDs are, and empty ones give None"""
+        sl = SocialLinks()
+        assert sl.format_many("github", [" johndoe/ ", "", "/"]) == ["https://github.com/johndoe", None, None]
+
+    def test_format_many_entry(self):
+        """Test the template of a later configuration entry"""
+        sl = SocialLinks()
+        assert sl.format_many("crunchbase", ["johndoe"], entry=1) == ["https://www.crunchbase.com/person/johndoe"]
+        with pytest.raises(ValueError, match="no configuration entry 9"):
+            sl.format_many("crunchbase", ["johndoe"], entry=9)
+
+    def test_format_many_fallback_template(self):
+        """Test templates that cannot be split are rendered with str.format"""
+        sl = SocialLinks(use_predefined_platforms=False)
+        sl.set_platform("example", [{"patterns": [r"^(?P<id>\w+)$"], "sanitized": "https://example.com/{id}/{id!s}"}])
+        assert sl._compiled["example"].templates == (None,)
+        assert sl.format_many("example", ["john"]) == ["https://example.com/john/john"]
+
+    def test_format_many_lazy_and_errors(self):
+        """Test lazy results and argument errors"""
+        sl = SocialLinks()
+        results = sl.format_many("x", iter(["johndoe"]), lazy=True)
+        assert not isinstance(results, list)
+        assert list(results) == ["https://x.com/johndoe"]
+        with pytest.raises(TypeError, match="id must be str, not int"):
+            sl.format_many("x", ["johndoe", 1])
+        with pytest.raises(PlatformNotFoundError):
+            sl.format_many("unknown", [])
+
+
+class TestParseMany:
+    """Test parse_many method"""
+
+    def test_parse_many(self):
+        """Test batch parsing agrees with parse and reports failures"""
+        sl = SocialLinks()
+        results = sl.parse_many(URLS + [None])
+        assert [r.error for r in results] == [None, None, NO_MATCH, EMPTY_URL, None, None, INVALID_TYPE]
+        for url, result in zip(URLS, results):
+            if result.ok:
+                assert result == sl.parse(url)
+
+    def test_parse_many_fixed_platform(self):
+        """Test batch parsing against a fixed platform"""
+        sl = SocialLinks()
+        results = sl.parse_many(["https://twitter.com/johndoe", "https://github.com/johndoe"], "x")
+        assert results[0].url == "https://x.com/johndoe"
+        assert results[0].platform == "x"
+        assert results[1].error == URL_MISMATCH
+        assert results[1].platform == "x"
+
+    def test_parse_many_lazy(self):
+        """Test lazy batch parsing consumes the input on demand"""
+        sl = SocialLinks()
+        consumed = []
+
+        def urls():
+            for url in URLS:
+                consumed.append(url)
+                yield url
+
+        results = sl.parse_many(urls(), lazy=True)
+        assert consumed == []
+        assert next(results).platform == "github"
+        assert consumed == URLS[:1]
+
+
+class TestMapParallel:
+    """Test parsing in worker processes"""
+
+    def _rows(self, results):
+        return [(r.platform, r.id, r.url, r.error) for r in results]
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_map_parallel(self, workers):
+        """Test rows match parse_many, in input order, across chunks"""
+        sl = SocialLinks()
+        urls = (URLS + [None]) * 5
+        rows = sl.map_parallel(urls, workers=workers, chunk_size=3)
+        assert rows == self._rows(sl.parse_many(urls))
+
+    def test_map_parallel_options(self):
+        """Test fixed platform, candidates and URL-only modes"""
+        sl = SocialLinks()
+        urls = ["https://twitter.com/johndoe", "https://github.com/johndoe", "johndoe"]
+        assert sl.map_parallel(urls, "x", workers=2) == self._rows(sl.parse_many(urls, "x"))
+        assert [r[0] for r in sl.map_parallel(urls, workers=2, candidates=["github"])] == [None, "github", "github"]
+        assert [r[3] for r in sl.map_parallel(urls, workers=2, url_only=True)] == [None, None, NO_MATCH]
+
+    def test_map_parallel_custom_platforms(self):
+        """Test workers receive the instance's own platform definitions"""
+        sl = SocialLinks(use_predefined_platforms=False)
+        sl.set_platform("example", [{
+            "patterns": [r"https?://example\.com/(?P<id>\w+)"],
+            "sanitized": "https://example.com/{id}",
+        }])
+        rows = sl.map_parallel(["http://example.com/abc", "https://github.com/abc"], workers=2)
+        assert rows == [
+            ("example", "abc", "https://example.com/abc", None),
+            (None, None, None, NO_MATCH),
+        ]
+
+    def test_worker_helpers(self):
+        """Test a worker restores the registry and runs batch methods on chunks"""
+        sl = SocialLinks(use_predefined_platforms=False)
+        sl.set_platform("example", [{"patterns": [r"https?://example\.com/(?P<id>\w+)"], "sanitized": "https://example.com/{id}"}])
+        init_worker(sl.snapshot())
+        urls = ["http://example.com/abc", "https://github.com/abc"]
+        assert run_chunk("detect_many", urls) == ["example", None]
+        assert run_chunk("sanitize_many", urls[:1], ("example",)) == sl.sanitize_many("example", urls[:1])
+        assert run_chunk("parse_many", urls, kwargs={"url_only": True}) == sl.parse_many(urls, url_only=True)
+
+    def test_map_parallel_lazy(self):
+        """Test lazy parallel parsing returns an iterator"""
+        sl = SocialLinks()
+        results = sl.map_parallel(iter(URLS), workers=2, chunk_size=2, lazy=True)
+        assert next(results)[0] == "github"
+        assert len(list(results)) == len(URLS) - 1
+
+    def test_map_parallel_errors(self):
+        """Test arguments are validated before any worker starts"""
+        sl = SocialLinks()
+        with pytest.raises(PlatformNotFoundError):
+            sl.map_parallel(URLS, "unknown")
+        with pytest.raises(PlatformNotFoundError):
+            sl.map_parallel(URLS, candidates=["github", "unknown"])
+        with pytest.raises(ValueError):
+            sl.map_parallel(URLS, workers=0)
+        with pytest.raises(ValueError):
+            sl.map_parallel(URLS, chunk_size=0)
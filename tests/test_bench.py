@@ -0,0 +1,87 @@
+import json
+import pytest
+from sociallinks import bench
+from sociallinks.core import SocialLinks
+
+
+@pytest.fixture(scope="module")
+def corpus():
+    return bench.build_corpus(seed=1, size=20, adversarial_length=200)
+
+
+class TestCorpus:
+    """Test the benchmark corpus"""
+
+    def test_deterministic(self, corpus):
+        """Test the same seed produces the same corpus"""
+        assert bench.build_corpus(seed=1, size=20, adversarial_length=200) == corpus
+        assert bench.build_corpus(seed=2, size=20, adversarial_length=200) != corpus
+
+    def test_categories(self, corpus):
+        """Test every category holds what it claims"""
+        sl = SocialLinks()
+        assert {name for name, _ in corpus.positives} == set(sl.list_platforms())
+        assert all(sl.is_valid(name, url) for name, url in corpus.positives)
+        assert all(sl.detect_platform(url) is None for url in corpus.misses)
+        assert all(len(s) > 150 for s in corpus.adversarial)
+        assert len(corpus.usernames) == 20
+
+
+class TestRun:
+    """Test running and comparing benchmarks"""
+
+    def test_run_selected(self, corpus):
+        """Test only the selected benchmarks run"""
+        results = bench.run(corpus, rounds=1, only=["detect", "sanitize.positive"])
+        assert list(results) == [
+            "detect.positive",
+            "detect.username",
+            "detect.miss",
+            "detect.adversarial",
+            "sanitize.positive",
+        ]
+        stats = results["sanitize.positive"]
+        assert stats.n == len(corpus.positives)
+        assert 0 < stats.p50_us <= stats.p99_us
+        assert stats.ops_per_sec > 0
+
+    def test_compare(self, corpus):
+        """Test a slowdown above the threshold is reported"""
+        results = bench.run(corpus, rounds=1, only=["is_valid.positive"])
+        baseline = bench.to_json(results, corpus, seed=1)
+        current = json.loads(json.dumps(baseline))
+        current["results"]["is_valid.positive"]["p50_us"] *= 1.5
+        [row] = bench.compare(current, baseline, threshold=0.2)
+        assert row["regression"]
+        assert row["change"] == pytest.approx(0.5)
+        [row] = bench.compare(baseline, baseline)
+        assert not row["regression"]
+
+    def test_compare_rejects_unknown_schema(self):
+        """Test baselines in another format are rejected"""
+        with pytest.raises(ValueError):
+            bench.compare({"results": {}}, {"schema": 0, "results": {}})
+
+    def test_main_json_and_baseline(self, tmp_path, capsys):
+        """Test JSON output, saving a baseline and comparing against it"""
+        path = tmp_path / "baseline.json"
+        args = ["--format", "json", "--rounds", "1", "--size", "10", "--only", "detect.username"]
+        assert bench.main(args + ["--save", str(path)]) == 0
+        document = json.loads(capsys.readouterr().out)
+        assert json.loads(path.read_text()) == document
+        assert list(document["results"]) == ["detect.username"]
+
+        assert bench.main(args + ["--compare", str(path), "--threshold", "100"]) == 0
+        document = json.loads(capsys.readouterr().out)
+        assert document["comparison"][0]["name"] == "detect.username"
+
+    def test_concurrency(self):
+        """Test the multi-threaded benchmark reports both implementations"""
+        results = bench.bench_concurrency(["https://github.com/johndoe"], threads=2, duration=0.05)
+        assert set(results) == {"snapshot", "locked"}
+        assert all(r["reads_per_sec"] > 0 for r in results.values())
+
+    def test_main_rejects_unknown_benchmark(self):
+        """Test unknown benchmark names are rejected"""
+        with pytest.raises(SystemExit):
+            bench.main(["--only", "nope"])
@@ -0,0 +1,112 @@
+import pytest
+from sociallinks.cache import CacheInfo, LRUCache, MISSING
+from sociallinks.core import SocialLinks
+from sociallinks.exceptions import PlatformNotFoundError, URLMismatchError
+
+
+class TestLRUCache:
+    """Test the LRU cache"""
+
+    def test_eviction(self):
+        """Test least recently used entries are evicted first"""
+        cache = LRUCache(2)
+        cache.put("a", 1, 0)
+        cache.put("b", 2, 0)
+        assert cache.get("a", 0) == 1
+        cache.put("c", 3, 0)
+        assert cache.get("b", 0) is MISSING
+        assert cache.get("a", 0) == 1
+        assert cache.get("c", 0) == 3
+        assert cache.info() == CacheInfo(hits=3, misses=1, maxsize=2, currsize=2)
+
+    def test_generation_change_clears(self):
+        """Test a new generation drops cached entries"""
+        cache = LRUCache(2)
+        cache.put("a", 1, 0)
+        assert cache.get("a", 1) is MISSING
+        # Values computed for an outdated generation are not stored
+        cache.put("b", 2, 0)
+        assert cache.get("b", 1) is MISSING
+
+    def test_outdated_generation_misses(self):
+        """Test lookups from an older generation neither hit nor clear the cache"""
+        cache = LRUCache(2)
+        cache.put("a", 1, 0)
+        assert cache.get("a", 1) is MISSING
+        cache.put("a", 2, 1)
+        assert cache.get("a", 0) is MISSING
+        assert cache.get("a", 1) == 2
+
+    def test_invalid_maxsize(self):
+        """Test the cache must have a positive size"""
+        with pytest.raises(ValueError):
+            LRUCache(0)
+
+
+class TestSocialLinksCache:
+    """Test result caching in SocialLinks"""
+
+    def test_cache_disabled_by_default(self):
+        """Test caching is opt-in"""
+        sl = SocialLinks()
+        sl.detect_platform("https://github.com/johndoe")
+        assert sl.cache_info() == CacheInfo(0, 0, 0, 0)
+
+    def test_detect_platform_cached(self):
+        """Test detection results, including non-matches, are cached"""
+        sl = SocialLinks(cache_size=10)
+        for _ in range(3):
+            assert sl.detect_platform("https://github.com/johndoe") == "github"
+            assert sl.detect_platform("https://example.com") is None
+        assert sl.cache_info() == CacheInfo(hits=4, misses=2, maxsize=10, currsize=2)
+
+    def test_is_valid_cached(self):
+        """Test validation results are cached per platform"""
+        sl = SocialLinks(cache_size=10)
+        assert sl.is_valid("github", "https://github.com/johndoe") is True
+        assert sl.is_valid("github", "https://github.com/johndoe") is True
+        assert sl.is_valid("gitlab", "https://github.com/johndoe") is False
+        assert sl.cache_info().hits == 1
+        assert sl.cache_info().currsize == 2
+
+    def test_sanitize_cached(self):
+        """Test sanitized URLs and failures are cached"""
+        sl = SocialLinks(cache_size=10)
+        for _ in range(2):
+            assert sl.sanitize("github", "http://www.github.com/johndoe") == "https://github.com/johndoe"
+            with pytest.raises(URLMismatchError, match="does not match platform 'github'"):
+                sl.sanitize("github", "https://example.com")
+        assert sl.cache_info().hits == 2
+        with pytest.raises(PlatformNotFoundError):
+            sl.sanitize("unknown", "https://github.com/johndoe")
+
+    def test_registry_changes_invalidate_cache(self):
+        """Test set_platform, delete_platform(s) and clear_platforms invalidate the cache"""
+        sl = SocialLinks(cache_size=10)
+        url = "https://github.com/johndoe"
+        assert sl.detect_platform(url) == "github"
+
+        sl.delete_platform("github")
+        assert sl.detect_platform(url) is None
+
+        sl.set_platform("github", [{
+            "patterns": [r"https?://github\.com/(?P<id>\w+)/?$"],
+            "sanitized": "https://github.com/{id}",
+        }])
+        assert sl.detect_platform(url) == "github"
+
+        sl.delete_platforms(["github"])
+        assert sl.detect_platform(url) is None
+
+        sl.set_platform("github", SocialLinks().get_platform("github"))
+        assert sl.detect_platform(url) == "github"
+
+        sl.clear_platforms()
+        assert sl.detect_platform(url) is None
+
+    def test_cache_clear(self):
+        """Test clearing the cache resets statistics"""
+        sl = SocialLinks(cache_size=10)
+        sl.detect_platform("https://github.com/johndoe")
+        sl.cache_clear()
+        assert sl.cache_info() == CacheInfo(hits=0, misses=0, maxsize=10, currsize=0)
@@ -0,0 +1,168 @@
+import csv
+import io
+import json
+
+import pytest
+from sociallinks.cli import main
+
+URLS = [
+    "https://github.com/johndoe",
+    "  https://www.linkedin.com/in/johndoe/  ",
+    "https://example.com/johndoe",
+    "",
+    "johndoe",
+]
+
+
+@pytest.fixture
+def url_file(tmp_path):
+    path = tmp_path / "urls.txt"
+    path.write_text("\n".join(URLS) + "\n", encoding="utf-8")
+    return str(path)
+
+
+def _jsonl(text):
+    return [json.loads(line) for line in text.splitlines()]
+
+
+class TestDetect:
+    """Test the detect command"""
+
+    def test_lines_to_jsonl(self, url_file, capsys):
+        """Test plain lines are parsed into JSONL records, one per input"""
+        assert main(["detect", url_file]) == 0
+        records = _jsonl(capsys.readouterr().out)
+        assert [r["input"] for r in records] == URLS
+        assert records[0] == {
+            "input": "https://github.com/johndoe",
+            "platform": "github",
+            "id": "johndoe",
+            "url": "https://github.com/johndoe",
+            "error": None,
+        }
+        assert records[1]["url"] == "https://linkedin.com/in/johndoe"
+        assert [r["error"] for r in records[2:4]] == ["no_match", "empty_url"]
+        assert records[4]["platform"] is not None
+
+    def test_url_only_and_candidates(self, url_file, capsys):
+        """Test detection options"""
+        assert main(["detect", url_file, "--url-only", "--candidates", "x,github"]) == 0
+        records = _jsonl(capsys.readouterr().out)
+        assert [r["platform"] for r in records] == ["github", None, None, None, None]
+
+    def test_stdin(self, monkeypatch, capsys):
+        """Test standard input is read when no file is given"""
+        monkeypatch.setattr("sys.stdin", io.StringIO("https://x.com/johndoe\n"))
+        assert main(["detect", "-"]) == 0
+        assert _jsonl(capsys.readouterr().out)[0]["platform"] == "x"
+
+    def test_csv_column_to_csv(self, tmp_path, capsys):
+        """Test reading a named CSV column and writing CSV"""
+        path = tmp_path / "crm.csv"
+        path.write_text('name,profile\nJohn,https://x.com/johndoe\n"Doe, Jane","https://github.com/jane"\n')
+        assert main(["detect", str(path), "-i", "csv", "--column", "profile", "-f", "csv"]) == 0
+        rows = list(csv.reader(io.StringIO(capsys.readouterr().out)))
+        assert rows[0] == ["input", "platform", "id", "url", "error"]
+        assert rows[1:] == [
+            ["https://x.com/johndoe", "x", "johndoe", "https://x.com/johndoe", ""],
+            ["https://github.com/jane", "github", "jane", "https://github.com/jane", ""],
+        ]
+
+    def test_csv_without_header(self, tmp_path, capsys):
+        """Test headerless CSV is read by column index"""
+        path = tmp_path / "urls.csv"
+        path.write_text("1,https://x.com/johndoe\n2\n")
+        assert main(["detect", str(path), "-i", "csv", "--column", "1", "--no-header"]) == 0
+        assert [r["error"] for r in _jsonl(capsys.readouterr().out)] == [None, "invalid_type"]
+
+    def test_jsonl_field(self, tmp_path, capsys):
+        """Test reading a JSONL field; malformed records are reported, not fatal"""
+        path = tmp_path / "urls.jsonl"
+        path.write_text('{"profile": "https://x.com/johndoe"}\n{"profile": 42}\nnot json\n\n')
+        assert main(["detect", str(path), "-i", "jsonl", "--field", "profile"]) == 0
+        records = _jsonl(capsys.readouterr().out)
+        assert [r["input"] for r in records] == ["https://x.com/johndoe", 42, None]
+        assert [r["error"] for r in records] == [None, "invalid_type", "invalid_type"]
+
+    def test_output_file_and_stats(self, url_file, tmp_path, capsys):
+        """Test writing to a file and printing a summary"""
+        out = tmp_path / "out.jsonl"
+        assert main(["detect", url_file, "-o", str(out), "--stats"]) == 0
+        captured = capsys.readouterr()
+        assert captured.out == ""
+        assert len(_jsonl(out.read_text(encoding="utf-8"))) == len(URLS)
+        assert "records: 5" in captured.err
+        assert "matched: 3" in captured.err
+        assert "no_match=1" in captured.err
+
+    def test_workers(self, url_file, capsys):
+        """Test the process pool keeps input order and results"""
+        assert main(["detect", url_file, url_file]) == 0
+        expected = capsys.readouterr().out
+        assert main(["detect", url_file, url_file, "--workers", "2", "--batch-size", "2"]) == 0
+        assert capsys.readouterr().out == expected
+
+
+    def test_normalize(self, tmp_path, capsys):
+        """Test --normalize cleans up links before matching"""
+        path = tmp_path / "messy.txt"
+        path.write_text("https://m.facebook.com/johndoe?ref=share\n", encoding="utf-8")
+        assert main(["detect", str(path)]) == 0
+        assert _jsonl(capsys.readouterr().out)[0]["error"] == "no_match"
+        assert main(["detect", str(path), "--normalize"]) == 0
+        assert _jsonl(capsys.readouterr().out)[0]["url"] == "https://facebook.com/johndoe"
+
+
+class TestSanitize:
+    """Test the sanitize command"""
+
+    def test_sanitize(self, url_file, capsys):
+        """Test URLs are matched against the given platform only"""
+        assert main(["sanitize", url_file, "--platform", "github"]) == 0
+        records = _jsonl(capsys.readouterr().out)
+        assert records[0]["url"] == "https://github.com/johndoe"
+        assert records[1]["error"] == "url_mismatch"
+        assert records[4]["url"] == "https://github.com/johndoe"
+
+    def test_unknown_platform(self, url_file, capsys):
+        """Test unknown platforms are usage errors"""
+        with pytest.raises(SystemExit) as e:
+            main(["sanitize", url_file, "--platform", "nope"])
+        assert e.value.code == 2
+        with pytest.raises(SystemExit):
+            main(["detect", url_file, "--candidates", "github,nope"])
+
+    def test_missing_file(self, tmp_path, capsys):
+        """Test unreadable inputs exit with status 1"""
+        assert main(["sanitize", str(tmp_path / "missing.txt"), "-p", "github"]) == 1
+        assert "error" in capsys.readouterr().err
+
+
+class TestCompile:
+    """Test the compile command"""
+
+    def test_compile(self, tmp_path, capsys):
+        """Test the generated module loads with custom definitions and options"""
+        definitions = tmp_path / "custom.json"
+        definitions.write_text(json.dumps({
+            "example": [{"patterns": [r"https?://example\.com/(?P<id>\w+)/?$"], "sanitized": "https://example.com/{id}"}],
+        }), encoding="utf-8")
+        out = tmp_path / "generated_matcher.py"
+        assert main(["compile", "--definitions", str(definitions), "--no-predefined", "--url-only", "-o", str(out)]) == 0
+        namespace = {}
+        exec(compile(out.read_text(encoding="utf-8"), str(out), "exec"), namespace)
+        assert list(namespace["PLATFORMS"]) == ["example"]
+        assert namespace["URL_ONLY"] is True
+
+    def test_stdout(self, capsys):
+        """Test the module is written to standard output by default"""
+        assert main(["compile"]) == 0
+        assert "PLATFORMS = {" in capsys.readouterr().out
+
+    def test_invalid_definitions(self, tmp_path, capsys):
+        """Test unreadable or invalid definitions exit with status 1"""
+        definitions = tmp_path / "bad.json"
+        definitions.write_text(json.dumps({"bad": [{"patterns": ["("], "sanitized": "{id}"}]}), encoding="utf-8")
+        assert main(["compile", "--definitions", str(definitions)]) == 1
+        assert main(["compile", "--definitions", str(tmp_path / "missing.json")]) == 1
+        assert "error" in capsys.readouterr().err
@@ -0,0 +1,157 @@
+import importlib.util
+import re
+import pytest
+from sociallinks.backend import REFERENCE, LinearIndex
+from sociallinks.codegen import FORMAT_VERSION, CompiledIndex
+from sociallinks.core import SocialLinks
+from sociallinks.index import AdaptiveIndex
+from sociallinks.registry import LazyPattern, clear_cache, compile_platform
+from tests.helpers import SAMPLE_URLS, mutations
+
+CUSTOM = {
+    "example": [
+        {"patterns": [r"https?://example\.com/u/(?P<id>\w+)/?$"], "sanitized": "https://example.com/u/{id}"},
+        {"patterns": [r"https?://example\.com/(?P<id>\w+)/?$"], "sanitized": "https://example.com/{id}?ref=1"},
+    ]
+}
+
+
+def _load(tmp_path, source, name="matcher"):
+    path = tmp_path / f"{name}.py"
+    path.write_text(source, encoding="utf-8")
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture(scope="module")
+def compiled(tmp_path_factory):
+    return SocialLinks.from_compiled(_load(tmp_path_factory.mktemp("codegen"), SocialLinks().compile_module()))
+
+
+class TestCompiledModule:
+    """Test compile_module() and from_compiled()"""
+
+    def test_uses_compiled_index(self, compiled):
+        """Test detection runs on the generated index"""
+        assert isinstance(compiled._get_index(), CompiledIndex)
+        assert compiled.list_platforms() == SocialLinks().list_platforms()
+
+    @pytest.mark.parametrize("url", SAMPLE_URLS)
+    def test_same_results(self, compiled, url):
+        """Test the compiled instance parses and sanitizes like a normal one"""
+        sl = SocialLinks()
+        assert compiled.parse(url) == sl.parse(url)
+        assert compiled.parse(url, url_only=True) == sl.parse(url, url_only=True)
+        for name in sl.list_platforms():
+            assert compiled.is_valid(name, url) == sl.is_valid(name, url)
+
+    def test_same_results_generated(self, compiled):
+        """Test results on generated inputs equal those of a normal instance"""
+        sl = SocialLinks()
+        urls = mutations(SAMPLE_URLS, 500)
+        assert compiled.parse_many(urls) == sl.parse_many(urls)
+        assert compiled.detect_many(urls, url_only=True) == sl.detect_many(urls, url_only=True)
+
+    def test_custom_definitions_and_options(self, tmp_path):
+        """Test custom platforms, flags and url_only are carried over"""
+        sl = SocialLinks(
+            use_predefined_platforms=False, regex_flags=re.IGNORECASE | re.MULTILINE, url_only=True, normalize=True
+        )
+        sl.set_platforms(CUSTOM)
+        restored = SocialLinks.from_compiled(_load(tmp_path, sl.compile_module()))
+        assert restored.platforms == sl.platforms
+        assert restored.normalizer == sl.normalizer
+        assert restored.regex_flags == sl.regex_flags
+        assert restored.url_only is True
+        assert restored.sanitize("example", "https://www.EXAMPLE.com/u/john?utm_source=x") == "https://example.com/u/john"
+        assert restored.sanitize("example", "https://example.com/john") == "https://example.com/john?ref=1"
+
+    def test_alternation_matches_reference(self, tmp_path):
+        """Test bucket regexes keep patterns with a top-level alternation intact"""
+        sl = SocialLinks(use_predefined_platforms=False, backend=REFERENCE)
+        sl.set_platforms({
+            "alpha": [{"patterns": [r"https://a\.com/(\w+)|zzz(\w+)", r"https://b\.com/(\w+)"], "sanitized": "https://z/{id}"}],
+            "beta": [{"patterns": [r"https://a\.com/x/(\w+)|^yy(\w+)$", r"^https?://b\.com/(?:u/)?(\w+)"],
+                      "sanitized": "https://y/{id}"}],
+        })
+        restored = SocialLinks.from_compiled(_load(tmp_path, sl.compile_module()))
+        assert isinstance(restored._get_index(), CompiledIndex)
+        urls = ["zzzfoo", "yyfoo", "zzz1 https://b.com/x", "https://a.com/x/1", "https://b.com/u/2", "yy zzz3"]
+        urls += mutations(urls, 200)
+        assert restored.detect_platform("zzzfoo") == "alpha"
+        assert restored.parse_many(urls) == sl.parse_many(urls)
+        assert restored.detect_many(urls, url_only=True) == sl.detect_many(urls, url_only=True)
+
+    def test_lazy_compile(self, tmp_path):
+        """Test regexes of a loaded module are compiled on first use"""
+        sl = SocialLinks(use_predefined_platforms=False)
+        sl.set_platform("lazy", [{"patterns": [r"https?://lazy\.example/(?P<id>\w+)$"], "sanitized": "{id}"}])
+        module = _load(tmp_path, sl.compile_module())
+        clear_cache()  # As in a fresh process
+        restored = SocialLinks.from_compiled(module)
+        pattern = restored._compiled["lazy"].entries[0][0]
+        assert isinstance(pattern, LazyPattern) and not pattern.compiled
+        assert restored.detect_platform("https://lazy.example/john") == "lazy"
+        assert pattern.compiled
+
+    def test_other_python(self, tmp_path):
+        """Test a module generated by another Python version is analysed again"""
+        source = SocialLinks().compile_module()
+        source = re.sub(r"(?m)^PYTHON = .*$", "PYTHON = (2, 7)", source)
+        restored = SocialLinks.from_compiled(_load(tmp_path, source))
+        assert not isinstance(restored._compiled["github"].entries[0][0], LazyPattern)
+        assert restored.detect_platform("https://github.com/johndoe") == "github"
+
+    def test_other_release(self, tmp_path):
+        """Test a module generated by another sociallinks release is analysed again"""
+        source = SocialLinks().compile_module()
+        source = re.sub(r"(?m)^SOCIALLINKS = .*$", "SOCIALLINKS = '0.0.1'", source)
+        restored = SocialLinks.from_compiled(_load(tmp_path, source))
+        assert not isinstance(restored._compiled["github"].entries[0][0], LazyPattern)
+        assert restored.detect_platform("https://github.com/johndoe") == "github"
+
+    def test_shared_platforms_unchanged(self, tmp_path):
+        """Test loading a module does not change the platforms of other instances"""
+        sl = SocialLinks(use_predefined_platforms=False)
+        sl.set_platforms(CUSTOM)
+        source = sl.compile_module()
+        altered = re.sub(r"'https://example\.com/u/'", "'https://altered.example/'", source)
+        assert altered != source
+        clear_cache()
+        shared = compile_platform("example", CUSTOM["example"], sl.regex_flags, lazy=True)
+        shared.kinds  # Classified by another instance
+        loaded = SocialLinks.from_compiled(_load(tmp_path, altered, "altered"))
+        other = SocialLinks.from_compiled(_load(tmp_path, source))
+        assert loaded.sanitize("example", "https://example.com/u/john") == "https://altered.example/john"
+        assert other.sanitize("example", "https://example.com/u/john") == "https://example.com/u/john"
+        assert shared._templates is None and shared._matcher is None
+
+    def test_adaptive_and_backend(self, tmp_path):
+        """Test adaptive ordering and the backend are forwarded"""
+        module = _load(tmp_path, SocialLinks().compile_module())
+        reference = SocialLinks.from_compiled(module, backend=REFERENCE)
+        assert reference.backend is REFERENCE
+        assert isinstance(reference._get_index(), LinearIndex)
+        adaptive = SocialLinks.from_compiled(module, adaptive=True)
+        assert isinstance(adaptive._get_index(), AdaptiveIndex)
+        for sl in (reference, adaptive):
+            assert sl.detect_platform("https://github.com/johndoe") == "github"
+
+    def test_invalid_module(self, tmp_path):
+        """Test foreign modules and other format versions are rejected"""
+        with pytest.raises(ValueError, match="not a generated matcher module"):
+            SocialLinks.from_compiled(re)
+        source = re.sub(r"(?m)^FORMAT_VERSION = .*$", f"FORMAT_VERSION = {FORMAT_VERSION + 1}", SocialLinks().compile_module())
+        with pytest.raises(ValueError, match="unsupported matcher module version"):
+            SocialLinks.from_compiled(_load(tmp_path, source))
+
+    def test_registry_changes_after_load(self, tmp_path):
+        """Test a loaded instance is an ordinary instance"""
+        sl = SocialLinks.from_compiled(_load(tmp_path, SocialLinks().compile_module()))
+        sl.set_platforms(CUSTOM)
+        sl.delete_platform("github")
+        assert not isinstance(sl._get_index(), CompiledIndex)
+        assert sl.detect_platform("https://example.com/john") == "example"
+        assert sl.detect_platform("https://github.com/johndoe") is None
@@ -0,0 +1,131 @@
+import sys
+import threading
+import time
+
+import pytest
+from sociallinks.core import SocialLinks
+from sociallinks.exceptions import PlatformNotFoundError
+
+VARIANTS = [
+    [{"patterns": [r"https?://acme\.test/(?P<id>\w+)/?$"], "sanitized": "https://acme.test/a/{id}"}],
+    [{"patterns": [r"https?://acme\.test/(?P<id>\w+)/?$"], "sanitized": "https://acme.test/b/{id}"}],
+]
+ACME_URLS = {None, "https://acme.test/a/johndoe", "https://acme.test/b/johndoe"}
+URLS = ["https://acme.test/johndoe", "https://github.com/johndoe", "https://example.com/johndoe"]
+
+
+@pytest.fixture
+def fast_switching():
+    """Switch threads as often as possible to provoke interleavings"""
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    yield
+    sys.setswitchinterval(interval)
+
+
+def _stress(sl, reader, readers=8, duration=0.15):
+    """Run `reader` in several threads while the registry keeps changing"""
+    stop = threading.Event()
+    errors = []
+    reads = []
+
+    def read():
+        count = 0
+        try:
+            while not stop.is_set():
+                reader()
+                count += 1
+        except Exception as e:  # pragma: no cover - reported below
+            errors.append(e)
+        reads.append(count)
+
+    threads = [threading.Thread(target=read) for _ in range(readers)]
+    for t in threads:
+        t.start()
+    deadline = time.perf_counter() + duration
+    try:
+        i = 0
+        while time.perf_counter() < deadline:
+            if i % 3 == 2:
+                sl.delete_platform("acme")
+                sl.set_platforms({"acme": VARIANTS[0], "acme_extra": VARIANTS[1]}, override=True)
+                sl.delete_platform("acme_extra")
+            else:
+                sl.set_platform("acme", VARIANTS[i % 2], override=True)
+            i += 1
+    finally:
+        stop.set()
+        for t in threads:
+            t.join()
+    assert errors == []
+    assert i > 0 and sum(reads) > 0
+
+
+class TestConcurrentRegistry:
+    """Test readers never observe a half-updated registry"""
+
+    @pytest.mark.parametrize("cache_size", [0, 1000])
+    def test_detect_and_parse(self, fast_switching, cache_size):
+        """Test detection results always come from a complete registry"""
+        sl = SocialLinks(cache_size=cache_size)
+        sl.set_platform("acme", VARIANTS[0])
+
+        def reader():
+            assert sl.detect_platform(URLS[0]) in (None, "acme", "acme_extra")
+            assert sl.detect_platform(URLS[1]) == "github"
+            result = sl.parse(URLS[0])
+            assert result is None or result.url in ACME_URLS
+            for result in sl.parse_many(URLS):
+                assert result.url is None or result.url in ACME_URLS | {"https://github.com/johndoe"}
+            links = sl.extract_links(" ".join(URLS))
+            assert [link.platform for link in links][-1] == "github"
+
+        _stress(sl, reader)
+        sl.set_platform("acme", VARIANTS[1], override=True)
+        assert sl.parse(URLS[0]).url == "https://acme.test/b/johndoe"
+        assert sl.detect_platform(URLS[0]) == "acme"
+
+    def test_validate_and_sanitize(self, fast_switching):
+        """Test fixed-platform calls see either the old or the new definition"""
+        sl = SocialLinks(cache_size=1000)
+        sl.set_platform("acme", VARIANTS[0])
+
+        def reader():
+            try:
+                assert sl.sanitize("acme", URLS[0]) in ACME_URLS
+                assert sl.sanitize_many("acme", URLS[:1])[0][0] in ACME_URLS
+            except PlatformNotFoundError:
+                pass
+            assert sl.is_valid("github", URLS[1])
+
+        _stress(sl, reader)
+        sl.set_platform("acme", VARIANTS[0], override=True)
+        assert sl.sanitize("acme", URLS[0]) == "https://acme.test/a/johndoe"
+
+    def test_detector(self, fast_switching):
+        """Test detector views rebuild consistently while the registry changes"""
+        sl = SocialLinks()
+        sl.set_platform("acme", VARIANTS[0])
+        profiles = sl.detector(["github", "x"])
+
+        def reader():
+            assert profiles.detect_many(URLS) == [None, "github", None]
+            assert profiles.parse(URLS[1]).url == "https://github.com/johndoe"
+
+        _stress(sl, reader)
+
+    def test_concurrent_writers(self):
+        """Test writers are serialized: no registry change is lost"""
+        sl = SocialLinks(use_predefined_platforms=False)
+
+        def write(prefix):
+            for i in range(50):
+                sl.set_platform(f"{prefix}{i}", VARIANTS[i % 2])
+
+        threads = [threading.Thread(target=write, args=(p,)) for p in "abcd"]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert len(sl.list_platforms()) == 200
+        assert sl._generation == 200
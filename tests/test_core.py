@@ -109,3 +109,62 @@ class TestSanitize:
         sl = SocialLinks()
         with pytest.raises(URLMismatchError, match="does not match platform"):
             sl.sanitize("linkedin", "https://example.com")
+
+
+class TestParse:
+    """Test parse method"""
+
+    def test_parse_linkedin_company(self):
+        """Test parsing returns platform, entry, id, url and pattern"""
+        sl = SocialLinks()
+        result = sl.parse("  https://www.linkedin.com/company/acme/  ")
+        assert result.platform == "linkedin"
+        assert result.entry == 1
+        assert result.id == "acme"
+        assert result.url == "https://linkedin.com/company/acme"
+        assert result.pattern in sl.get_platform("linkedin")[1]["patterns"]
+
+    def test_parse_no_match(self):
+        """Test parsing unknown and empty URLs"""
+        sl = SocialLinks()
+        assert sl.parse("https://example.com") is None
+        assert sl.parse("") is None
+        assert sl.parse("   ") is None
+
+    def test_parse_invalid_type(self):
+        """Test parsing a non-string input"""
+        sl = SocialLinks()
+        with pytest.raises(TypeError, match="url must be str, not NoneType"):
+            sl.parse(None)
+
+    @pytest.mark.parametrize("url", [
+        "https://github.com/johndoe",
+        "https://www.youtube.com/@channel",
+        "https://johndoe.bandcamp.com",
+        "https://old.reddit.com/r/python/",
+        "https://steamcommunity.com/profiles/76561198000000000",
+        "https://web.telegram.org/k/#@johndoe",
+        "@johndoe",
+        "u/johndoe",
+    ])
+    def test_parse_matches_detect_and_sanitize(self, url):
+        """Test parse agrees with detect_platform followed by sanitize"""
+        sl = SocialLinks()
+        result = sl.parse(url)
+        platform = sl.detect_platform(url)
+        assert result.platform == platform
+        assert result.url == sl.sanitize(platform, url)
+
+    def test_parse_result_as_dict(self):
+        """Test converting a result to a dictionary"""
+        sl = SocialLinks()
+        result = sl.parse("https://github.com/johndoe")
+        assert result.as_dict() == {
+            "platform": "github",
+            "entry": 0,
+            "id": "johndoe",
+            "url": "https://github.com/johndoe",
+            "pattern": result.pattern,
+            "error": None,
+        }
+        assert result == sl.parse("https://github.com/johndoe")
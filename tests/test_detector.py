@@ -0,0 +1,117 @@
+import pytest
+from sociallinks.core import SocialLinks
+from sociallinks.detector import Detector
+from sociallinks.exceptions import PlatformNotFoundError
+from tests.helpers import SAMPLE_URLS
+
+PROFILE_FIELDS = ["linkedin", "github", "x", "instagram", "facebook", "youtube"]
+
+
+def _linear_detect_subset(sl, url, names):
+    """Reference detection: try every pattern of `names`, in that order."""
+    u = url.strip()
+    if not u:
+        return None
+    for name in names:
+        if any(pattern.search(u) for pattern, _, _ in sl._compiled[name].entries):
+            return name
+    return None
+
+
+class TestCandidates:
+    """Test detect_platform() and parse() restricted to candidate platforms"""
+
+    @pytest.mark.parametrize("url", SAMPLE_URLS)
+    def test_matches_linear_scan(self, url):
+        """Test candidate detection agrees with a linear scan over the subset"""
+        sl = SocialLinks()
+        assert sl.detect_platform(url, candidates=PROFILE_FIELDS) == _linear_detect_subset(sl, url, PROFILE_FIELDS)
+
+    def test_restricts_platforms(self):
+        """Test platforms outside the subset are never detected"""
+        sl = SocialLinks()
+        assert sl.detect_platform("https://bsky.app/profile/johndoe", candidates=PROFILE_FIELDS) is None
+        assert sl.detect_platform("https://github.com/johndoe", candidates=PROFILE_FIELDS) == "github"
+        assert sl.parse("https://github.com/johndoe", candidates=["x"]) is None
+        assert sl.parse("https://github.com/johndoe", candidates=["github"]).url == "https://github.com/johndoe"
+
+    def test_subset_order(self):
+        """Test the subset order decides between platforms matching the same input"""
+        sl = SocialLinks()
+        assert sl.detect_platform("johndoe", candidates=["github", "x"]) == "github"
+        assert sl.detect_platform("johndoe", candidates=["x", "github"]) == "x"
+        assert sl.detect_platform("johndoe", candidates=["x", "github"], url_only=True) is None
+
+    def test_duplicates_ignored(self):
+        """Test repeated names keep their first position"""
+        sl = SocialLinks()
+        assert sl.detector(["x", "github", "x"]).platforms == ("x", "github")
+
+    def test_invalid_candidates(self):
+        """Test unknown platforms and malformed arguments"""
+        sl = SocialLinks()
+        with pytest.raises(PlatformNotFoundError):
+            sl.detect_platform("https://github.com/johndoe", candidates=["github", "nope"])
+        with pytest.raises(TypeError):
+            sl.detect_platform("https://github.com/johndoe", candidates="github")
+        with pytest.raises(TypeError):
+            sl.detect_platform("https://github.com/johndoe", candidates=[1])
+
+    def test_cache_keyed_by_candidates(self):
+        """Test cached results of different subsets do not mix"""
+        sl = SocialLinks(cache_size=10)
+        assert sl.detect_platform("johndoe", candidates=["github", "x"]) == "github"
+        assert sl.detect_platform("johndoe", candidates=["x", "github"]) == "x"
+        assert sl.detect_platform("johndoe", candidates=["github", "x"]) == "github"
+
+
+class TestDetector:
+    """Test reusable detector views"""
+
+    def test_detect(self):
+        """Test a detector behaves like candidate detection"""
+        sl = SocialLinks()
+        profiles = sl.detector(PROFILE_FIELDS)
+        assert isinstance(profiles, Detector)
+        for url in SAMPLE_URLS:
+            assert profiles.detect(url) == sl.detect_platform(url, candidates=PROFILE_FIELDS)
+
+    def test_batch(self):
+        """Test the batch methods of a detector"""
+        sl = SocialLinks()
+        profiles = sl.detector(["github", "x"], url_only=True)
+        urls = ["https://github.com/johndoe", "johndoe", "https://bsky.app/profile/johndoe"]
+        assert profiles.detect_many(urls) == ["github", None, None]
+        assert [r.error for r in profiles.parse_many(urls, lazy=True)] == [None, "no_match", "no_match"]
+        assert profiles.parse("https://x.com/johndoe").url == "https://x.com/johndoe"
+
+    def test_index_reused(self):
+        """Test the index is built once and shared between equal subsets"""
+        sl = SocialLinks()
+        profiles = sl.detector(PROFILE_FIELDS)
+        index = profiles._get_index()
+        assert profiles._get_index() is index
+        assert sl.detector(PROFILE_FIELDS)._get_index() is index
+
+    def test_follows_registry_changes(self):
+        """Test a detector sees platforms being replaced or deleted"""
+        sl = SocialLinks()
+        profiles = sl.detector(["github"])
+        assert profiles.detect("https://github.com/johndoe") == "github"
+        sl.set_platform("github", [{
+            "patterns": [r"https?://gh\.example/(?P<id>\w+)/?$"],
+            "sanitized": "https://gh.example/{id}",
+        }], override=True)
+        assert profiles.detect("https://github.com/johndoe") is None
+        assert profiles.detect("https://gh.example/johndoe") == "github"
+        sl.delete_platform("github")
+        with pytest.raises(PlatformNotFoundError):
+            profiles.detect("https://gh.example/johndoe")
+
+    def test_type_errors(self):
+        """Test non-string inputs"""
+        profiles = SocialLinks().detector(["github"])
+        with pytest.raises(TypeError):
+            profiles.detect(None)
+        with pytest.raises(TypeError):
+            profiles.parse(1)
@@ -46,6 +46,8 @@ class TestEdgeCases:
         sl.set_platform("example", platform_data)
         with pytest.raises(PlatformIDExtractionError, match="Could not extract platform ID"):
             sl.sanitize("example", "https://example.com/static")
+        with pytest.raises(PlatformIDExtractionError, match="Could not extract platform ID"):
+            sl.parse("https://example.com/static")
 
     def test_case_insensitive_matching(self):
         """Test case insensitive URL matching"""
@@ -0,0 +1,186 @@
+import random
+import time
+
+import pytest
+from sociallinks import extract
+from sociallinks.core import SocialLinks
+from sociallinks.exceptions import PlatformNotFoundError
+from sociallinks.extract import find_candidates, iter_candidates
+from sociallinks.results import ExtractedLink
+from tests.helpers import SAMPLE_URLS
+
+TEXT = (
+    "Hi, I'm John. Find me on https://x.com/johndoe or (https://github.com/johndoe).\n"
+    "CV: [LinkedIn](https://www.linkedin.com/in/john-doe/), "
+    '<a href="https://bsky.app/profile/jd.bsky.social">Bluesky</a>\n'
+    "Not a profile: https://example.com/johndoe, https://github.com/johndoe/repo; "
+    "handle johndoe, broken http:// and ://nothing.\n"
+)
+
+EXPECTED = [
+    ("x", "https://x.com/johndoe"),
+    ("github", "https://github.com/johndoe"),
+    ("linkedin", "https://linkedin.com/in/john-doe"),
+    ("bluesky", "https://bsky.app/profile/jd.bsky.social"),
+]
+
+
+class TestFindCandidates:
+    """Test the candidate URL scanner"""
+
+    @pytest.mark.parametrize("text, expected", [
+        ("https://x.com/a", ["https://x.com/a"]),
+        ("see https://x.com/a.", ["https://x.com/a"]),
+        ("(https://x.com/a)", ["https://x.com/a"]),
+        ("https://en.wikipedia.org/wiki/Foo_(bar))", ["https://en.wikipedia.org/wiki/Foo_(bar)"]),
+        ('href="https://x.com/a"', ["https://x.com/a"]),
+        ("<https://x.com/a>", ["https://x.com/a"]),
+        ("1https://x.com/a", ["https://x.com/a"]),
+        ("weixin://dl/chat?a b", ["weixin://dl/chat?a"]),
+        ("a://b c://d", ["a://b", "c://d"]),
+        ("http:// ://x :// x", []),
+        ("no links here", []),
+    ])
+    def test_candidates(self, text, expected):
+        """Test candidates are cut at delimiters and trimmed"""
+        found = list(find_candidates(text))
+        assert [url for _, _, url in found] == expected
+        for start, end, url in found:
+            assert text[start:end] == url
+
+    def test_linear_on_adversarial_input(self):
+        """Test inputs made of scheme separators stay fast"""
+        for text in ("http://" * 50000, "a" * 300000 + "://", ":" * 300000, "://" * 100000):
+            started = time.perf_counter()
+            list(find_candidates(text))
+            assert time.perf_counter() - started < 1.0
+
+    @pytest.mark.parametrize("size", [1, 2, 3, 5, 8, 13, 64, 1000])
+    def test_chunks_match_whole_text(self, size):
+        """Test chunk boundaries never change the candidates or their offsets"""
+        chunks = [TEXT[i:i + size] for i in range(0, len(TEXT), size)]
+        assert list(iter_candidates(chunks)) == list(find_candidates(TEXT))
+
+    def test_carry_is_bounded(self, monkeypatch):
+        """Test a run without delimiters is scanned instead of buffered"""
+        monkeypatch.setattr(extract, "MAX_CARRY", 100)
+        chunks = ["x" * 60] * 1000 + [" https://x.com/a"]
+        found = list(iter_candidates(chunks))
+        assert found == [(60001, 60016, "https://x.com/a")]
+
+    def test_invalid_chunk(self):
+        """Test non-string chunks are rejected"""
+        with pytest.raises(TypeError):
+            list(iter_candidates([b"https://x.com/a"]))
+
+
+def _links(sl, text, prefilter):
+    """Match every candidate of `text` as iter_links() does."""
+    results = []
+    for start, end, url in find_candidates(text, 0, prefilter):
+        found = sl.parse_many([url])[0]
+        if found.ok:
+            results.append(((start, end), found.platform, found.url))
+    return results
+
+
+def _noisy_text(seed, count=200):
+    """Build text mixing sample URLs, unknown hosts, punctuation and delimiters."""
+    rng = random.Random(seed)
+    pieces = SAMPLE_URLS + [
+        "https://cdn.example.com/app.js",
+        "https://github.com.evil.example/johndoe",
+        "https://evil.example/https://t.me/johndoe",
+        "https://johndoe.bandcamp.com",
+        "HTTPS://WWW.GITHUB.COM/JOHNDOE",
+    ]
+    glue = [" ", "\n", "(", ")", ".", ",", '"', "'", "<", ">", "://", "x", ""]
+    return "".join(rng.choice(pieces) + rng.choice(glue) + rng.choice(glue) for _ in range(count))
+
+
+class TestPrefilter:
+    """Test the host prefilter used when scanning text"""
+
+    def test_skips_unknown_hosts(self):
+        """Test only URLs with an indexed host are candidates"""
+        prefilter = SocialLinks()._get_index().prefilter
+        text = "https://cdn.example.com/a.js https://www.github.com/johndoe https://github.com:8080/x"
+        assert [url for _, _, url in find_candidates(text, 0, prefilter)] == ["https://www.github.com/johndoe"]
+
+    def test_tolerates_trailing_punctuation(self):
+        """Test hosts followed by punctuation are still candidates"""
+        prefilter = SocialLinks()._get_index().prefilter
+        text = "Music: https://johndoe.bandcamp.com. Chat: https://gïthub.com/x"
+        urls = [url for _, _, url in find_candidates(text, 0, prefilter)]
+        assert urls == ["https://johndoe.bandcamp.com", "https://gïthub.com/x"]
+
+    @pytest.mark.parametrize("seed", range(20))
+    def test_same_links_as_full_scan(self, seed):
+        """Test the prefilter never drops a profile link"""
+        sl = SocialLinks()
+        text = _noisy_text(seed)
+        assert _links(sl, text, sl._get_index().prefilter) == _links(sl, text, None)
+
+    def test_follows_registry_changes(self):
+        """Test the prefilter is rebuilt when platforms change"""
+        sl = SocialLinks()
+        text = "https://profiles.example.org/johndoe"
+        assert sl.extract_links(text) == []
+        sl.set_platform("example", [{
+            "patterns": [r"https?://profiles\.example\.org/(?P<id>\w+)/?$"],
+            "sanitized": "https://profiles.example.org/{id}",
+        }])
+        assert [link.platform for link in sl.extract_links(text)] == ["example"]
+        sl.delete_platform("example")
+        assert sl.extract_links(text) == []
+
+    def test_disabled_by_unclassified_patterns(self):
+        """Test custom patterns the index cannot classify see every URL"""
+        sl = SocialLinks(use_predefined_platforms=False)
+        sl.set_platform("loose", [{"patterns": [r"https?://\S+/~(?P<id>\w+)$"], "sanitized": "{id}"}])
+        assert sl._get_index().prefilter is None
+        assert [link.id for link in sl.extract_links("home: https://uni.example/~johndoe")] == ["johndoe"]
+
+
+class TestExtractLinks:
+    """Test extract_links() and iter_links()"""
+
+    def test_extract_links(self):
+        """Test every profile link is found with its span"""
+        links = SocialLinks().extract_links(TEXT)
+        assert [(link.platform, link.url) for link in links] == EXPECTED
+        for link in links:
+            assert isinstance(link, ExtractedLink)
+            start, end = link.span
+            assert TEXT[start:end].rstrip("/").endswith(link.id)
+
+    @pytest.mark.parametrize("size", [1, 7, 100])
+    def test_chunked_stream(self, size):
+        """Test a chunked stream yields the same links as the whole text"""
+        sl = SocialLinks()
+        chunks = (TEXT[i:i + size] for i in range(0, len(TEXT), size))
+        assert list(sl.iter_links(chunks)) == sl.extract_links(TEXT)
+
+    @pytest.mark.parametrize("url", [u for u in SAMPLE_URLS if "://" in u])
+    def test_agrees_with_parse(self, url):
+        """Test a URL surrounded by prose gives the same result as parse()"""
+        sl = SocialLinks()
+        links = sl.extract_links(f"Profile: {url}, thanks.")
+        expected = sl.parse_many([url])[0]
+        if expected.ok and url.startswith("http"):
+            assert [(link.platform, link.url) for link in links] == [(expected.platform, expected.url)]
+        elif not expected.ok:
+            assert links == []
+
+    def test_candidates(self):
+        """Test restricting extraction to some platforms"""
+        sl = SocialLinks()
+        links = sl.extract_links(TEXT, candidates=["github", "bluesky"])
+        assert [link.platform for link in links] == ["github", "bluesky"]
+        with pytest.raises(PlatformNotFoundError):
+            sl.extract_links(TEXT, candidates=["nope"])
+
+    def test_bytes_rejected(self):
+        """Test bytes input is rejected"""
+        with pytest.raises(TypeError):
+            SocialLinks().iter_links(b"https://x.com/johndoe")
@@ -0,0 +1,105 @@
+import pytest
+from sociallinks import harvest
+from sociallinks.core import SocialLinks
+from sociallinks.exceptions import PlatformNotFoundError
+from sociallinks.harvest import HarvestStats, LinkHarvester
+from sociallinks.results import HtmlLink
+
+PAGE = """<!DOCTYPE html>
+<html><head>
+<link rel="me" href="https://mastodon.social/@johndoe">
+<link rel="stylesheet" href="/static/site.css">
+</head><body>
+<p>Find me on <a href="https:&#x2F;&#x2F;x.com&#47;johndoe">X</a> and
+<a href="
+   https://www.linkedin.com/in/john-doe/  ">LinkedIn</a>.</p>
+<!-- <a href="https://t.me/commented">old</a> -->
+<script>document.write('<a href="https://t.me/scripted">x</a>')</script>
+<a href="johndoe">relative</a> <a href="mailto:john@example.com">mail</a> <a>no href</a>
+<map><area href="https://github.com/johndoe"></map>
+</body></html>
+"""
+
+EXPECTED = [
+    ("mastodon", "https://mastodon.social/@johndoe"),
+    ("x", "https://x.com/johndoe"),
+    ("linkedin", "https://linkedin.com/in/john-doe"),
+    ("github", "https://github.com/johndoe"),
+]
+
+
+def _urls(links):
+    return [(link.platform, link.url) for link in links]
+
+
+class TestHtmlLinks:
+    """Test iter_html_links() and extract_html_links()"""
+
+    def test_extract(self):
+        """Test anchors are unescaped and matched, comments and scripts ignored"""
+        links = SocialLinks().extract_html_links(PAGE)
+        assert _urls(links) == EXPECTED
+        assert all(isinstance(link, HtmlLink) for link in links)
+        assert links[1].href == "https://x.com/johndoe"
+        assert links[1].position == (6, 14)
+
+    def test_base_url(self):
+        """Test relative links are resolved against the base URL"""
+        sl = SocialLinks()
+        links = sl.extract_html_links(PAGE, "https://github.com/about")
+        assert ("github", "https://github.com/johndoe") in _urls(links)
+        assert links[3].href == "https://github.com/johndoe"
+
+    def test_base_tag(self):
+        """Test the first <base href> takes precedence over the base URL"""
+        sl = SocialLinks()
+        page = '<base href="https://t.me/"><base href="https://x.com/"><a href="./johndoe">t</a>'
+        assert _urls(sl.extract_html_links(page, "https://example.com/")) == [("telegram", "https://t.me/johndoe")]
+
+    def test_relative_link_is_not_a_username(self):
+        """Test relative hrefs are never detected as bare usernames"""
+        assert SocialLinks().extract_html_links('<a href="johndoe">me</a>') == []
+
+    @pytest.mark.parametrize("size", [1, 3, 16, 1000])
+    def test_chunked(self, size):
+        """Test chunk boundaries do not change the result"""
+        sl = SocialLinks()
+        chunks = [PAGE[i:i + size] for i in range(0, len(PAGE), size)]
+        assert sl.extract_html_links(chunks) == sl.extract_html_links(PAGE)
+
+    def test_stats(self):
+        """Test per-document statistics"""
+        harvester = SocialLinks().iter_html_links(PAGE)
+        assert isinstance(harvester, LinkHarvester)
+        assert not harvester.done
+        assert len(list(harvester)) == 4
+        stats = harvester.stats
+        assert isinstance(stats, HarvestStats)
+        assert harvester.done
+        assert (stats.chars, stats.hrefs, stats.links, stats.dropped) == (len(PAGE), 7, 4, 0)
+        assert stats.elapsed > 0
+
+    def test_pending_text_is_bounded(self, monkeypatch):
+        """Test an unterminated tag cannot grow the parser buffer without bounds"""
+        monkeypatch.setattr(harvest, "MAX_PENDING", 1000)
+        chunks = ['<a href="https://x.com/a">x</a><div title="'] + ["x" * 100] * 100 + [
+            '"><a href="https://github.com/b">g</a>'
+        ]
+        harvester = SocialLinks().iter_html_links(chunks)
+        assert _urls(harvester) == [("x", "https://x.com/a"), ("github", "https://github.com/b")]
+        assert harvester.stats.dropped > 0
+
+    def test_candidates(self):
+        """Test restricting harvesting to some platforms"""
+        sl = SocialLinks()
+        assert _urls(sl.extract_html_links(PAGE, candidates=["github", "x"])) == [EXPECTED[1], EXPECTED[3]]
+        with pytest.raises(PlatformNotFoundError):
+            sl.iter_html_links(PAGE, candidates=["nope"])
+
+    def test_type_errors(self):
+        """Test bytes documents and chunks are rejected"""
+        sl = SocialLinks()
+        with pytest.raises(TypeError):
+            sl.iter_html_links(b"<a href='https://x.com/a'>")
+        with pytest.raises(TypeError):
+            sl.extract_html_links([b"<a href='https://x.com/a'>"])
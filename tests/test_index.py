@@ -0,0 +1,310 @@
+import re
+import pytest
+from sociallinks.core import SocialLinks
+from sociallinks.index import (
+    BARE, HANDLE, HOST, OTHER, REORDER_INTERVAL, AdaptiveIndex, HostIndex, classify_pattern, url_hosts
+)
+from tests.helpers import SAMPLE_URLS
+
+
+def _linear_detect(sl, url):
+    """Reference detection: try every pattern in registry order."""
+    u = url.strip()
+    if not u:
+        return None
+    for name, compiled in sl._compiled.items():
+        if any(pattern.search(u) for pattern, _, _ in compiled.entries):
+            return name
+    return None
+
+
+
+
+class TestClassifyPattern:
+    """Test static pattern classification"""
+
+    def test_host_pattern(self):
+        """Test scheme://host patterns are bucketed by their literal host"""
+        assert classify_pattern(r"https?://(www\.)?github\.com/(?P<id>\w+)/?$") == (HOST, ("github.com",))
+        assert classify_pattern(r"https?://m\.facebook\.com/(?P<id>\w+)/?$") == (HOST, ("m.facebook.com",))
+
+    def test_host_pattern_with_subdomain_id(self):
+        """Test hosts that start with a capture group keep the literal suffix"""
+        kind = classify_pattern(r"https?://(?P<id>[A-Za-z0-9_.-]+)\.bandcamp\.com/?$")
+        assert kind == (HOST, ("bandcamp.com",))
+
+    def test_optional_prefix_alternatives(self):
+        """Test optional prefixes whose alternatives all end in a dot"""
+        kind = classify_pattern(r"https?://(m\.|mobile\.)?facebook\.com/(?P<id>\w+)/?$")
+        assert kind == (HOST, ("facebook.com",))
+
+    def test_host_alternation(self):
+        """Test a trailing group of literal hosts yields one key per host"""
+        kind = classify_pattern(r"https?://(www\.)?(t\.me|telegram\.me)/(?P<id>\w+)/?$")
+        assert kind == (HOST, ("t.me", "telegram.me"))
+
+    def test_handle_pattern(self):
+        """Test anchored patterns that cannot contain :// are handles"""
+        assert classify_pattern(r"^u/(?P<id>[A-Za-z0-9_.-]+)$") == (HANDLE, ())
+        assert classify_pattern(r"^spotify:artist:(?P<id>\w+)$") == (HANDLE, ())
+
+    def test_bare_handle_pattern(self):
+        """Test handles without a literal prefix are bare usernames"""
+        assert classify_pattern(r"^@?(?P<id>[A-Za-z0-9_.-]+)$") == (BARE, ())
+        assert classify_pattern(r"^(?P<id>[A-Za-z0-9_.-]+)$") == (BARE, ())
+        assert classify_pattern(r"^(?P<id>\+?\d+)$") == (BARE, ())
+
+    def test_other_patterns(self):
+        """Test patterns the analysis cannot prove anything about"""
+        # Unescaped dot may match anything, so the host has no literal suffix
+        assert classify_pattern(r"https?://example.com/(?P<id>\w+)")[0] == OTHER
+        # No terminator after the host
+        assert classify_pattern(r"https?://example\.com")[0] == OTHER
+        # Optional scheme
+        assert classify_pattern(r"(https?://)?example\.com/(?P<id>\w+)")[0] == OTHER
+        # Unanchored handle
+        assert classify_pattern(r"(?P<id>\w+)")[0] == OTHER
+        # Host part may match a slash
+        assert classify_pattern(r"https?://\S+\.example\.com/(?P<id>\w+)")[0] == OTHER
+        # Top-level alternation
+        assert classify_pattern(r"https?://a\.com/(?P<id>\w+)|b")[0] == OTHER
+        # Optional prefix with an alternative that does not end in a dot
+        assert classify_pattern(r"https?://(a|b\.)?github\.com/(?P<id>\w+)")[0] == OTHER
+
+    def test_flags_disable_classification(self):
+        """Test flags that change pattern semantics"""
+        assert classify_pattern(r"^(?P<id>\w+)$", re.MULTILINE)[0] == OTHER
+        assert classify_pattern(r"https?://a\.com/(?P<id>\w+)", re.VERBOSE)[0] == OTHER
+
+
+class TestUrlHosts:
+    """Test host extraction from input URLs"""
+
+    def test_url_hosts(self):
+        """Test hosts are lowercased and cut at path, query and fragment"""
+        assert url_hosts("https://WWW.GitHub.com/user") == ["www.github.com"]
+        assert url_hosts("https://a.com?x") == ["a.com"]
+        assert url_hosts("https://a.com/https://b.com/x") == ["a.com", "b.com"]
+
+    def test_url_hosts_non_ascii(self):
+        """Test non-ASCII hosts disable the index"""
+        assert url_hosts("https://gïthub.com/user") is None
+
+
+class TestHostIndex:
+    """Test indexed detection"""
+
+    def test_candidates_restricted_to_host(self):
+        """Test only patterns for the URL host are evaluated"""
+        sl = SocialLinks()
+        index = sl._get_index()
+        names = {name for _, name, _, _ in index.candidates("https://www.github.com/user")}
+        assert names == {"github"}
+
+    @pytest.mark.parametrize("url", SAMPLE_URLS)
+    def test_matches_linear_scan(self, url):
+        """Test indexed detection agrees with a linear scan"""
+        sl = SocialLinks()
+        assert sl.detect_platform(url) == _linear_detect(sl, url)
+
+    @pytest.mark.parametrize("url", SAMPLE_URLS)
+    def test_matches_linear_scan_with_custom_platforms(self, url):
+        """Test unclassified custom patterns keep registry order"""
+        sl = SocialLinks()
+        sl.set_platform("loose", [{"patterns": [r"(?P<id>\w+)$"], "sanitized": "{id}"}])
+        assert sl.detect_platform(url) == _linear_detect(sl, url)
+
+    def test_optional_prefix_inside_label(self):
+        """Test an optional prefix that may end inside a host label"""
+        sl = SocialLinks(use_predefined_platforms=False)
+        sl.set_platform("p", [{"patterns": [r"https?://(a|b\.)?github\.com/(?P<id>\w+)"], "sanitized": "{id}"}])
+        url = "https://agithub.com/joe"
+        assert sl.is_valid("p", url)
+        assert sl.detect_platform(url) == _linear_detect(sl, url) == "p"
+
+    def test_index_rebuilt_after_changes(self):
+        """Test registry changes are visible to detection"""
+        sl = SocialLinks()
+        assert sl.detect_platform("https://github.com/user") == "github"
+        sl.delete_platform("github")
+        assert sl.detect_platform("https://github.com/user") is None
+        sl.set_platform("github", [{
+            "patterns": [r"https?://github\.com/(?P<id>\w+)/?$"],
+            "sanitized": "https://github.com/{id}",
+        }])
+        assert sl.detect_platform("https://github.com/user") == "github"
+        sl.clear_platforms()
+        assert sl.detect_platform("https://github.com/user") is None
+
+    def test_empty_index(self):
+        """Test an index without platforms"""
+        index = HostIndex([])
+        assert index.detect("https://github.com/user") is None
+        assert index.detect("johndoe") is None
+
+
+def _adaptive_index(platforms, interval=1):
+    """Build an `AdaptiveIndex` over ``{name: [pattern source, ...]}``."""
+    return AdaptiveIndex(
+        ((name, [(re.compile(p), classify_pattern(p)) for p in patterns]) for name, patterns in platforms.items()),
+        interval,
+    )
+
+
+class TestAdaptiveIndex:
+    """Test hit-count driven pattern ordering"""
+
+    def test_reorders_within_platform(self):
+        """Test the most frequently matching pattern of a bucket moves first"""
+        index = _adaptive_index({"shop": [r"https?://shop\.com/a/(?P<id>\w+)$", r"https?://shop\.com/b/(?P<id>\w+)$"]})
+        assert [pos for _, _, pos, _ in index.candidates("https://shop.com/b/x")] == [0, 1]
+        assert index.match("https://shop.com/b/x")[:2] == ("shop", 1)
+        assert [pos for _, _, pos, _ in index.candidates("https://shop.com/b/x")] == [1, 0]
+        assert index.hits == {("shop", 0): 0, ("shop", 1): 1}
+
+    def test_entries_keep_order(self):
+        """Test patterns of different configuration entries of a platform never swap"""
+        patterns = [r"https?://shop\.com/(?P<id>\w+)$", r"https?://shop\.com/\w+/(?P<id>\w+)$"]
+        compiled = [(re.compile(p), classify_pattern(p)) for p in patterns]
+        index = AdaptiveIndex([("shop", compiled)], 1, entries={"shop": [0, 1]})
+        assert index.match("https://shop.com/b/x")[:2] == ("shop", 1)
+        assert [pos for _, _, pos, _ in index.candidates("https://shop.com/b/x")] == [0, 1]
+        index = AdaptiveIndex([("shop", compiled)], 1, entries={"shop": [0, 0]})
+        index.match("https://shop.com/b/x")
+        assert [pos for _, _, pos, _ in index.candidates("https://shop.com/b/x")] == [1, 0]
+
+    def test_parse_results_stable(self):
+        """Test reordering never changes the entry or sanitized URL of a result"""
+        entries = [
+            {"patterns": [r"https?://shop\.com/(?:u/)?(?P<id>\w+)/?$"], "sanitized": "https://shop.com/{id}"},
+            {"patterns": [r"https?://shop\.com/(?P<id>[\w/]+)$"], "sanitized": "https://shop.com/all/{id}"},
+        ]
+        results = []
+        for adaptive in (False, True):
+            sl = SocialLinks(use_predefined_platforms=False, adaptive=adaptive, cache_size=0)
+            sl.set_platform("shop", entries)
+            for _ in range(REORDER_INTERVAL + 1):
+                sl.parse("https://shop.com/a/b/c")
+            results.append(sl.parse("https://shop.com/u/john"))
+        assert results[1] == results[0]
+        assert (results[1].entry, results[1].url) == (0, "https://shop.com/john")
+
+    def test_handle_passes_excluding_catch_all(self):
+        """Test a handle moves ahead of a catch-all that cannot match it"""
+        index = _adaptive_index({"bare": [r"^(?P<id>[\w.-]+)$"], "prefixed": [r"^u/(?P<id>\w+)$"]})
+        assert index.detect("u/johndoe") == "prefixed"
+        assert [name for _, name, _, _ in index.candidates("johndoe")] == ["prefixed", "bare"]
+        assert index.detect("johndoe") == "bare"
+
+    def test_overlapping_catch_alls_keep_order(self):
+        """Test reordering never changes which platform wins an ambiguous input"""
+        index = _adaptive_index({
+            "first": [r"^(?P<id>.+)$"],
+            "second": [r"^u/(?P<id>\w+)$"],
+            "third": [r"^(?P<id>\w+)$"],
+        })
+        for _ in range(3):
+            assert index.detect("u/johndoe") == "first"
+            assert index.detect("johndoe") == "first"
+        assert [name for _, name, _, _ in index.candidates("johndoe")] == ["first", "second", "third"]
+
+    def test_deterministic(self):
+        """Test equal hit counts produce equal orders, ties in registry order"""
+        sl = SocialLinks()
+        a, b = (SocialLinks(adaptive=True)._get_index() for _ in range(2))
+        assert a is not b
+        for index in (a, b):
+            for url in SAMPLE_URLS * 10:
+                index.match(url.strip())
+            index.reorder()
+        assert a._plain == b._plain
+        assert [entry[0] for entry in a._plain] != [entry[0] for entry in sl._get_index()._plain]
+
+    def test_invalid_interval(self):
+        """Test the reorder interval must be positive"""
+        with pytest.raises(ValueError):
+            AdaptiveIndex([], interval=0)
+
+    @pytest.mark.parametrize("url", SAMPLE_URLS)
+    def test_matches_linear_scan(self, url):
+        """Test adaptive detection agrees with a linear scan after reordering"""
+        sl = SocialLinks(adaptive=True)
+        sl.set_platform("loose", [{"patterns": [r"^(?P<id>[^/]+)$"], "sanitized": "{id}"}])
+        index = sl._get_index()
+        index.interval = 1
+        for sample in reversed(SAMPLE_URLS * 3):
+            sl.detect_platform(sample)
+        assert sl.detect_platform(url) == _linear_detect(sl, url)
+        assert sl.detect_platform(url, url_only=True) == _linear_detect_url_only(sl, url)
+
+    def test_registry_changes(self):
+        """Test adaptive mode survives registry changes with fresh counts"""
+        sl = SocialLinks(adaptive=True)
+        sl.detect_platform("https://github.com/johndoe")
+        sl.delete_platform("x")
+        index = sl._get_index()
+        assert isinstance(index, AdaptiveIndex)
+        assert index.hits[("github", 0)] == 0
+        assert isinstance(sl.detector(["github"])._get_index(), AdaptiveIndex)
+        assert not isinstance(SocialLinks()._get_index(), AdaptiveIndex)
+
+
+def _linear_detect_url_only(sl, url):
+    """Reference URL-only detection: linear scan without bare-handle patterns."""
+    u = url.strip()
+    if not u:
+        return None
+    for name, compiled in sl._compiled.items():
+        for (pattern, _, _), (kind, _) in zip(compiled.entries, compiled.kinds):
+            if kind != BARE and pattern.search(u):
+                return name
+    return None
+
+
+class TestUrlOnly:
+    """Test detection without bare-handle patterns"""
+
+    @pytest.mark.parametrize("url", SAMPLE_URLS)
+    def test_matches_linear_scan(self, url):
+        """Test URL-only detection agrees with a linear scan skipping bare handles"""
+        sl = SocialLinks(url_only=True)
+        sl.set_platform("loose", [{"patterns": [r"(?P<id>\w+)$"], "sanitized": "{id}"}])
+        assert sl.detect_platform(url) == _linear_detect_url_only(sl, url)
+
+    def test_bare_handles_skipped(self):
+        """Test usernames are not detected but prefixed handles are"""
+        sl = SocialLinks(url_only=True)
+        assert sl.detect_platform("johndoe") is None
+        assert sl.detect_platform("@johndoe") is None
+        assert sl.detect_platform("u/johndoe") == "reddit"
+        assert sl.detect_platform("spotify:artist:4r7sp4bvfy") == "spotify"
+        assert sl.detect_platform("https://github.com/johndoe") == "github"
+        assert sl.parse("johndoe") is None
+
+    def test_per_call_flag(self):
+        """Test the per-call flag overrides the instance default"""
+        sl = SocialLinks()
+        assert sl.detect_platform("johndoe") is not None
+        assert sl.detect_platform("johndoe", url_only=True) is None
+        assert sl.parse("johndoe", url_only=True) is None
+
+        sl = SocialLinks(url_only=True)
+        assert sl.detect_platform("johndoe", url_only=False) is not None
+
+    def test_batch(self):
+        """Test the batch API honours the mode"""
+        sl = SocialLinks(url_only=True)
+        urls = ["johndoe", "https://x.com/johndoe"]
+        assert sl.detect_many(urls) == [None, "x"]
+        assert [r.error for r in sl.parse_many(urls)] == ["no_match", None]
+        assert sl.detect_many(urls, url_only=False)[0] is not None
+        # A fixed platform still validates bare usernames
+        assert sl.parse_many(urls[:1], "github")[0].url == "https://github.com/johndoe"
+
+    def test_cache_keyed_by_mode(self):
+        """Test cached results of both modes do not mix"""
+        sl = SocialLinks(cache_size=10)
+        default = sl.detect_platform("johndoe")
+        assert default is not None
+        assert sl.detect_platform("johndoe", url_only=True) is None
+        assert sl.detect_platform("johndoe") == default
@@ -0,0 +1,161 @@
+import pytest
+from sociallinks.core import SocialLinks
+from sociallinks.instrument import Instrumentation
+
+
+def test_instrumentation_validates_sample_every():
+    """Test the sample interval is validated on construction"""
+    with pytest.raises(ValueError):
+        Instrumentation(sample_every=-1)
+
+
+def _github(stats):
+    return stats.as_dict()["platforms"]["github"]
+
+
+class TestInstrumentation:
+    """Test per-pattern instrumentation"""
+
+    def test_disabled_by_default(self):
+        """Test instrumentation is opt-in and leaves the shared index alone"""
+        sl = SocialLinks()
+        assert sl.instrumentation is None
+        plain = sl._get_index()
+        stats = sl.enable_instrumentation()
+        assert sl.instrumentation is stats
+        assert sl._get_index() is not plain
+        assert SocialLinks()._get_index() is plain
+        sl.disable_instrumentation()
+        assert sl.instrumentation is None
+        assert sl._get_index() is plain
+
+    def test_counts_evaluations_and_hits(self):
+        """Test evaluations and hits are counted per pattern"""
+        sl = SocialLinks()
+        stats = sl.enable_instrumentation(sample_every=1)
+        assert sl.detect_platform("https://github.com/johndoe") == "github"
+        assert sl.detect_platform("https://github.com/johndoe/repo") is None
+        first = _github(stats)[0]
+        assert first["evaluations"] == 2
+        assert first["hits"] == 1
+        assert first["samples"] == 2
+        assert first["estimated_seconds"] == pytest.approx(first["sampled_seconds"])
+
+    def test_lists_unused_patterns(self):
+        """Test patterns that never ran are reported with zero evaluations"""
+        sl = SocialLinks()
+        stats = sl.enable_instrumentation()
+        sl.detect_platform("https://github.com/johndoe")
+        platforms = stats.as_dict()["platforms"]
+        assert set(platforms) == set(sl.list_platforms())
+        assert all(p["evaluations"] == 0 for p in platforms["linkedin"])
+        assert [p["position"] for p in platforms["github"]] == list(range(len(platforms["github"])))
+
+    def test_sampling(self):
+        """Test only one evaluation out of sample_every is timed"""
+        sl = SocialLinks()
+        stats = sl.enable_instrumentation(sample_every=4)
+        sl.detect_many(["https://github.com/johndoe"] * 10)
+        first = _github(stats)[0]
+        assert first["evaluations"] == 10
+        assert first["samples"] == 3
+        assert first["estimated_seconds"] == pytest.approx(first["sampled_seconds"] / 3 * 10)
+
+    def test_invalid_sample_every(self):
+        """Test the sample interval must be positive"""
+        with pytest.raises(ValueError):
+            SocialLinks().enable_instrumentation(sample_every=0)
+
+    def test_enable_twice_keeps_counters(self):
+        """Test enabling again returns the same counters"""
+        sl = SocialLinks()
+        stats = sl.enable_instrumentation()
+        sl.detect_platform("https://github.com/johndoe")
+        assert sl.enable_instrumentation() is stats
+        assert _github(stats)[0]["hits"] == 1
+
+    def test_detection_paths(self):
+        """Test parse, batches, detectors and link extraction are recorded"""
+        sl = SocialLinks()
+        stats = sl.enable_instrumentation()
+        sl.parse("https://github.com/johndoe")
+        sl.parse_many(["https://github.com/johndoe"])
+        sl.detector(["github"]).detect("https://github.com/johndoe")
+        sl.extract_links("see https://github.com/johndoe")
+        assert _github(stats)[0]["hits"] == 4
+
+    def test_fixed_platform_recorded(self):
+        """Test is_valid(), sanitize() and fixed-platform batches are recorded per pattern"""
+        sl = SocialLinks()
+        stats = sl.enable_instrumentation()
+        sl.detect_platform("https://example.com/johndoe")
+        assert _github(stats)[0]["evaluations"] == 0
+        assert sl.is_valid("github", "https://github.com/johndoe")
+        assert sl.sanitize("github", "https://github.com/johndoe") == "https://github.com/johndoe"
+        assert sl.parse_many(["https://github.com/johndoe", "johndoe"], "github")[0].id == "johndoe"
+        github = _github(stats)
+        assert (github[0]["evaluations"], github[0]["hits"]) == (4, 3)
+        assert github[1]["evaluations"] == 1
+        sl.disable_instrumentation()
+        assert sl.is_valid("github", "https://github.com/johndoe")
+        assert _github(stats)[0]["evaluations"] == 4
+
+    def test_identical_patterns_counted_apart(self):
+        """Test duplicate patterns of a platform keep their own counters and positions"""
+        sl = SocialLinks(use_predefined_platforms=False)
+        pattern = r"^https?://dup\.example/(?P<id>\w+)$"
+        sl.set_platform("dup", [{"patterns": [pattern, r"^(?P<id>\w+)$", pattern], "sanitized": "{id}"}])
+        stats = sl.enable_instrumentation()
+        assert sl.detect_platform("https://dup.example/john") == "dup"
+        platform = stats.as_dict()["platforms"]["dup"]
+        assert [(p["position"], p["hits"]) for p in platform] == [(0, 1), (1, 0), (2, 0)]
+
+    def test_cache_hits_not_recorded(self):
+        """Test cached results evaluate no pattern"""
+        sl = SocialLinks(cache_size=10)
+        stats = sl.enable_instrumentation()
+        sl.detect_platform("https://github.com/johndoe")
+        sl.detect_platform("https://github.com/johndoe")
+        assert _github(stats)[0]["evaluations"] == 1
+
+    def test_survives_registry_changes(self):
+        """Test counters follow registry changes and unchanged patterns keep theirs"""
+        sl = SocialLinks()
+        stats = sl.enable_instrumentation()
+        sl.detect_platform("https://github.com/johndoe")
+        sl.set_platform("example", [{"patterns": [r"https?://example\.com/(?P<id>\w+)/?$"], "sanitized": "https://example.com/{id}"}])
+        assert sl.detect_platform("https://example.com/johndoe") == "example"
+        platforms = stats.as_dict()["platforms"]
+        assert platforms["example"][0]["hits"] == 1
+        assert platforms["github"][0]["hits"] == 1
+        sl.clear_platforms()
+        assert sl.instrumentation is stats
+
+    def test_lazy(self):
+        """Test lazily compiled patterns are instrumented"""
+        sl = SocialLinks(lazy=True)
+        stats = sl.enable_instrumentation()
+        assert sl.detect_platform("https://github.com/johndoe") == "github"
+        assert _github(stats)[0]["hits"] == 1
+
+    def test_reset(self):
+        """Test reset() zeroes every counter"""
+        sl = SocialLinks()
+        stats = sl.enable_instrumentation(sample_every=1)
+        sl.detect_platform("https://github.com/johndoe")
+        stats.reset()
+        assert _github(stats)[0] == dict(_github(stats)[0], evaluations=0, hits=0, samples=0, sampled_seconds=0.0)
+
+    def test_prometheus(self):
+        """Test the Prometheus text exposition output and label escaping"""
+        sl = SocialLinks(use_predefined_platforms=False)
+        sl.set_platform("q", [{"patterns": [r'^"(?P<id>\w+)\\$'], "sanitized": "{id}"}])
+        stats = sl.enable_instrumentation()
+        sl.detect_platform('"johndoe\\')
+        text = stats.to_prometheus()
+        assert text.endswith("\n")
+        lines = text.splitlines()
+        assert "# TYPE sociallinks_pattern_evaluations_total counter" in lines
+        assert "# TYPE sociallinks_pattern_estimated_seconds gauge" in lines
+        assert r'sociallinks_pattern_hits_total{platform="q",position="0",regex="^\"(?P<id>\\w+)\\\\$"} 1' in lines
+        assert sum(1 for line in lines if line.startswith("# HELP")) == 5
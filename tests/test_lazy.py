@@ -0,0 +1,157 @@
+import subprocess
+import sys
+import pytest
+from sociallinks import registry
+from sociallinks.core import SocialLinks
+from sociallinks.exceptions import InvalidPlatformRegexError
+from sociallinks.registry import LazyPattern
+from tests.helpers import SAMPLE_URLS
+
+# Budgets leave headroom for slow machines: they catch accidental eager work
+# at import or first call (compiling every pattern takes tens of
+# milliseconds). Heavy optional imports are caught by OPTIONAL_MODULES.
+IMPORT_BUDGET = 0.1
+FIRST_CALL_BUDGET = 0.1
+
+OPTIONAL_MODULES = ("html.parser", "multiprocessing", "json", "zlib", "pprint", "urllib.parse", "sociallinks.normalize")
+"""Standard library modules only opt-in features may import."""
+
+
+def _compiled_count(sl):
+    """Number of patterns of an instance that have been compiled."""
+    return sum(
+        not isinstance(pattern, LazyPattern) or pattern.compiled
+        for compiled in sl._compiled.values()
+        for pattern in compiled.patterns()
+    )
+
+
+def _touched(sl):
+    """Names of the platforms that compiled any regex."""
+    return {
+        name
+        for name, compiled in sl._compiled.items()
+        if compiled._matcher is not None
+        or any(not isinstance(p, LazyPattern) or p.compiled for p in compiled.patterns())
+    }
+
+
+def _run(code):
+    """Run code in a fresh interpreter and return its stdout."""
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    return result.stdout.strip()
+
+
+@pytest.fixture
+def cold_registry():
+    """Start from an empty process-wide registry."""
+    registry.clear_cache()
+    yield
+    registry.clear_cache()
+
+
+class TestLazyImport:
+    """Test importing the package stays cheap"""
+
+    def test_platforms_not_imported(self):
+        """Test predefined platforms are only loaded by the constructor"""
+        out = _run(
+            "import sys, sociallinks\n"
+            "print('sociallinks.platforms' in sys.modules)\n"
+            "sociallinks.SocialLinks(use_predefined_platforms=False)\n"
+            "print('sociallinks.platforms' in sys.modules)\n"
+            "sociallinks.SocialLinks()\n"
+            "print('sociallinks.platforms' in sys.modules)"
+        )
+        assert out.split() == ["False", "False", "True"]
+
+    def test_optional_modules_not_imported(self):
+        """Test importing the package does not load modules of opt-in features"""
+        out = _run(
+            "import sys, sociallinks\n"
+            f"print(' '.join(m for m in {OPTIONAL_MODULES!r} if m in sys.modules))"
+        )
+        assert out == ""
+
+    def test_import_budget(self):
+        """Test importing the package stays within budget"""
+        out = _run(
+            "import time\n"
+            "start = time.perf_counter()\n"
+            "import sociallinks\n"
+            "print(time.perf_counter() - start)"
+        )
+        assert float(out) < IMPORT_BUDGET
+
+    def test_first_call_budget(self):
+        """Test a lazy instance answers its first call within budget"""
+        out = _run(
+            "import time\n"
+            "start = time.perf_counter()\n"
+            "from sociallinks import SocialLinks\n"
+            "sl = SocialLinks(lazy=True)\n"
+            "assert sl.is_valid('github', 'https://github.com/octocat')\n"
+            "print(time.perf_counter() - start)"
+        )
+        assert float(out) < IMPORT_BUDGET + FIRST_CALL_BUDGET
+
+
+class TestLazyCompilation:
+    """Test lazy per-platform compilation"""
+
+    def test_nothing_compiled_up_front(self, cold_registry):
+        """Test construction compiles no pattern"""
+        sl = SocialLinks(lazy=True)
+        assert _compiled_count(sl) == 0
+
+    def test_is_valid_compiles_one_platform(self, cold_registry):
+        """Test validation compiles only the requested platform"""
+        sl = SocialLinks(lazy=True)
+        assert sl.is_valid("github", "https://github.com/octocat")
+        assert sl.sanitize("github", "octocat") == "https://github.com/octocat"
+        assert _touched(sl) == {"github"}
+
+    def test_detect_compiles_one_bucket(self, cold_registry):
+        """Test detection only compiles the patterns evaluated for the host"""
+        sl = SocialLinks(lazy=True)
+        assert sl.detect_platform("https://github.com/octocat") == "github"
+        total = sum(len(compiled.entries) for compiled in sl._compiled.values())
+        assert 0 < _compiled_count(sl) < total // 4
+
+    def test_same_results_as_eager(self, cold_registry):
+        """Test lazy and eager instances agree"""
+        lazy = SocialLinks(lazy=True)
+        eager = SocialLinks()
+        for url in SAMPLE_URLS:
+            assert lazy.detect_platform(url) == eager.detect_platform(url), url
+            assert lazy.parse(url) == eager.parse(url), url
+
+    def test_reuses_eager_platforms(self, cold_registry):
+        """Test a lazy instance reuses already compiled platforms"""
+        eager = SocialLinks()
+        lazy = SocialLinks(lazy=True)
+        assert lazy._compiled["github"] is eager._compiled["github"]
+
+    def test_custom_platforms_compiled_eagerly(self):
+        """Test set_platform still reports invalid patterns immediately"""
+        sl = SocialLinks(lazy=True)
+        with pytest.raises(InvalidPlatformRegexError):
+            sl.set_platform("bad", [{"patterns": ["(unclosed"], "sanitized": "{id}"}])
+
+
+class TestLazyPattern:
+    """Test the lazily compiled pattern wrapper"""
+
+    def test_compiles_on_first_use(self):
+        """Test the pattern is compiled by its first search"""
+        pattern = LazyPattern(r"^(?P<id>\w+)$", 0, "example")
+        assert not pattern.compiled
+        assert pattern.search("abc").group("id") == "abc"
+        assert pattern.compiled
+        assert pattern.groupindex == {"id": 1}
+
+    def test_invalid_pattern(self):
+        """Test an invalid pattern raises on first use"""
+        pattern = LazyPattern("(unclosed", 0, "example")
+        with pytest.raises(InvalidPlatformRegexError, match="example"):
+            pattern.match("abc")
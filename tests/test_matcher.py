@@ -0,0 +1,144 @@
+import re
+import pytest
+from sociallinks.core import SocialLinks
+from sociallinks.matcher import PlatformMatcher, _prefix_tokens, _strip_group_names
+from tests.helpers import SAMPLE_URLS, mutations
+
+
+def _matcher(*sources, flags=re.IGNORECASE):
+    return PlatformMatcher([re.compile(source, flags) for source in sources], flags)
+
+
+class TestPlatformMatcher:
+    """Test the combined per-platform matcher"""
+
+    def test_all_predefined_platforms_combined(self):
+        """Test every predefined platform gets a combined regex"""
+        sl = SocialLinks()
+        assert all(compiled.matcher.combined for compiled in sl._compiled.values())
+
+    @pytest.mark.parametrize("url", SAMPLE_URLS)
+    def test_matches_reference_loop(self, url):
+        """Test results equal trying each pattern in order"""
+        sl = SocialLinks()
+        for compiled in sl._compiled.values():
+            matcher = compiled.matcher
+            assert matcher.match(url) == matcher._match_linear(url)
+            assert matcher.is_valid(url) == any(p.search(url) for p in compiled.patterns())
+
+    def test_matches_reference_loop_generated(self):
+        """Test results on generated inputs equal trying each pattern in order"""
+        sl = SocialLinks()
+        for url in mutations(SAMPLE_URLS, 300):
+            for name, compiled in sl._compiled.items():
+                matcher = compiled.matcher
+                assert matcher.match(url) == matcher._match_linear(url), (name, url)
+
+    def test_first_pattern_wins_over_leftmost(self):
+        """Test an earlier pattern matching further right takes priority"""
+        matcher = _matcher(r"b(?P<id>\d+)", r"a(?P<id>\d+)")
+        assert matcher.match("a1 b2") == (0, "2")
+        assert matcher.match("a1") == (1, "1")
+
+    def test_anchored_pattern_priority(self):
+        """Test an anchored pattern keeps its position in the order"""
+        matcher = _matcher(r"https?://x\.com/(?P<id>\w+)", r"^(?P<id>.+)$", r"https?://(?P<id>.+)")
+        assert matcher.match("https://x.com/john") == (0, "john")
+        assert matcher.match("https://y.com/john") == (1, "https://y.com/john")
+        assert matcher.match("a\nhttps://y.com") == (2, "y.com")
+
+    def test_id_group_resolution(self):
+        """Test the id group and the first non-empty group fallback"""
+        matcher = _matcher(r"^(a)?-(?P<id>\w*)$", r"^(x)?:(y)?(z)$")
+        assert matcher.match("a-john") == (0, "john")
+        assert matcher.match("a-") == (0, "a")
+        assert matcher.match(":z") == (1, "z")
+        assert matcher.match("x:z") == (1, "x")
+
+    def test_shared_prefix(self):
+        """Test only unambiguous literal prefixes are shared"""
+        assert "".join(c for c, _ in _prefix_tokens("https?://(www", 0)) == "https://"
+        assert _prefix_tokens("a?a", 0) == []
+        assert _prefix_tokens("A?a", re.IGNORECASE) == []
+        assert [c for c, _ in _prefix_tokens("A?a", 0)] == ["A", "a"]
+        assert [c for c, _ in _prefix_tokens("ab*", 0)] == ["a"]
+        assert _prefix_tokens(r"https://a\.com/(\w+)|zzz(\w+)", 0) == []
+        assert _prefix_tokens(r"https://a\.com/(\w+|zzz)", 0)
+
+    def test_shared_prefix_with_top_level_alternation(self):
+        """Test a prefix is not shared with a pattern that is an alternation"""
+        sources = [r"https://a\.com/(\w+)|zzz(\w+)", r"https://b\.com/(\w+)"]
+        matcher = _matcher(*sources)
+        assert matcher.combined
+        for url in ["zzzfoo", "zzz1 https://b.com/x", "https://a.com/x", "https://b.com/x zzz1"]:
+            assert matcher.match(url) == matcher._match_linear(url), url
+        assert matcher.match("zzz1 https://b.com/x") == (0, "1")
+
+        sl = SocialLinks(use_predefined_platforms=False)
+        sl.set_platform("alt", [{"patterns": sources, "sanitized": "https://z/{id}"}])
+        assert sl.detect_platform("zzzfoo") == "alt"
+        assert sl.is_valid("alt", "zzzfoo")
+        assert sl.sanitize("alt", "zzzfoo") == "https://z/foo"
+
+    def test_strip_group_names(self):
+        """Test named groups become plain groups"""
+        assert _strip_group_names(r"(?P<x>a)(?:b)(?P<id>c)") == ("(a)(?:b)(c)", 2, 2)
+        assert _strip_group_names(r"[(?P<id>]") == ("[(?P<id>]", 0, 0)
+
+    @pytest.mark.parametrize(
+        "source",
+        [r"(?P<id>a)(?P=id)", r"(a)\1", r"(a)?(?(1)b|c)", r"(?i)abc", r"a(?#comment)"],
+    )
+    def test_unsupported_syntax_uses_reference_loop(self, source):
+        """Test patterns that cannot be combined fall back to the loop"""
+        matcher = _matcher(r"^x$", source)
+        assert not matcher.combined
+        assert matcher.match("x") == (0, None)
+
+    def test_verbose_uses_reference_loop(self):
+        """Test re.VERBOSE patterns fall back to the loop"""
+        matcher = _matcher(r"^ (?P<id> \w+ ) $  # handle", flags=re.VERBOSE)
+        assert not matcher.combined
+        assert matcher.match("john") == (0, "john")
+
+    def test_sanitize_with_custom_platform(self):
+        """Test sanitize uses the combined matcher for custom platforms"""
+        sl = SocialLinks(use_predefined_platforms=False)
+        sl.set_platform("example", [
+            {"patterns": [r"https?://example\.com/u/(?P<id>\w+)"], "sanitized": "https://example.com/u/{id}"},
+            {"patterns": [r"https?://example\.com/(\w+)"], "sanitized": "https://example.com/{id}"},
+        ])
+        assert sl._compiled["example"].matcher.combined
+        assert sl.sanitize("example", "http://example.com/u/john") == "https://example.com/u/john"
+        assert sl.sanitize("example", "http://example.com/john") == "https://example.com/john"
+        assert sl.parse_many(["http://example.com/john"], "example")[0].entry == 1
+
+    def test_state_round_trip(self):
+        """Test a matcher rebuilt from its state gives the same results"""
+        sl = SocialLinks()
+        for compiled in sl._compiled.values():
+            matcher = compiled.matcher
+            rebuilt = PlatformMatcher.from_state(list(compiled.patterns()), sl.regex_flags, matcher.state())
+            for url in SAMPLE_URLS:
+                assert rebuilt.match(url) == matcher.match(url)
+        assert PlatformMatcher.from_state([re.compile("x")], 0, None).match("x") == (0, None)
+
+    def test_locate_returns_pattern_match(self):
+        """Test locate() returns the match of the winning pattern itself"""
+        matcher = _matcher(r"https?://a\.com/(?P<id>\w+)$", r"https?://b\.com/(\w+)/(?P<id>\w+)")
+        pos, m = matcher.locate("see https://b.com/x/john")
+        assert pos == 1
+        assert m.group("id") == "john" and m.start() == 4
+        assert matcher.locate("nothing") is None
+
+    def test_locate_matches_reference_loop(self):
+        """Test locate() finds the pattern and span the loop finds"""
+        sl = SocialLinks()
+
+        def spans(found):
+            return found and (found[0], found[1].span(), found[1].groupdict())
+
+        for url in SAMPLE_URLS + mutations(SAMPLE_URLS, 200):
+            for name, compiled in sl._compiled.items():
+                matcher = compiled.matcher
+                assert spans(matcher.locate(url)) == spans(matcher._locate_linear(url)), (name, url)
@@ -0,0 +1,120 @@
+import pickle
+import pytest
+from sociallinks.core import SocialLinks
+from sociallinks.normalize import Normalizer
+from tests.helpers import SAMPLE_URLS
+
+MESSY_URLS = [
+    ("https://m.facebook.com/johndoe?ref=share", "facebook", "https://facebook.com/johndoe"),
+    ("https://www.instagram.com/johndoe/?igshid=abc123", "instagram", "https://instagram.com/johndoe"),
+    ("https://x.com/johndoe?s=20&t=xyz", "x", "https://x.com/johndoe"),
+    ("https://github.com/johndoe#readme", "github", "https://github.com/johndoe"),
+    ("HTTPS://WWW.LinkedIn.COM/in/johndoe?utm_source=share&utm_medium=member", "linkedin", "https://linkedin.com/in/johndoe"),
+    ("https://news.ycombinator.com/user?id=pg&utm_source=x", "hackernews", "https://news.ycombinator.com/user?id=pg"),
+]
+
+
+class TestNormalizer:
+    """Test the Normalizer stage on its own"""
+
+    @pytest.mark.parametrize(
+        "url, expected",
+        [
+            ("  HTTPS://M.Facebook.COM/JohnDoe  ", "https://facebook.com/JohnDoe"),
+            ("https://www.m.facebook.com/johndoe", "https://facebook.com/johndoe"),
+            ("https://mobile.twitter.com/johndoe", "https://twitter.com/johndoe"),
+            ("https://m.me/johndoe", "https://m.me/johndoe"),
+            ("https://x.com/johndoe?utm_source=a&id=1&fbclid=b&", "https://x.com/johndoe?id=1"),
+            ("https://x.com/johndoe?utm_source=a", "https://x.com/johndoe"),
+            ("https://x.com/johndoe#top", "https://x.com/johndoe"),
+            ("https://app.example/#/user/johndoe", "https://app.example/#/user/johndoe"),
+            ("https://web.telegram.org/k/#-2128475717", "https://web.telegram.org/k/#-2128475717"),
+            ("https://user@WWW.Example.com:8080/path", "https://user@example.com:8080/path"),
+            ("@johndoe", "@johndoe"),
+            ("m.facebook.com/johndoe?ref=share", "m.facebook.com/johndoe?ref=share"),
+            ("http://[::1", "http://[::1"),
+            ("https://m.bandcamp.com/?from=x", "https://m.bandcamp.com/?from=x"),
+            ("https://JohnDoe.Substack.com:443/#top", "https://JohnDoe.Substack.com:443/"),
+        ],
+    )
+    def test_normalize(self, url, expected):
+        """Test scheme, host, subdomain, query and fragment handling"""
+        assert Normalizer()(url) == expected
+
+    def test_configuration(self):
+        """Test custom tables and parameters"""
+        normalize = Normalizer(subdomains={"de": "", "mobile": "www"}, drop_params=["src"], drop_fragment=False)
+        assert normalize("https://de.linkedin.com/in/x?src=a&utm_source=b#c") == "https://linkedin.com/in/x?utm_source=b#c"
+        assert normalize("https://mobile.example.com/x") == "https://www.example.com/x"
+        assert Normalizer(id_hosts=())("https://M.Bandcamp.com") == "https://bandcamp.com"
+        assert Normalizer(id_hosts=["example.com"])("https://M.Example.com/x") == "https://M.Example.com/x"
+
+    def test_round_trip(self):
+        """Test the configuration survives as_dict() and pickling"""
+        normalize = Normalizer(subdomains={"de": ""}, drop_params=["a*"], route_hosts=["app.example"], id_hosts=["a.io"])
+        assert Normalizer(**normalize.as_dict()) == normalize
+        assert pickle.loads(pickle.dumps(normalize)) == normalize
+        assert normalize != Normalizer()
+
+
+class TestNormalizedMatching:
+    """Test SocialLinks(normalize=...)"""
+
+    @pytest.mark.parametrize("url, platform, sanitized", MESSY_URLS)
+    def test_messy_urls(self, url, platform, sanitized):
+        """Test real-world links match once normalized"""
+        sl = SocialLinks(normalize=True)
+        assert sl.detect_platform(url) == platform
+        assert sl.is_valid(platform, url)
+        assert sl.sanitize(platform, url) == sanitized
+        assert sl.parse(url).url == sanitized
+        assert sl.parse_many([url], platform)[0].url == sanitized
+        assert sl.detector([platform]).detect(url) == platform
+        assert SocialLinks().detect_platform(url) in (None, platform)
+
+    def test_disabled_by_default(self):
+        """Test inputs are only stripped by default"""
+        sl = SocialLinks()
+        assert sl.normalizer is None
+        assert sl.detect_platform("https://github.com/johndoe?utm_source=x") is None
+        assert SocialLinks(normalize=True).normalizer == Normalizer()
+
+    @pytest.mark.parametrize("url", SAMPLE_URLS)
+    def test_canonical_urls_unchanged(self, url):
+        """Test results for URLs that already match are unchanged, up to the matching pattern"""
+        [normalized], [plain] = SocialLinks(normalize=True).parse_many([url]), SocialLinks().parse_many([url])
+        if plain.error is None:
+            assert (normalized.platform, normalized.id, normalized.url) == (plain.platform, plain.id, plain.url)
+
+    @pytest.mark.parametrize(
+        "url, platform, sanitized",
+        [
+            ("https://touch.bandcamp.com", "bandcamp", "https://touch.bandcamp.com"),
+            ("https://JohnDoe.substack.com/", "substack", "https://substack.com/@JohnDoe"),
+            ("https://m.tumblr.com", "tumblr", "https://tumblr.com/m"),
+        ],
+    )
+    def test_identifier_subdomains_kept(self, url, platform, sanitized):
+        """Test subdomains that are identifiers are neither dropped nor lowercased"""
+        plain = SocialLinks().parse(url)
+        assert SocialLinks(normalize=True).parse(url) == plain
+        assert (plain.platform, plain.url) == (platform, sanitized)
+
+    def test_extract_links(self):
+        """Test links found in text are normalized before matching"""
+        sl = SocialLinks(normalize=True)
+        links = sl.extract_links("see https://m.facebook.com/johndoe?ref=share now")
+        assert [link.url for link in links] == ["https://facebook.com/johndoe"]
+
+    def test_snapshot_keeps_normalizer(self):
+        """Test the normalizer is restored with the registry"""
+        normalize = Normalizer(drop_params=["src"])
+        restored = SocialLinks.from_snapshot(SocialLinks(normalize=normalize).snapshot())
+        assert restored.normalizer == normalize
+        assert SocialLinks.from_snapshot(SocialLinks().snapshot()).normalizer is None
+
+    def test_map_parallel(self):
+        """Test worker processes normalize inputs too"""
+        sl = SocialLinks(normalize=True)
+        rows = sl.map_parallel([url for url, _, _ in MESSY_URLS], workers=2, chunk_size=2)
+        assert [url for _, _, url, _ in rows] == [sanitized for _, _, sanitized in MESSY_URLS]
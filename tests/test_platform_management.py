@@ -162,6 +162,49 @@ class TestSetPlatforms:
         sl.set_platforms(platforms, override=True)
         assert sl.detect_platform("https://example.com/johndoe") == "linkedin"
 
+    def _pack(self, size):
+        return {
+            f"tenant{i}": [{
+                "patterns": [f"https?://tenant{i}\\.example/(?P<id>\\w+)/?$"],
+                "sanitized": f"https://tenant{i}.example/{{id}}",
+            }]
+            for i in range(size)
+        }
+
+    def test_set_platforms_single_change(self):
+        """Test a batch is installed with a single registry change"""
+        sl = SocialLinks()
+        generation = sl._generation
+        sl.set_platforms(self._pack(100))
+        assert sl._generation == generation + 1
+        assert sl.detect_platform("https://tenant42.example/johndoe") == "tenant42"
+
+    def test_set_platforms_atomic(self):
+        """Test an invalid definition leaves the registry unchanged"""
+        sl = SocialLinks()
+        before = sl.list_platforms()
+        generation = sl._generation
+        pack = self._pack(40)
+        pack["tenant39"][0]["patterns"] = ["https?://tenant39\\.example/(?P<id>[a-z"]
+        with pytest.raises(InvalidPlatformRegexError, match="tenant39") as e:
+            sl.set_platforms(pack)
+        assert list(e.value.errors) == ["tenant39"]
+        assert sl.list_platforms() == before
+        assert sl._generation == generation
+
+    def test_set_platforms_reports_all_failures(self):
+        """Test every invalid definition of a batch is reported together"""
+        sl = SocialLinks(use_predefined_platforms=False)
+        pack = self._pack(5)
+        pack["tenant1"][0]["patterns"] = ["(?P<id>"]
+        pack["tenant3"] = [{"patterns": ["x"]}]
+        with pytest.raises(InvalidPlatformError, match="2 invalid platforms") as e:
+            sl.set_platforms(pack)
+        assert not isinstance(e.value, InvalidPlatformRegexError)
+        assert isinstance(e.value.errors["tenant1"], InvalidPlatformRegexError)
+        assert type(e.value.errors["tenant3"]) is InvalidPlatformError
+        assert sl.list_platforms() == []
+
 
 class TestDeletePlatforms:
     """Test delete_platforms method"""
@@ -175,6 +218,17 @@ class TestDeletePlatforms:
         assert "linkedin" not in sl.platforms
         assert "facebook" not in sl.platforms
 
+    def test_delete_platforms_atomic(self):
+        """Test bulk deletion is a single registry change, or none"""
+        sl = SocialLinks()
+        generation = sl._generation
+        with pytest.raises(PlatformNotFoundError):
+            sl.delete_platforms(["linkedin", "unknown"])
+        assert "linkedin" in sl.platforms
+        sl.delete_platforms(["linkedin", "github", "linkedin"])
+        assert sl._generation == generation + 1
+        assert sl.detect_platform("https://github.com/johndoe") is None
+
     def test_delete_platforms_missing(self):
         """Test bulk deleting with missing platforms"""
         sl = SocialLinks()
@@ -194,6 +248,37 @@ class TestClearPlatforms:
         assert len(sl._compiled) == 0
 
 
+class TestPlatformsAttribute:
+    """Test the platforms attribute"""
+
+    def test_read_only_view(self):
+        """Test the registry cannot be changed through the mapping"""
+        sl = SocialLinks()
+        other = SocialLinks()
+        with pytest.raises(TypeError):
+            sl.platforms["github"] = []
+        with pytest.raises(TypeError):
+            del sl.platforms["github"]
+        assert sl.detect_platform("https://github.com/johndoe") == "github"
+        assert other.platforms == sl.platforms
+
+    def test_assignment_replaces_registry(self):
+        """Test assigning a dictionary installs exactly those platforms"""
+        sl = SocialLinks()
+        sl.platforms = {"example": [{"patterns": [r"https?://example\.com/(?P<id>\w+)"], "sanitized": "https://example.com/{id}"}]}
+        assert sl.list_platforms() == ["example"]
+        assert sl.detect_platform("https://example.com/john") == "example"
+        assert sl.detect_platform("https://github.com/johndoe") is None
+
+    def test_invalid_assignment_keeps_registry(self):
+        """Test an invalid dictionary leaves the registry unchanged"""
+        sl = SocialLinks()
+        before = sl.list_platforms()
+        with pytest.raises(InvalidPlatformRegexError):
+            sl.platforms = {"bad": [{"patterns": ["(unclosed"], "sanitized": "{id}"}]}
+        assert sl.list_platforms() == before
+
+
 class TestGetPlatform:
     """Test get_platform method"""
 
@@ -0,0 +1,79 @@
+import pytest
+from sociallinks import registry
+from sociallinks.core import SocialLinks
+from sociallinks.exceptions import InvalidPlatformRegexError
+
+
+CUSTOM = [{"patterns": [r"https?://example\.com/(?P<id>[^/]+)/?$"], "sanitized": "https://example.com/{id}"}]
+
+
+class TestSharedRegistry:
+    """Test compiled platforms are shared between instances"""
+
+    def test_instances_share_compiled_patterns(self):
+        """Test two default instances reference the same compiled objects"""
+        a = SocialLinks()
+        b = SocialLinks()
+        assert a._compiled["linkedin"] is b._compiled["linkedin"]
+        assert a._get_index() is b._get_index()
+
+    def test_different_flags_not_shared(self):
+        """Test instances with different regex flags compile separately"""
+        a = SocialLinks()
+        b = SocialLinks(regex_flags=0)
+        assert a._compiled["github"] is not b._compiled["github"]
+        assert b.detect_platform("https://github.com/Octocat") == "github"
+        assert b.detect_platform("https://GITHUB.com/Octocat") is None
+
+    def test_custom_platform_shared(self):
+        """Test identical custom definitions compile once"""
+        a = SocialLinks(use_predefined_platforms=False)
+        b = SocialLinks(use_predefined_platforms=False)
+        a.set_platform("example", CUSTOM)
+        b.set_platform("other", [dict(CUSTOM[0])])
+        assert a._compiled["example"] is b._compiled["other"]
+        assert b.sanitize("other", "https://example.com/jane") == "https://example.com/jane"
+
+    def test_mutation_does_not_leak(self):
+        """Test changing one instance leaves the others untouched"""
+        a = SocialLinks()
+        b = SocialLinks()
+        a.set_platform("github", CUSTOM, override=True)
+        assert a.detect_platform("https://github.com/octocat") is None
+        assert b.detect_platform("https://github.com/octocat") == "github"
+
+    def test_unhashable_definition(self):
+        """Test definitions with unhashable values are compiled without caching"""
+        size = registry.cache_size()
+        sl = SocialLinks(use_predefined_platforms=False)
+        sl.set_platform("example", [{"patterns": CUSTOM[0]["patterns"], "sanitized": "https://example.com/{id}", "meta": {}}])
+        assert sl.is_valid("example", "https://example.com/jane")
+        unhashable = [{"patterns": [[r"x"]], "sanitized": "{id}"}]
+        assert registry._freeze(unhashable) is None
+        assert registry.cache_size() >= size
+
+    def test_invalid_regex_not_cached(self):
+        """Test invalid definitions raise every time"""
+        sl = SocialLinks(use_predefined_platforms=False)
+        bad = [{"patterns": ["(unclosed"], "sanitized": "{id}"}]
+        for _ in range(2):
+            with pytest.raises(InvalidPlatformRegexError):
+                sl.set_platform("bad", bad, override=True)
+
+    def test_clear_cache(self):
+        """Test clearing the cache keeps existing instances working"""
+        sl = SocialLinks()
+        registry.clear_cache()
+        assert registry.cache_size() == 0
+        assert sl.detect_platform("https://github.com/octocat") == "github"
+        assert SocialLinks()._compiled["github"] is not sl._compiled["github"]
+
+    def test_cache_bounded(self, monkeypatch):
+        """Test the cache never grows past its limit"""
+        monkeypatch.setattr(registry, "MAX_CACHED_PLATFORMS", 3)
+        registry.clear_cache()
+        sl = SocialLinks(use_predefined_platforms=False)
+        for i in range(10):
+            sl.set_platform(f"p{i}", [{"patterns": [rf"^p{i}-(?P<id>\w+)$"], "sanitized": "{id}"}])
+        assert registry.cache_size() == 3
+        registry.clear_cache()
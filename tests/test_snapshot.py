@@ -0,0 +1,123 @@
+import json
+import pickle
+import re
+import zlib
+import pytest
+from sociallinks.backend import REFERENCE, LinearIndex
+from sociallinks.core import SocialLinks
+from sociallinks.registry import LazyPattern, clear_cache
+from sociallinks.snapshot import MAGIC, SNAPSHOT_VERSION, loads
+from tests.helpers import SAMPLE_URLS
+
+CUSTOM = [{"patterns": [r"https?://example\.com/(?P<id>\w+)/?$"], "sanitized": "https://example.com/{id}"}]
+
+
+def _rewrite(blob, **changes):
+    """Return `blob` with fields of its JSON payload replaced."""
+    payload = json.loads(zlib.decompress(blob[len(MAGIC) + 1:]))
+    payload.update(changes)
+    return blob[:len(MAGIC) + 1] + zlib.compress(json.dumps(payload).encode())
+
+
+class TestSnapshot:
+    """Test snapshot() and from_snapshot()"""
+
+    def test_round_trip(self):
+        """Test a restored instance has the same registry and options"""
+        sl = SocialLinks(regex_flags=re.IGNORECASE | re.MULTILINE, url_only=True)
+        sl.set_platform("example", CUSTOM)
+        restored = SocialLinks.from_snapshot(sl.snapshot())
+        assert restored.platforms == sl.platforms
+        assert restored.list_platforms() == sl.list_platforms()
+        assert restored.regex_flags == sl.regex_flags
+        assert restored.url_only is True
+        assert restored.sanitize("example", "https://EXAMPLE.com/johndoe") == "https://example.com/johndoe"
+
+    @pytest.mark.parametrize("url", SAMPLE_URLS)
+    def test_same_results(self, url):
+        """Test a restored instance detects and parses like the original"""
+        sl = SocialLinks()
+        restored = SocialLinks.from_snapshot(sl.snapshot())
+        assert restored.parse(url) == sl.parse(url)
+        assert restored.detect_platform(url, url_only=True) == sl.detect_platform(url, url_only=True)
+
+    def test_lazy_restore(self):
+        """Test restored patterns compile on first use and keep their classification"""
+        sl = SocialLinks(use_predefined_platforms=False)
+        sl.set_platform("example", [{"patterns": [r"https?://restore\.example/(?P<id>\w+)$"], "sanitized": "{id}"}])
+        blob = sl.snapshot()
+        clear_cache()  # As in a fresh worker process
+        restored = SocialLinks.from_snapshot(blob)
+        compiled = restored._compiled["example"]
+        pattern = compiled.entries[0][0]
+        assert isinstance(pattern, LazyPattern) and not pattern.compiled
+        assert compiled._kinds == sl._compiled["example"].kinds
+        assert restored.detect_platform("https://restore.example/johndoe") == "example"
+        assert pattern.compiled
+
+    def test_restore_keeps_shared_platforms(self):
+        """Test a stored classification is not written into the process-wide cache"""
+        sl = SocialLinks(use_predefined_platforms=False)
+        sl.set_platform("example", [{"patterns": [r"https?://shared\.example/(?P<id>\w+)$"], "sanitized": "{id}"}])
+        blob = sl.snapshot()
+        altered = _rewrite(blob, platforms=[["example", sl.platforms["example"], [["other", []]]]])
+        clear_cache()
+        restored = SocialLinks.from_snapshot(altered)
+        other = SocialLinks.from_snapshot(blob)
+        assert restored._compiled["example"].kinds == (("other", ()),)
+        assert other._compiled["example"].kinds == sl._compiled["example"].kinds
+        assert other.detect_platform("https://shared.example/johndoe") == "example"
+
+    def test_other_python_compiles_eagerly(self):
+        """Test the stored classification is only trusted by the same Python version"""
+        sl = SocialLinks(use_predefined_platforms=False)
+        sl.set_platform("example", [{"patterns": [r"https?://eager\.example/(?P<id>\w+)$"], "sanitized": "{id}"}])
+        blob = _rewrite(sl.snapshot(), python=[2, 7])
+        assert loads(blob).kinds is None
+        restored = SocialLinks.from_snapshot(blob)
+        assert not isinstance(restored._compiled["example"].entries[0][0], LazyPattern)
+        assert restored.detect_platform("https://eager.example/johndoe") == "example"
+
+    def test_options(self):
+        """Test instance options that are not part of the snapshot"""
+        restored = SocialLinks.from_snapshot(SocialLinks().snapshot(), cache_size=10, adaptive=True)
+        restored.detect_platform("https://github.com/johndoe")
+        assert restored.cache_info().currsize == 1
+        assert restored._registry.adaptive
+
+    def test_backend(self):
+        """Test the backend option is forwarded to the restored registry"""
+        restored = SocialLinks.from_snapshot(SocialLinks().snapshot(), backend=REFERENCE)
+        assert restored.backend is REFERENCE
+        assert isinstance(restored._get_index(), LinearIndex)
+        assert restored.detect_platform("https://github.com/johndoe") == "github"
+
+    def test_registry_changes_after_restore(self):
+        """Test a restored instance is an ordinary instance"""
+        restored = SocialLinks.from_snapshot(SocialLinks().snapshot())
+        restored.set_platform("example", CUSTOM)
+        restored.delete_platform("github")
+        assert restored.detect_platform("https://example.com/johndoe") == "example"
+        assert restored.detect_platform("https://github.com/johndoe") is None
+
+    def test_compact_and_picklable(self):
+        """Test the blob is small bytes that survive pickling"""
+        blob = SocialLinks().snapshot()
+        assert isinstance(blob, bytes)
+        assert blob.startswith(MAGIC) and blob[len(MAGIC)] == SNAPSHOT_VERSION
+        assert len(blob) < 8192
+        assert pickle.loads(pickle.dumps(blob)) == blob
+
+    def test_invalid_blobs(self):
+        """Test foreign, corrupt and unsupported blobs are rejected"""
+        blob = SocialLinks().snapshot()
+        with pytest.raises(TypeError):
+            SocialLinks.from_snapshot("SLSNAP")
+        with pytest.raises(ValueError, match="not a sociallinks snapshot"):
+            SocialLinks.from_snapshot(b"{}")
+        with pytest.raises(ValueError, match="unsupported snapshot version"):
+            SocialLinks.from_snapshot(MAGIC + bytes((SNAPSHOT_VERSION + 1,)) + blob[len(MAGIC) + 1:])
+        with pytest.raises(ValueError, match="corrupt"):
+            SocialLinks.from_snapshot(blob[:-10])
+        with pytest.raises(ValueError, match="corrupt"):
+            SocialLinks.from_snapshot(_rewrite(blob, platforms=None))